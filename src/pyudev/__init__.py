@@ -29,26 +29,124 @@
 :mod:`pyudev.glib` and :mod:`pyudev.wx` device monitoring can be integrated
 into the event loop of various GUI toolkits.
 
+Submodules are imported on first access of one of their attributes, so that
+``import pyudev`` itself stays cheap.
+
 .. moduleauthor::  Sebastian Wiesner  <lunaryorn@gmail.com>
 """
 
-from pyudev._errors import (
-    DeviceNotFoundAtPathError,
-    DeviceNotFoundByFileError,
-    DeviceNotFoundByNameError,
-    DeviceNotFoundByNumberError,
-    DeviceNotFoundError,
-    DeviceNotFoundInEnvironmentError,
-)
-from pyudev._util import udev_version
-from pyudev.core import Context, Enumerator
-from pyudev.device import Attributes, Device, Devices, Tags
-from pyudev.discover import (
-    DeviceFileHypothesis,
-    DeviceNameHypothesis,
-    DeviceNumberHypothesis,
-    DevicePathHypothesis,
-    Discovery,
-)
-from pyudev.monitor import Monitor, MonitorObserver
+import importlib
+
 from pyudev.version import __version__, __version_info__
+
+# maps each public attribute to the module defining it
+_ATTRIBUTES = {
+    "DeviceNotFoundAtPathError": "pyudev._errors",
+    "DeviceNotFoundByFileError": "pyudev._errors",
+    "DeviceNotFoundByNameError": "pyudev._errors",
+    "DeviceNotFoundByNumberError": "pyudev._errors",
+    "DeviceNotFoundError": "pyudev._errors",
+    "DeviceNotFoundInEnvironmentError": "pyudev._errors",
+    "udev_version": "pyudev._util",
+    "EnumerationCache": "pyudev.cache",
+    "Context": "pyudev.core",
+    "Enumerator": "pyudev.core",
+    "Attributes": "pyudev.device",
+    "Device": "pyudev.device",
+    "DeviceRecord": "pyudev.device",
+    "DeviceRow": "pyudev.device",
+    "Devices": "pyudev.device",
+    "DeviceTable": "pyudev.device",
+    "Tags": "pyudev.device",
+    "DeviceFileHypothesis": "pyudev.discover",
+    "DeviceNameHypothesis": "pyudev.discover",
+    "DeviceNumberHypothesis": "pyudev.discover",
+    "DevicePathHypothesis": "pyudev.discover",
+    "Discovery": "pyudev.discover",
+    "Debouncer": "pyudev.dispatch",
+    "EventQueue": "pyudev.dispatch",
+    "KeyedDispatcher": "pyudev.dispatch",
+    "Monitor": "pyudev.monitor",
+    "MonitorObserver": "pyudev.monitor",
+    "MonitorStats": "pyudev.monitor",
+    "DevicePredicate": "pyudev.predicate",
+    "SysfsAttributeReader": "pyudev.sysfs",
+    "SysfsEnumerator": "pyudev.sysfs",
+    "DeviceTree": "pyudev.tree",
+    "UdevDatabase": "pyudev.udevdb",
+}
+
+# submodules, which are imported on first access as attributes of this package
+_SUBMODULES = frozenset(
+    [
+        "_errors",
+        "_util",
+        "cache",
+        "core",
+        "device",
+        "discover",
+        "dispatch",
+        "monitor",
+        "predicate",
+        "sysfs",
+        "tree",
+        "udevdb",
+    ]
+)
+
+__all__ = [
+    "Attributes",
+    "Context",
+    "Debouncer",
+    "Device",
+    "DeviceFileHypothesis",
+    "DeviceNameHypothesis",
+    "DeviceNotFoundAtPathError",
+    "DeviceNotFoundByFileError",
+    "DeviceNotFoundByNameError",
+    "DeviceNotFoundByNumberError",
+    "DeviceNotFoundError",
+    "DeviceNotFoundInEnvironmentError",
+    "DeviceNumberHypothesis",
+    "DevicePathHypothesis",
+    "DevicePredicate",
+    "DeviceRecord",
+    "DeviceRow",
+    "DeviceTable",
+    "DeviceTree",
+    "Devices",
+    "Discovery",
+    "EnumerationCache",
+    "Enumerator",
+    "EventQueue",
+    "KeyedDispatcher",
+    "Monitor",
+    "MonitorObserver",
+    "MonitorStats",
+    "SysfsAttributeReader",
+    "SysfsEnumerator",
+    "Tags",
+    "UdevDatabase",
+    "__version__",
+    "__version_info__",
+    "udev_version",
+]
+
+
+def __getattr__(name):
+    """
+    Import the module defining ``name`` on first access (see :pep:`562`).
+    """
+    module = _ATTRIBUTES.get(name)
+    if module is not None:
+        value = getattr(importlib.import_module(module), name)
+    elif name in _SUBMODULES:
+        value = importlib.import_module(f"{__name__}.{name}")
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_ATTRIBUTES) | _SUBMODULES)
@@ -23,8 +23,11 @@
 .. moduleauthor::  Anne Mulhern  <amulhern@redhat.com>
 """
 
+import threading
 from ctypes import CDLL
-from ctypes.util import find_library
+
+_LIBRARIES = {}
+_LIBRARIES_LOCK = threading.Lock()
 
 
 def load_ctypes_library(name, signatures, error_checkers):
@@ -45,6 +48,8 @@ def load_ctypes_library(name, signatures, error_checkers):
     :rtype: ctypes.CDLL
     :raises ImportError: if the library is not found
     """
+    from ctypes.util import find_library  # noqa: PLC0415
+
     library_name = find_library(name)
     if not library_name:
         raise ImportError(f"No library named {name}")
@@ -60,3 +65,28 @@ def load_ctypes_library(name, signatures, error_checkers):
             if errorchecker:
                 function.errcheck = errorchecker
     return lib
+
+
+def get_ctypes_library(name, signatures, error_checkers):
+    """
+    Return the process-wide :class:`ctypes.CDLL` object for library ``name``.
+
+    The arguments are the same as for :func:`load_ctypes_library`.  The
+    library is loaded by :func:`load_ctypes_library` on the first call for
+    ``name`` only, all later calls return the same object, regardless of
+    ``signatures`` and ``error_checkers``.
+
+    This function is thread-safe.
+
+    :returns: a loaded library
+    :rtype: ctypes.CDLL
+    :raises ImportError: if the library is not found
+    """
+    lib = _LIBRARIES.get(name)
+    if lib is None:
+        with _LIBRARIES_LOCK:
+            lib = _LIBRARIES.get(name)
+            if lib is None:
+                lib = load_ctypes_library(name, signatures, error_checkers)
+                _LIBRARIES[name] = lib
+    return lib
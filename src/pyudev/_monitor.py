@@ -0,0 +1,191 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2026 pyudev contributors
+
+# This library is free software; you can redistribute it and/or modify it
+# under the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation; either version 2.1 of the License, or (at your
+# option) any later version.
+
+# This library is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE.  See the GNU Lesser General Public License
+# for more details.
+
+# You should have received a copy of the GNU Lesser General Public License
+# along with this library; if not, write to the Free Software Foundation,
+# Inc., 51 Franklin St, Fifth Floor, Boston, MA 02110-1301 USA
+"""
+pyudev._monitor
+===============
+
+Helpers shared by :class:`~pyudev.Monitor` and
+:class:`~pyudev.netlink.NetlinkMonitor`.
+
+This module must not import libudev, so that :mod:`pyudev.netlink` works
+without it.
+"""
+
+import collections
+import os
+import socket
+import struct
+import time
+
+
+def timeout_deadline(timeout):
+    """
+    Return the time at which ``timeout`` in seconds expires, as by
+    :func:`time.monotonic`, or ``None`` if ``timeout`` never or immediately
+    expires.
+    """
+    if timeout is not None and timeout > 0:
+        return time.monotonic() + timeout
+    return None
+
+
+def remaining_timeout(deadline, timeout):
+    """
+    Return the part of ``timeout`` remaining until ``deadline``.
+    """
+    if deadline is None:
+        return timeout
+    return max(deadline - time.monotonic(), 0)
+
+
+# from linux/socket.h, not exported by the socket module
+SO_MEMINFO = getattr(socket, "SO_MEMINFO", 55)
+
+# the first SK_MEMINFO_* values, the memory allocated for received data and
+# the size of the receive buffer
+MEMINFO = struct.Struct("=II")
+
+
+def receive_queue(sock):
+    """
+    Return the memory used by data queued on ``sock``, and the size of its
+    receive buffer, as pair of integers in bytes.
+
+    Netlink sockets do not support the ``SIOCINQ`` ioctl, so the queue is
+    read from ``SO_MEMINFO``, which counts the memory used by the queued
+    messages, like the kernel does to decide on overflows.  The memory used
+    is ``None``, if the kernel does not support ``SO_MEMINFO``.
+    """
+    try:
+        meminfo = sock.getsockopt(socket.SOL_SOCKET, SO_MEMINFO, MEMINFO.size)
+    except OSError:
+        return None, sock.getsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF)
+    return MEMINFO.unpack(meminfo)
+
+
+MonitorStats = collections.namedtuple(
+    "MonitorStats",
+    "received filtered bytes overflows lost backlog receive_buffer_size "
+    "subsystems actions",
+)
+MonitorStats.__doc__ = """
+Statistics of a :class:`Monitor`, as returned by :meth:`Monitor.stats`.
+
+``received`` is the number of events received from the socket, and
+``filtered`` the number of them dropped by the predicate of the monitor.
+Events dropped by the filters of the monitor are not received at all.
+``bytes`` is the number of bytes received, or ``None`` if the monitor cannot
+tell.
+
+``overflows`` is the number of times the receive buffer overflowed, and
+``lost`` the number of events missing from the sequence numbers of received
+events.  Missing events are only detected, if the monitor has no filters,
+and only since the first call of :meth:`Monitor.stats`, or since a
+:class:`MonitorObserver` with ``resync`` observes the monitor.
+
+``backlog`` is the memory in bytes used by events waiting in the receive
+buffer, or ``None`` if unknown, and ``receive_buffer_size`` the effective
+size of the receive buffer in bytes.  Events are dropped, once ``backlog``
+reaches ``receive_buffer_size``.
+
+``subsystems`` and ``actions`` are dictionaries, which map subsystems and
+actions as unicode strings to the number of received events, which were not
+filtered.  Events without subsystem or action are counted with key ``None``.
+These events are only counted since the first call of :meth:`Monitor.stats`.
+
+.. versionadded:: 0.25
+"""
+
+
+def socket_error(monitor, error):
+    """
+    Return the error to raise for ``error`` raised while polling
+    ``monitor``.
+
+    Polling fails without error number, if the socket of ``monitor`` has a
+    pending error, for instance ``ENOBUFS`` after the receive buffer
+    overflowed.  In this case, the pending error is cleared and returned as
+    :exc:`~exceptions.OSError`, if ``monitor`` supports it.  Otherwise
+    ``error`` is returned.
+    """
+    take_error = getattr(monitor, "_take_error", None)
+    if error.errno is None and take_error is not None:
+        errnum = take_error()
+        if errnum:
+            return OSError(errnum, os.strerror(errnum))
+    return error
+
+
+# the number of events, which udev may send earlier than an event with a
+# smaller sequence number, because it handles events in parallel
+REORDER_WINDOW = 64
+
+
+class SequenceTracker:
+    """
+    Count events missing from a stream of sequence numbers.
+
+    Events may arrive out of order, so a missing sequence number is only
+    counted as lost, once ``window`` larger sequence numbers were seen.
+    """
+
+    def __init__(self, window):
+        self.window = window
+        self.lost = 0
+        self._highest = None
+        self._missing = set()
+        # the missing sequence numbers in ascending order; numbers which
+        # arrived late are still here, but not in _missing
+        self._expiring = collections.deque()
+
+    def reset(self):
+        """
+        Forget all seen sequence numbers.
+        """
+        self._highest = None
+        self._missing.clear()
+        self._expiring.clear()
+
+    def update(self, sequence_number):
+        """
+        Record the event with ``sequence_number``.
+        """
+        if not sequence_number:
+            # events without sequence number
+            return
+        highest = self._highest
+        if highest is not None and sequence_number <= highest:
+            self._missing.discard(sequence_number)
+            return
+        self._highest = sequence_number
+        if highest is None:
+            return
+        # sequence numbers below first are too old to arrive anymore
+        first = min(
+            sequence_number, max(highest + 1, sequence_number - self.window + 1)
+        )
+        self.lost += first - highest - 1
+        missing = range(first, sequence_number)
+        self._missing.update(missing)
+        self._expiring.extend(missing)
+        expiring = self._expiring
+        limit = sequence_number - self.window
+        while expiring and expiring[0] <= limit:
+            number = expiring.popleft()
+            if number in self._missing:
+                self._missing.remove(number)
+                self.lost += 1
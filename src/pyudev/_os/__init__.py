@@ -22,5 +22,3 @@
 
 .. moduleauthor::  mulhern  <amulhern@redhat.com>
 """
-
-from . import pipe, poll
@@ -27,7 +27,6 @@
 import os
 import stat
 import sys
-from subprocess import check_output
 
 
 def ensure_byte_string(value):
@@ -186,5 +185,7 @@ def udev_version():
 
     .. versionadded:: 0.8
     """
+    from subprocess import check_output  # noqa: PLC0415
+
     output = ensure_unicode_string(check_output(["udevadm", "--version"]))
     return int(output.strip())
@@ -0,0 +1,209 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2026 pyudev contributors
+
+# This library is free software; you can redistribute it and/or modify it
+# under the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation; either version 2.1 of the License, or (at your
+# option) any later version.
+
+# This library is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE.  See the GNU Lesser General Public License
+# for more details.
+
+# You should have received a copy of the GNU Lesser General Public License
+# along with this library; if not, write to the Free Software Foundation,
+# Inc., 51 Franklin St, Fifth Floor, Boston, MA 02110-1301 USA
+"""
+pyudev.aio
+==========
+
+:mod:`asyncio` integration.
+
+:class:`AsyncMonitor` receives device events in the :mod:`asyncio` event
+loop, without a background thread.
+
+.. versionadded:: 0.25
+"""
+
+import asyncio
+import collections
+
+
+class AsyncMonitor:
+    """
+    An asynchronous wrapper around a :class:`~pyudev.Monitor`.
+
+    The :meth:`~pyudev.Monitor.fileno` of the monitor is watched by the
+    running event loop with :meth:`~asyncio.loop.add_reader`.  Whenever the
+    monitor becomes readable, all pending events are received at once,
+    without blocking, and queued for :meth:`receive`:
+
+    >>> from pyudev import Context, Monitor
+    >>> from pyudev.aio import AsyncMonitor
+    >>> context = Context()
+    >>> monitor = Monitor.from_netlink(context)
+    >>> monitor.filter_by(subsystem='input')
+    >>> async def print_events():
+    ...     async with AsyncMonitor(monitor) as events:
+    ...         async for device in events:
+    ...             print('event {0.action} on {0.device_path}'.format(device))
+
+    If ``max_pending`` events are queued, because they are not received fast
+    enough, the monitor is not watched anymore until events were received.
+    Further events are then buffered by the kernel, as with a
+    :class:`~pyudev.Monitor` which is not polled.
+
+    An instance must only be used from within a single event loop.
+    """
+
+    def __init__(self, monitor, max_pending=1024):
+        """
+        Create a new asynchronous wrapper for ``monitor``.
+
+        ``monitor`` is the :class:`~pyudev.Monitor` to receive events from.
+        ``max_pending`` is the maximum number of received events queued for
+        :meth:`receive`, as integer.
+        """
+        if max_pending < 1:
+            raise ValueError(f"Invalid max_pending: {max_pending}")
+        self.monitor = monitor
+        self.max_pending = max_pending
+        self._pending = collections.deque()
+        # created in start(), to bind it to the running loop on Python 3.9
+        self._ready = None
+        self._loop = None
+        self._watching = False
+        self._closed = False
+        self._error = None
+
+    async def __aenter__(self):
+        self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    @property
+    def started(self):
+        """
+        ``True``, if this monitor was started and not yet closed, ``False``
+        otherwise.
+        """
+        return self._loop is not None and not self._closed
+
+    def start(self):
+        """
+        Start the monitor, and watch it in the running event loop.
+
+        This method must be called from a coroutine or callback running in
+        the event loop.  It does nothing, if this monitor is already started.
+        It is implicitly called by :meth:`receive`.
+
+        Raise :exc:`~exceptions.RuntimeError`, if this monitor was closed.
+        """
+        if self._closed:
+            raise RuntimeError("AsyncMonitor is closed")
+        if self._loop is None:
+            self._loop = asyncio.get_running_loop()
+            self._ready = asyncio.Event()
+            self.monitor.start()
+            self._watch()
+
+    def close(self):
+        """
+        Stop watching the monitor.
+
+        Pending calls of :meth:`receive` return ``None``, and iteration
+        stops.  The underlying :attr:`monitor` is *not* stopped.
+        """
+        if not self._closed:
+            self._closed = True
+            if self._loop is not None:
+                self._unwatch()
+                self._ready.set()
+
+    def _watch(self):
+        if not self._watching:
+            self._loop.add_reader(self.monitor.fileno(), self._drain)
+            self._watching = True
+
+    def _unwatch(self):
+        if self._watching:
+            self._loop.remove_reader(self.monitor.fileno())
+            self._watching = False
+
+    def _drain(self):
+        """
+        Receive all pending events from the monitor.
+
+        Called by the event loop, whenever the monitor is readable.
+        """
+        pending = self._pending
+        try:
+            while len(pending) < self.max_pending:
+                device = self.monitor._receive_device()
+                if device is None:
+                    break
+                pending.append(device)
+            else:
+                # let the kernel buffer further events, until some were taken
+                self._unwatch()
+        except EnvironmentError as error:
+            self._error = error
+            self._unwatch()
+        if pending or self._error is not None:
+            self._ready.set()
+
+    async def receive(self, timeout=None):
+        """
+        Receive the next device event.
+
+        ``timeout`` is a floating point number that specifies a time-out in
+        seconds.  If ``None``, wait until an event is available.
+
+        Return the :class:`~pyudev.Device` of the next event, or ``None`` if
+        no event occurred within ``timeout``, or if this monitor is closed.
+        Raise :exc:`~exceptions.EnvironmentError`, if receiving events from
+        the monitor failed.
+        """
+        if not self._closed:
+            self.start()
+        elif not self._pending:
+            return None
+        deadline = None if timeout is None else self._loop.time() + timeout
+        while not self._pending:
+            if self._error is not None:
+                error, self._error = self._error, None
+                self._watch()
+                raise error
+            if self._closed:
+                return None
+            self._ready.clear()
+            if deadline is None:
+                await self._ready.wait()
+                continue
+            remaining = deadline - self._loop.time()
+            if remaining <= 0:
+                return None
+            try:
+                await asyncio.wait_for(self._ready.wait(), remaining)
+            except asyncio.TimeoutError:
+                return None
+        if not self._closed:
+            self._watch()
+        return self._pending.popleft()
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        """
+        Return the :class:`~pyudev.Device` of the next event.
+
+        Iteration stops, when this monitor is closed.
+        """
+        device = await self.receive()
+        if device is None:
+            raise StopAsyncIteration
+        return device
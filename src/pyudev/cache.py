@@ -0,0 +1,171 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2026 pyudev contributors
+
+# This library is free software; you can redistribute it and/or modify it
+# under the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation; either version 2.1 of the License, or (at your
+# option) any later version.
+
+# This library is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE.  See the GNU Lesser General Public License
+# for more details.
+
+# You should have received a copy of the GNU Lesser General Public License
+# along with this library; if not, write to the Free Software Foundation,
+# Inc., 51 Franklin St, Fifth Floor, Boston, MA 02110-1301 USA
+"""
+pyudev.cache
+============
+
+Caching of enumeration results.
+"""
+
+import threading
+from fnmatch import fnmatchcase
+
+from pyudev._util import ensure_byte_string
+from pyudev.monitor import Monitor, MonitorObserver
+
+
+def _matches_event(spec, devices, device):
+    """
+    Whether an event for ``device`` may change the result of an enumeration.
+
+    ``spec`` is the :attr:`~Enumerator.match_spec` of the enumeration and
+    ``devices`` its cached result.  Only subsystem and tag filters are
+    evaluated, with shell-style wildcards like libudev, any other filter is
+    assumed to match.
+    """
+    subsystem = ensure_byte_string(device.subsystem or "")
+    subsystems = []
+    tags = []
+    for match in spec:
+        if match[0] == "subsystem":
+            if match[2]:
+                if fnmatchcase(subsystem, match[1]):
+                    return False
+            else:
+                subsystems.append(match[1])
+        elif match[0] == "tag":
+            tags.append(match[1])
+    if subsystems and not any(fnmatchcase(subsystem, p) for p in subsystems):
+        return False
+    device_tags = [ensure_byte_string(tag) for tag in device.tags]
+    if tags and not any(fnmatchcase(t, p) for p in tags for t in device_tags):
+        # a device which just lost a tag must still leave the result
+        return device in devices
+    return True
+
+
+class EnumerationCache:
+    """
+    A cache for the results of :meth:`Context.list_devices`.
+
+    Results are keyed on the :attr:`~Enumerator.match_spec` of the
+    enumeration, so that repeated queries with equal filters scan ``sysfs``
+    only once:
+
+    >>> from pyudev import Context, EnumerationCache
+    >>> context = Context()
+    >>> cache = EnumerationCache(context)
+    >>> observer = cache.observe()
+    >>> disks = cache.list_devices(subsystem='block', DEVTYPE='disk')
+
+    Entries are dropped by :meth:`invalidate`, which :meth:`observe` calls
+    for each event received by a :class:`Monitor`.  Only entries whose
+    subsystem and tag filters match the device of an event are dropped.
+    Filters on properties, attributes, names or parents are not evaluated,
+    entries with such filters are dropped for every matching event.
+
+    This class is thread-safe.
+
+    .. versionadded:: 0.25
+    """
+
+    def __init__(self, context):
+        """
+        Create a new cache for enumerations in ``context``.
+        """
+        self.context = context
+        self._lock = threading.Lock()
+        self._entries = {}
+        # incremented for a spec on every invalidation of that spec, to avoid
+        # storing a result which was scanned before a concurrent invalidation
+        self._generations = {}
+
+    def list_devices(self, **kwargs):
+        """
+        List all available devices matching ``kwargs``.
+
+        The arguments of this method are the same as for
+        :meth:`Context.list_devices`.
+
+        Return a tuple of :class:`Device` objects.
+        """
+        return self.get(self.context.list_devices(**kwargs))
+
+    def get(self, enumerator):
+        """
+        Return the devices of ``enumerator``.
+
+        ``enumerator`` is an :class:`Enumerator` from the :attr:`context` of
+        this cache.  If a result for an equal :attr:`~Enumerator.match_spec`
+        is cached, it is returned without scanning.  Otherwise
+        ``enumerator`` is iterated and the result cached.
+
+        Return a tuple of :class:`Device` objects.
+        """
+        spec = enumerator.match_spec
+        with self._lock:
+            devices = self._entries.get(spec)
+            generation = self._generations.setdefault(spec, 0)
+        if devices is not None:
+            return devices
+        devices = tuple(enumerator)
+        with self._lock:
+            if self._generations[spec] == generation:
+                self._entries[spec] = devices
+        return devices
+
+    def invalidate(self, device):
+        """
+        Drop all cached results, which an event for ``device`` may change.
+
+        ``device`` is the :class:`Device` received from a monitor.
+        """
+        with self._lock:
+            for spec in self._generations:
+                if _matches_event(spec, self._entries.get(spec, ()), device):
+                    self._entries.pop(spec, None)
+                    self._generations[spec] += 1
+
+    def clear(self):
+        """
+        Drop all cached results.
+        """
+        with self._lock:
+            self._entries.clear()
+            for spec in self._generations:
+                self._generations[spec] += 1
+
+    def observe(self, monitor=None):
+        """
+        Invalidate entries on events received by ``monitor``.
+
+        ``monitor`` is a :class:`Monitor` for the :attr:`context` of this
+        cache.  If ``None``, a new monitor for ``udev`` events is created.
+        Kernel side filters of ``monitor`` also apply to the invalidation, so
+        only results for subsystems passing these filters should be fetched
+        from this cache.
+
+        Return the started :class:`MonitorObserver`.  Call its
+        :meth:`~MonitorObserver.stop` method to stop invalidation.
+        """
+        if monitor is None:
+            monitor = Monitor.from_netlink(self.context)
+        observer = MonitorObserver(
+            monitor, callback=self.invalidate, name="enumeration-cache-observer"
+        )
+        observer.start()
+        return observer
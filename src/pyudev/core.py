@@ -23,8 +23,10 @@
 .. moduleauthor::  Sebastian Wiesner  <lunaryorn@gmail.com>
 """
 
+import weakref
+
 from pyudev._ctypeslib.libudev import ERROR_CHECKERS, SIGNATURES
-from pyudev._ctypeslib.utils import load_ctypes_library
+from pyudev._ctypeslib.utils import get_ctypes_library
 from pyudev._errors import DeviceNotFoundAtPathError
 from pyudev._util import (
     ensure_byte_string,
@@ -33,6 +35,7 @@
     udev_list_iterate,
 )
 from pyudev.device import Devices
+from pyudev.device._table import DeviceTableBuilder
 
 
 class Context:
@@ -51,12 +54,46 @@ class for almost anything else in pyudev.
     wrapped through :mod:`ctypes`.
     """
 
-    def __init__(self):
+    def __init__(self, intern_devices=False):
         """
         Create a new context.
+
+        libudev is loaded only once per process and shared by all contexts.
+
+        If ``intern_devices`` is ``True``, this context keeps a pool of all
+        live :class:`Device` objects keyed by their :attr:`Device.sys_path`.
+        :meth:`Devices.from_sys_path`, :attr:`Device.parent` and
+        :meth:`Device.find_parent` then return the existing object for a
+        device, instead of creating another one.  This saves allocations and
+        libudev calls, if the same devices are looked up over and over, for
+        instance when walking the :attr:`Device.ancestors` of many devices.
+        The pool only holds weak references, and does not keep devices
+        alive.
+
+        Note that a device object never reflects changes made to the device
+        after its creation, and with ``intern_devices`` it is shared for as
+        long as any reference to it exists.  Devices received from a
+        :class:`Monitor` are never taken from or added to the pool.
+
+        .. versionchanged:: 0.25
+           Share the loaded libudev between all contexts.
+
+        .. versionchanged:: 0.25
+           Add ``intern_devices``.
         """
-        self._libudev = load_ctypes_library("udev", SIGNATURES, ERROR_CHECKERS)
+        self._libudev = get_ctypes_library("udev", SIGNATURES, ERROR_CHECKERS)
         self._as_parameter_ = self._libudev.udev_new()
+        self._device_pool = weakref.WeakValueDictionary() if intern_devices else None
+
+    @property
+    def interns_devices(self):
+        """
+        ``True``, if this context keeps a pool of :class:`Device` objects,
+        ``False`` otherwise.
+
+        .. versionadded:: 0.25
+        """
+        return self._device_pool is not None
 
     def __del__(self):
         if hasattr(self, "_libudev"):
@@ -181,10 +218,25 @@ def __init__(self, context):
         self.context = context
         self._as_parameter_ = context._libudev.udev_enumerate_new(context)
         self._libudev = context._libudev
+        self._matches = set()
 
     def __del__(self):
         self._libudev.udev_enumerate_unref(self)
 
+    @property
+    def match_spec(self):
+        """
+        The filters added to this enumerator as :class:`frozenset`.
+
+        Each member is a tuple, whose first element names the kind of
+        filter, e.g. ``'subsystem'``, followed by its normalized arguments.
+        Two enumerators with equal match specs yield the same devices, no
+        matter in which order or how often their filters were added.
+
+        .. versionadded:: 0.25
+        """
+        return frozenset(self._matches)
+
     def match(self, **kwargs):
         """
         Include devices according to the rules defined by the keyword
@@ -248,7 +300,9 @@ def match_subsystem(self, subsystem, nomatch=False):
             if nomatch
             else self._libudev.udev_enumerate_add_match_subsystem
         )
-        match(self, ensure_byte_string(subsystem))
+        subsystem = ensure_byte_string(subsystem)
+        match(self, subsystem)
+        self._matches.add(("subsystem", subsystem, bool(nomatch)))
         return self
 
     def match_sys_name(self, sys_name):
@@ -261,9 +315,9 @@ def match_sys_name(self, sys_name):
 
         .. versionadded:: 0.8
         """
-        self._libudev.udev_enumerate_add_match_sysname(
-            self, ensure_byte_string(sys_name)
-        )
+        sys_name = ensure_byte_string(sys_name)
+        self._libudev.udev_enumerate_add_match_sysname(self, sys_name)
+        self._matches.add(("sys_name", sys_name))
         return self
 
     def match_property(self, prop, value):
@@ -282,9 +336,10 @@ def match_property(self, prop, value):
 
         Return the instance again.
         """
-        self._libudev.udev_enumerate_add_match_property(
-            self, ensure_byte_string(prop), property_value_to_bytes(value)
-        )
+        prop = ensure_byte_string(prop)
+        value = property_value_to_bytes(value)
+        self._libudev.udev_enumerate_add_match_property(self, prop, value)
+        self._matches.add(("property", prop, value))
         return self
 
     def match_attribute(self, attribute, value, nomatch=False):
@@ -319,7 +374,10 @@ def match_attribute(self, attribute, value, nomatch=False):
             if not nomatch
             else self._libudev.udev_enumerate_add_nomatch_sysattr
         )
-        match(self, ensure_byte_string(attribute), property_value_to_bytes(value))
+        attribute = ensure_byte_string(attribute)
+        value = property_value_to_bytes(value)
+        match(self, attribute, value)
+        self._matches.add(("attribute", attribute, value, bool(nomatch)))
         return self
 
     def match_tag(self, tag):
@@ -334,7 +392,9 @@ def match_tag(self, tag):
 
         .. versionadded:: 0.6
         """
-        self._libudev.udev_enumerate_add_match_tag(self, ensure_byte_string(tag))
+        tag = ensure_byte_string(tag)
+        self._libudev.udev_enumerate_add_match_tag(self, tag)
+        self._matches.add(("tag", tag))
         return self
 
     def match_is_initialized(self):
@@ -356,6 +416,7 @@ def match_is_initialized(self):
         .. versionadded:: 0.8
         """
         self._libudev.udev_enumerate_add_match_is_initialized(self)
+        self._matches.add(("is_initialized",))
         return self
 
     def match_parent(self, parent):
@@ -373,18 +434,96 @@ def match_parent(self, parent):
         .. versionadded:: 0.13
         """
         self._libudev.udev_enumerate_add_match_parent(self, parent)
+        self._matches.add(("parent", ensure_byte_string(parent.sys_path)))
         return self
 
-    def __iter__(self):
+    def _scan(self):
         """
-        Iterate over all matching devices.
+        Scan for matching devices.
 
-        Yield :class:`Device` objects.
+        Yield the ``sys_path`` of each matching device as byte string.
         """
         self._libudev.udev_enumerate_scan_devices(self)
         entry = self._libudev.udev_enumerate_get_list_entry(self)
         for name, _ in udev_list_iterate(self._libudev, entry):
+            yield name
+
+    def __iter__(self):
+        """
+        Iterate over all matching devices.
+
+        Yield :class:`Device` objects.
+        """
+        for name in self._scan():
             try:
                 yield Devices.from_sys_path(self.context, name)
             except DeviceNotFoundAtPathError:
                 continue
+
+    def iter_sys_paths(self):
+        """
+        Iterate over the ``sys_path`` of all matching devices.
+
+        Unlike iteration over this object, no :class:`Device` objects are
+        created.  Consequently, devices which disappear between the scan and
+        the consumption of their path are *not* filtered out.
+
+        Yield the ``sys_path`` of each device as unicode string.
+
+        .. versionadded:: 0.25
+        """
+        for name in self._scan():
+            yield ensure_unicode_string(name)
+
+    def iter_batches(self, size):
+        """
+        Iterate over all matching devices in batches of ``size`` devices.
+
+        ``size`` is the number of devices per batch as a positive integer.
+        Every batch but the last one holds exactly ``size`` devices, the last
+        one holds the remaining devices.
+
+        Yield lists of :class:`Device` objects.  Raise
+        :exc:`~exceptions.ValueError`, if ``size`` is not positive.
+
+        .. versionadded:: 0.25
+        """
+        if size < 1:
+            raise ValueError(f"Invalid batch size: {size!r}")
+        batch = []
+        for device in self:
+            batch.append(device)
+            if len(batch) == size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    def snapshot(self):
+        """
+        Take an immutable snapshot of all matching devices.
+
+        Scan for matching devices once, and read the ``sys_path``,
+        ``subsystem``, ``device_type``, ``driver``, ``device_number``,
+        ``device_node`` and properties of each device into a columnar
+        :class:`DeviceTable`.  Unlike iteration over this object, no
+        :class:`Device` objects are created, and the returned table answers
+        all queries without calling into libudev again.
+
+        Devices which disappear during the scan are omitted.
+
+        Return a :class:`DeviceTable`.
+
+        .. versionadded:: 0.25
+        """
+        libudev = self._libudev
+        builder = DeviceTableBuilder()
+        for name in self._scan():
+            device = libudev.udev_device_new_from_syspath(self.context, name)
+            if not device:
+                continue
+            try:
+                builder.add_udev_device(libudev, device)
+            finally:
+                libudev.udev_device_unref(device)
+        return builder.build()
@@ -24,3 +24,5 @@
 """
 
 from ._device import Attributes, Device, Devices, Tags
+from ._record import DeviceRecord
+from ._table import DeviceRow, DeviceTable
@@ -23,7 +23,7 @@
 .. moduleauthor::  Sebastian Wiesner  <lunaryorn@gmail.com>
 """
 
-import collections
+import collections.abc
 import os
 import re
 from datetime import timedelta
@@ -45,6 +45,40 @@
     udev_list_iterate,
 )
 
+from ._record import DeviceRecord
+
+# marks an identity field of a Device, which was not yet fetched from libudev
+_UNKNOWN = object()
+
+
+def _pooled_device(context, device, owned):
+    """
+    Return the :class:`Device` for the ``udev_device *`` pointer ``device``.
+
+    If ``context`` interns devices, and its pool holds a live object for the
+    ``sys_path`` of ``device``, return that object.  Otherwise wrap
+    ``device`` into a new object, and add it to the pool.
+
+    ``owned`` is ``True``, if the caller holds a reference to ``device``,
+    which is then passed on or released.  Otherwise a reference is acquired,
+    if needed.
+    """
+    libudev = context._libudev
+    pool = context._device_pool
+    if pool is not None:
+        sys_path = libudev.udev_device_get_syspath(device)
+        existing = pool.get(sys_path)
+        if existing is not None:
+            if owned:
+                libudev.udev_device_unref(device)
+            return existing
+    if not owned:
+        device = libudev.udev_device_ref(device)
+    if pool is None:
+        return Device(context, device)
+    # another thread may have added the device meanwhile
+    return pool.setdefault(sys_path, Device(context, device))
+
 
 class Devices:
     """
@@ -95,12 +129,22 @@ def from_sys_path(cls, context, sys_path):
         ``sys_path``.
 
         .. versionadded:: 0.18
-        """
-        device = context._libudev.udev_device_new_from_syspath(
-            context, ensure_byte_string(sys_path)
-        )
+
+        .. versionchanged:: 0.25
+           Return the existing object for the device, if ``context`` interns
+           devices.
+        """
+        sys_path_bytes = ensure_byte_string(sys_path)
+        pool = context._device_pool
+        if pool is not None:
+            device = pool.get(sys_path_bytes)
+            if device is not None:
+                return device
+        device = context._libudev.udev_device_new_from_syspath(context, sys_path_bytes)
         if not device:
             raise DeviceNotFoundAtPathError(sys_path)
+        if pool is not None:
+            return _pooled_device(context, device, owned=True)
         return Device(context, device)
 
     @classmethod
@@ -220,6 +264,79 @@ def from_device_file(cls, context, filename):
 
         return cls.from_device_number(context, device_type, device_number)
 
+    @classmethod
+    def from_device_numbers(cls, context, pairs):
+        """
+        Create devices for many device numbers at once.
+
+        ``context`` is the :class:`Context`, in which to search the devices.
+        ``pairs`` is an iterable of ``(type, number)`` pairs, where ``type``
+        and ``number`` are as for :meth:`from_device_number`.  Each distinct
+        device is looked up only once, equal pairs share the same
+        :class:`Device` object.
+
+        Return a dictionary mapping each pair to its :class:`Device`, or to
+        the :exc:`DeviceNotFoundByNumberError`, if no device was found for
+        the pair.  Unlike :meth:`from_device_number`, no error is raised.
+
+        .. versionadded:: 0.25
+        """
+        devices = {}
+        resolved = {}
+        for pair in pairs:
+            if pair in devices:
+                continue
+            typ, number = pair
+            key = (typ[0], number)
+            device = resolved.get(key)
+            if device is None:
+                try:
+                    device = cls.from_device_number(context, typ, number)
+                except DeviceNotFoundByNumberError as err:
+                    device = err
+                resolved[key] = device
+            devices[pair] = device
+        return devices
+
+    @classmethod
+    def from_device_files(cls, context, filenames):
+        """
+        Create devices for many device files at once.
+
+        ``context`` is the :class:`Context`, in which to search the devices.
+        ``filenames`` is an iterable of paths of device files, for instance
+        the links in ``/dev/disk/by-id``.  Each distinct device is looked up
+        only once, so files referring to the same device share the same
+        :class:`Device` object.
+
+        Return a dictionary mapping each filename to its :class:`Device`.
+        Instead of raising, a filename is mapped to the
+        :exc:`DeviceNotFoundByFileError` or
+        :exc:`DeviceNotFoundByNumberError`, which :meth:`from_device_file`
+        would raise for it.
+
+        .. versionadded:: 0.25
+        """
+        # each filename maps to its error, or to its (type, number) pair
+        entries = {}
+        for filename in filenames:
+            if filename in entries:
+                continue
+            try:
+                device_type = get_device_type(filename)
+                device_number = os.stat(filename).st_rdev
+            except (EnvironmentError, ValueError) as err:
+                entries[filename] = DeviceNotFoundByFileError(err)
+            else:
+                entries[filename] = (device_type, device_number)
+        resolved = cls.from_device_numbers(
+            context, (e for e in entries.values() if isinstance(e, tuple))
+        )
+        return dict(
+            (filename, resolved[entry] if isinstance(entry, tuple) else entry)
+            for filename, entry in entries.items()
+        )
+
     @classmethod
     def from_interface_index(cls, context, ifindex):
         """
@@ -229,15 +346,43 @@ def from_interface_index(cls, context, ifindex):
         :param int ifindex: the interface index
         :returns: the device corresponding to the interface index
         :rtype: `Device`
+        :raises DeviceNotFoundByInterfaceIndexError: if no network device has
+           the interface index ``ifindex``
 
         This method is only appropriate for network devices.
+
+        .. versionchanged:: 0.25
+           Look up the device by its interface name instead of comparing the
+           ``ifindex`` attribute of all network devices, and accept the
+           interface index as integer or as string of decimal digits.
         """
-        network_devices = context.list_devices(subsystem="net")
-        dev = next(
-            (d for d in network_devices if d.attributes.get("ifindex") == ifindex), None
-        )
-        if dev is not None:
-            return dev
+        try:
+            index = int(ifindex)
+        except (TypeError, ValueError):
+            raise DeviceNotFoundByInterfaceIndexError(ifindex) from None
+        libudev = context._libudev
+        if hasattr(libudev, "udev_device_new_from_device_id"):
+            device = libudev.udev_device_new_from_device_id(
+                context, f"n{index}".encode("ascii")
+            )
+            if not device:
+                raise DeviceNotFoundByInterfaceIndexError(ifindex)
+            return Device(context, device)
+
+        # libudev before 189 cannot look up devices by their id
+        import socket  # noqa: PLC0415
+
+        expected = str(index).encode("ascii")
+        try:
+            device = cls.from_name(context, "net", socket.if_indextoname(index))
+        except (OSError, OverflowError, DeviceNotFoundByNameError):
+            device = None
+        if device is not None and device.attributes.get("ifindex") == expected:
+            return device
+        # the interface may have been renamed meanwhile
+        for device in context.list_devices(subsystem="net"):
+            if device.attributes.get("ifindex") == expected:
+                return device
         raise DeviceNotFoundByInterfaceIndexError(ifindex)
 
     @classmethod
@@ -249,8 +394,20 @@ def from_kernel_device(cls, context, kernel_device):
         :param str kernel_device: the kernel device
         :returns: the device corresponding to ``kernel_device``
         :rtype: `Device`
+
+        .. versionchanged:: 0.25
+           Look up the device with a single libudev call, if available.
         """
-        switch_char = kernel_device[0]
+        libudev = context._libudev
+        if hasattr(libudev, "udev_device_new_from_device_id"):
+            device = libudev.udev_device_new_from_device_id(
+                context, ensure_byte_string(kernel_device)
+            )
+            if not device:
+                raise DeviceNotFoundByKernelDeviceError(kernel_device)
+            return Device(context, device)
+
+        switch_char = kernel_device[:1]
         rest = kernel_device[1:]
         if switch_char in ("b", "c"):
             number_re = re.compile(r"^(?P<major>\d+):(?P<minor>\d+)$")
@@ -461,6 +618,17 @@ def __init__(self, context, _device):
         self.context = context
         self._as_parameter_ = _device
         self._libudev = context._libudev
+        # all properties as dictionary, once materialized by Properties
+        self._property_values = None
+        # identity fields never change for a udev_device, so they are fetched
+        # from libudev at most once
+        self._raw_device_path = None
+        self._device_path = None
+        self._sys_path = None
+        self._sys_name = None
+        self._subsystem = _UNKNOWN
+        self._device_type = _UNKNOWN
+        self._hash = None
 
     def __del__(self):
         self._libudev.udev_device_unref(self)
@@ -477,9 +645,7 @@ def parent(self):
         parent = self._libudev.udev_device_get_parent(self)
         if not parent:
             return None
-        # the parent device is not referenced, thus forcibly acquire a
-        # reference
-        return Device(self.context, self._libudev.udev_device_ref(parent))
+        return _pooled_device(self.context, parent, owned=False)
 
     @property
     def children(self):
@@ -554,8 +720,7 @@ def find_parent(self, subsystem, device_type=None):
         )
         if not parent:
             return None
-        # parent device is not referenced, thus forcibly acquire a reference
-        return Device(self.context, self._libudev.udev_device_ref(parent))
+        return _pooled_device(self.context, parent, owned=False)
 
     def traverse(self):
         """
@@ -584,7 +749,12 @@ def sys_path(self):
         Absolute path of this device in ``sysfs`` including the ``sysfs``
         mount point as unicode string.
         """
-        return ensure_unicode_string(self._libudev.udev_device_get_syspath(self))
+        sys_path = self._sys_path
+        if sys_path is None:
+            sys_path = self._sys_path = ensure_unicode_string(
+                self._libudev.udev_device_get_syspath(self)
+            )
+        return sys_path
 
     @property
     def device_path(self):
@@ -596,7 +766,23 @@ def device_path(self):
         mount point.  However, the path is absolute and starts with a slash
         ``'/'``.
         """
-        return ensure_unicode_string(self._libudev.udev_device_get_devpath(self))
+        device_path = self._device_path
+        if device_path is None:
+            device_path = self._device_path = ensure_unicode_string(
+                self._get_raw_device_path()
+            )
+        return device_path
+
+    def _get_raw_device_path(self):
+        """
+        Return the kernel device path as byte string.
+        """
+        raw_device_path = self._raw_device_path
+        if raw_device_path is None:
+            raw_device_path = self._raw_device_path = (
+                self._libudev.udev_device_get_devpath(self)
+            )
+        return raw_device_path
 
     @property
     def subsystem(self):
@@ -606,15 +792,25 @@ def subsystem(self):
         :returns: name of subsystem if found, else None
         :rtype: unicode string or NoneType
         """
-        subsys = self._libudev.udev_device_get_subsystem(self)
-        return None if subsys is None else ensure_unicode_string(subsys)
+        subsystem = self._subsystem
+        if subsystem is _UNKNOWN:
+            subsystem = self._libudev.udev_device_get_subsystem(self)
+            if subsystem is not None:
+                subsystem = ensure_unicode_string(subsystem)
+            self._subsystem = subsystem
+        return subsystem
 
     @property
     def sys_name(self):
         """
         Device file name inside ``sysfs`` as unicode string.
         """
-        return ensure_unicode_string(self._libudev.udev_device_get_sysname(self))
+        sys_name = self._sys_name
+        if sys_name is None:
+            sys_name = self._sys_name = ensure_unicode_string(
+                self._libudev.udev_device_get_sysname(self)
+            )
+        return sys_name
 
     @property
     def sys_number(self):
@@ -661,10 +857,13 @@ def device_type(self):
 
         .. versionadded:: 0.10
         """
-        device_type = self._libudev.udev_device_get_devtype(self)
-        if device_type is None:
-            return None
-        return ensure_unicode_string(device_type)
+        device_type = self._device_type
+        if device_type is _UNKNOWN:
+            device_type = self._libudev.udev_device_get_devtype(self)
+            if device_type is not None:
+                device_type = ensure_unicode_string(device_type)
+            self._device_type = device_type
+        return device_type
 
     @property
     def driver(self):
@@ -901,6 +1100,21 @@ def tags(self):
         """
         return Tags(self)
 
+    def freeze(self, attributes=()):
+        """
+        Record the current state of this device.
+
+        ``attributes`` is an iterable of names of ``sysfs`` attributes, whose
+        values are recorded along with the identity, properties, tags and
+        device links of this device.
+
+        Return a :class:`DeviceRecord`, which is immutable, can be pickled
+        and holds no reference to libudev.
+
+        .. versionadded:: 0.25
+        """
+        return DeviceRecord.from_device(self, attributes)
+
     def __iter__(self):
         """
         Iterate over the names of all properties defined for this device.
@@ -1017,16 +1231,21 @@ def asbool(self, prop):
         return self.properties.asbool(prop)
 
     def __hash__(self):
-        return hash(self.device_path)
+        # hash the unicode path, so that devices remain interchangeable
+        # with their device path in sets and dictionaries
+        device_hash = self._hash
+        if device_hash is None:
+            device_hash = self._hash = hash(self.device_path)
+        return device_hash
 
     def __eq__(self, other):
         if isinstance(other, Device):
-            return self.device_path == other.device_path
+            return self._get_raw_device_path() == other._get_raw_device_path()
         return self.device_path == other
 
     def __ne__(self, other):
         if isinstance(other, Device):
-            return self.device_path != other.device_path
+            return self._get_raw_device_path() != other._get_raw_device_path()
         return self.device_path != other
 
     def __gt__(self, other):
@@ -1046,6 +1265,10 @@ class Properties(collections.abc.Mapping):
     """
     udev properties :class:`Device` objects.
 
+    By default every lookup queries libudev.  After :meth:`materialize`, all
+    lookups are served from a dictionary, which holds all properties of the
+    device.
+
     .. versionadded:: 0.21
     """
 
@@ -1054,6 +1277,41 @@ def __init__(self, device):
         self.device = device
         self._libudev = device._libudev
 
+    def materialize(self):
+        """
+        Read all properties of the device into a dictionary at once.
+
+        The dictionary is stored with the :class:`Device`, so that all
+        :class:`Properties` objects of the device serve :meth:`__getitem__`,
+        :meth:`__len__`, :meth:`__iter__`, :meth:`asint` and :meth:`asbool`
+        from it, without calling into libudev.  The properties of a device
+        object never change, so the dictionary cannot become stale.
+
+        Use this, if many properties of a device are read.
+
+        Return this object again.
+
+        .. versionadded:: 0.25
+        """
+        device = self.device
+        if device._property_values is None:
+            properties = self._libudev.udev_device_get_properties_list_entry(device)
+            device._property_values = dict(
+                (ensure_unicode_string(name), ensure_unicode_string(value))
+                for name, value in udev_list_iterate(self._libudev, properties)
+            )
+        return self
+
+    @property
+    def is_materialized(self):
+        """
+        ``True``, if the properties of the device were read by
+        :meth:`materialize`, ``False`` otherwise.
+
+        .. versionadded:: 0.25
+        """
+        return self.device._property_values is not None
+
     def __iter__(self):
         """
         Iterate over the names of all properties defined for the device.
@@ -1061,6 +1319,12 @@ def __iter__(self):
         Return a generator yielding the names of all properties of this
         device as unicode strings.
         """
+        values = self.device._property_values
+        if values is not None:
+            return iter(values)
+        return self._iter_names()
+
+    def _iter_names(self):
         properties = self._libudev.udev_device_get_properties_list_entry(self.device)
         for name, _ in udev_list_iterate(self._libudev, properties):
             yield ensure_unicode_string(name)
@@ -1069,6 +1333,9 @@ def __len__(self):
         """
         Return the amount of properties defined for this device as integer.
         """
+        values = self.device._property_values
+        if values is not None:
+            return len(values)
         properties = self._libudev.udev_device_get_properties_list_entry(self.device)
         return sum(1 for _ in udev_list_iterate(self._libudev, properties))
 
@@ -1083,12 +1350,20 @@ def __getitem__(self, prop):
         :exc:`~exceptions.KeyError`, if the given property is not defined
         for this device.
         """
-        value = self._libudev.udev_device_get_property_value(
-            self.device, ensure_byte_string(prop)
-        )
+        values = self.device._property_values
+        if values is not None:
+            value = values.get(prop)
+            if value is None and isinstance(prop, bytes):
+                value = values.get(ensure_unicode_string(prop))
+        else:
+            value = self._libudev.udev_device_get_property_value(
+                self.device, ensure_byte_string(prop)
+            )
+            if value is not None:
+                value = ensure_unicode_string(value)
         if value is None:
             raise KeyError(prop)
-        return ensure_unicode_string(value)
+        return value
 
     def asint(self, prop):
         """
@@ -1234,6 +1509,40 @@ def asbool(self, attribute):
         """
         return string_to_bool(self.asstring(attribute))
 
+    def read_many(self, attributes, reader=None):
+        """
+        Read the current values of the given system ``attributes``.
+
+        Unlike :meth:`get`, this bypasses libudev, which caches the value of
+        an attribute forever once read, and reads each attribute file below
+        :attr:`Device.sys_path` directly.  Errors are captured per attribute.
+
+        :param attributes: the keys of the attributes to read
+        :type attributes: iterable of unicode or byte strings
+        :param reader: a reader to read the attribute files with, which keeps
+           them open for later calls.  If ``None``, each file is opened and
+           closed again.
+        :type reader: :class:`SysfsAttributeReader`
+        :returns: a dictionary mapping each key to its value, or to the
+           :exc:`~exceptions.EnvironmentError` raised while reading it
+        :rtype: dict
+
+        .. versionadded:: 0.25
+        """
+        from pyudev.sysfs import SysfsAttributeReader  # noqa: PLC0415
+
+        sys_path = self.device.sys_path
+        paths = dict(
+            (attribute, os.path.join(sys_path, ensure_unicode_string(attribute)))
+            for attribute in attributes
+        )
+        if reader is None:
+            with SysfsAttributeReader() as own_reader:
+                values = own_reader.read_many(paths.values())
+        else:
+            values = reader.read_many(paths.values())
+        return dict((attribute, values[path]) for attribute, path in paths.items())
+
     def unset(self, attribute):
         """
         Clear the attribute's cached value in udev.
@@ -0,0 +1,169 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2026 pyudev contributors
+
+# This library is free software; you can redistribute it and/or modify it
+# under the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation; either version 2.1 of the License, or (at your
+# option) any later version.
+
+# This library is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE.  See the GNU Lesser General Public License
+# for more details.
+
+# You should have received a copy of the GNU Lesser General Public License
+# along with this library; if not, write to the Free Software Foundation,
+# Inc., 51 Franklin St, Fifth Floor, Boston, MA 02110-1301 USA
+"""
+pyudev.device._record
+=====================
+
+Detached device records.
+"""
+
+import sys
+from types import MappingProxyType
+
+from pyudev._util import ensure_unicode_string
+
+
+def _intern(value):
+    """
+    Intern the byte or unicode string ``value`` as unicode string, passing
+    ``None`` through.
+    """
+    return None if value is None else sys.intern(ensure_unicode_string(value))
+
+
+class DeviceRecord:
+    """
+    An immutable record of the state of a :class:`Device`.
+
+    A record holds the identity of a device, its udev properties, tags and
+    device links, and optionally some of its ``sysfs`` attributes.  Unlike a
+    :class:`Device` it holds no reference to a :class:`Context` or to
+    libudev, so it can be pickled and sent to other processes, and it uses
+    little memory.  Strings repeated across records, like subsystems and
+    property names, are interned.
+
+    Records are created with :meth:`Device.freeze`:
+
+    >>> from pyudev import Context, Devices
+    >>> context = Context()
+    >>> record = Devices.from_name(context, 'block', 'sda').freeze(['size'])
+    >>> record.properties['DEVTYPE']
+    'disk'
+    >>> record.attributes['size']
+    b'500118192'
+
+    Records compare equal, if all of their fields are equal.
+
+    .. versionadded:: 0.25
+    """
+
+    __slots__ = (
+        "sys_path",
+        "device_path",
+        "subsystem",
+        "sys_name",
+        "device_type",
+        "driver",
+        "device_node",
+        "device_number",
+        "action",
+        "sequence_number",
+        "tags",
+        "device_links",
+        "_properties",
+        "_attributes",
+    )
+
+    _FIELDS = __slots__
+
+    def __init__(self, *values):
+        """
+        Create a record from ``values``, which are given in the order of
+        :attr:`_FIELDS`.
+
+        Do not create instances of this class directly, use
+        :meth:`Device.freeze` instead.
+        """
+        if len(values) != len(self._FIELDS):
+            raise TypeError(f"Expected {len(self._FIELDS)} values, got {len(values)}")
+        for name, value in zip(self._FIELDS, values):
+            object.__setattr__(self, name, value)
+
+    @classmethod
+    def from_device(cls, device, attributes=()):
+        """
+        Create a record of ``device``.
+
+        ``attributes`` is an iterable of names of ``sysfs`` attributes, whose
+        values are recorded as well.  Attributes without a value are omitted.
+        """
+        attribute_values = {}
+        if attributes:
+            device_attributes = device.attributes
+            for name in attributes:
+                value = device_attributes.get(name)
+                if value is not None:
+                    attribute_values[_intern(name)] = value
+        return cls(
+            device.sys_path,
+            device.device_path,
+            _intern(device.subsystem),
+            device.sys_name,
+            _intern(device.device_type),
+            _intern(device.driver),
+            device.device_node,
+            device.device_number,
+            _intern(device.action),
+            device.sequence_number,
+            tuple(_intern(tag) for tag in device.tags),
+            tuple(device.device_links),
+            dict((_intern(name), value) for name, value in device.properties.items()),
+            attribute_values,
+        )
+
+    @property
+    def properties(self):
+        """
+        The udev properties of the device as read-only mapping.
+        """
+        return MappingProxyType(self._properties)
+
+    @property
+    def attributes(self):
+        """
+        The recorded ``sysfs`` attributes of the device as read-only mapping
+        from names to byte strings.
+        """
+        return MappingProxyType(self._attributes)
+
+    def _values(self):
+        return tuple(getattr(self, name) for name in self._FIELDS)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __reduce__(self):
+        return (type(self), self._values())
+
+    def __repr__(self):
+        return f"DeviceRecord({self.sys_path!r})"
+
+    def __eq__(self, other):
+        if isinstance(other, DeviceRecord):
+            return self._values() == other._values()
+        return NotImplemented
+
+    def __ne__(self, other):
+        if isinstance(other, DeviceRecord):
+            return self._values() != other._values()
+        return NotImplemented
+
+    def __hash__(self):
+        return hash((self.device_path, self.action, self.sequence_number))
@@ -0,0 +1,403 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2026 pyudev contributors
+
+# This library is free software; you can redistribute it and/or modify it
+# under the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation; either version 2.1 of the License, or (at your
+# option) any later version.
+
+# This library is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE.  See the GNU Lesser General Public License
+# for more details.
+
+# You should have received a copy of the GNU Lesser General Public License
+# along with this library; if not, write to the Free Software Foundation,
+# Inc., 51 Franklin St, Fifth Floor, Boston, MA 02110-1301 USA
+"""
+pyudev.device._table
+====================
+
+Immutable, columnar snapshots of the device list.
+"""
+
+import collections.abc
+import os
+import sys
+from array import array
+
+from pyudev._util import ensure_unicode_string, property_value_to_bytes
+
+DeviceRow = collections.namedtuple(
+    "DeviceRow", "sys_path subsystem device_type driver device_number device_node"
+)
+
+# the string columns of a table, in the order of the fields of DeviceRow
+_STRING_COLUMNS = ("sys_path", "subsystem", "device_type", "driver")
+
+
+class _StringPool:
+    """
+    Intern strings into a list, so that columns only need to store indices.
+
+    Byte strings are decoded exactly once, no matter how often they occur.
+    """
+
+    def __init__(self):
+        self.strings = []
+        self._indices = {}
+
+    def add(self, value):
+        """
+        Add ``value`` to the pool and return its index.
+
+        ``value`` is a byte or unicode string, or ``None``.  ``None`` is
+        stored as ``-1``.
+        """
+        if value is None:
+            return -1
+        index = self._indices.get(value)
+        if index is None:
+            string = sys.intern(ensure_unicode_string(value))
+            index = self._indices.get(string)
+            if index is None:
+                index = len(self.strings)
+                self.strings.append(string)
+                self._indices[string] = index
+            self._indices[value] = index
+        return index
+
+    def find(self, value):
+        """
+        Return the index of ``value`` in the pool, or ``None`` if ``value``
+        was never added.
+        """
+        return self._indices.get(value)
+
+
+class _DeviceTableStore:
+    """
+    The column storage shared by a :class:`DeviceTable` and all tables
+    derived from it.
+    """
+
+    __slots__ = (
+        "strings",
+        "columns",
+        "device_numbers",
+        "property_offsets",
+        "property_names",
+        "property_values",
+        "_pool",
+        "_sys_path_rows",
+    )
+
+    def __init__(self, pool):
+        self._pool = pool
+        self.strings = pool.strings
+        self.columns = dict((name, array("l")) for name in _STRING_COLUMNS)
+        self.columns["device_node"] = array("l")
+        self.device_numbers = array("Q")
+        self.property_offsets = array("L", [0])
+        self.property_names = array("l")
+        self.property_values = array("l")
+        self._sys_path_rows = None
+
+    def find_string(self, value):
+        """
+        Return the pool index of ``value``, or ``None`` if no column contains
+        ``value``.
+        """
+        return self._pool.find(value)
+
+    def row_of(self, sys_path):
+        """
+        Return the storage row of the device at ``sys_path``, or ``None``.
+        """
+        if self._sys_path_rows is None:
+            self._sys_path_rows = dict(
+                (index, row) for row, index in enumerate(self.columns["sys_path"])
+            )
+        index = self._pool.find(sys_path)
+        return None if index is None else self._sys_path_rows.get(index)
+
+
+class DeviceTableBuilder:
+    """
+    Accumulate device data into a :class:`DeviceTable`.
+
+    Each device is added exactly once with :meth:`add` or
+    :meth:`add_udev_device`.  :meth:`build` returns the finished table.
+    """
+
+    def __init__(self):
+        self._pool = _StringPool()
+        self._store = _DeviceTableStore(self._pool)
+
+    def add(  # noqa: PLR0913, PLR0917
+        self,
+        sys_path,
+        subsystem=None,
+        device_type=None,
+        driver=None,
+        device_number=0,
+        device_node=None,
+        properties=(),
+    ):
+        """
+        Add a single device to the table.
+
+        All string arguments may be byte or unicode strings.  ``properties``
+        is an iterable of ``(name, value)`` pairs.
+        """
+        add = self._pool.add
+        store = self._store
+        columns = store.columns
+        columns["sys_path"].append(add(sys_path))
+        columns["subsystem"].append(add(subsystem))
+        columns["device_type"].append(add(device_type))
+        columns["driver"].append(add(driver))
+        columns["device_node"].append(add(device_node))
+        store.device_numbers.append(device_number)
+        for name, value in properties:
+            store.property_names.append(add(name))
+            store.property_values.append(add(value))
+        store.property_offsets.append(len(store.property_names))
+
+    def add_udev_device(self, libudev, device):
+        """
+        Add the ``udev_device *`` pointer ``device`` to the table.
+
+        ``libudev`` is the library through which ``device`` is queried.  The
+        caller retains ownership of ``device``.
+        """
+        properties = []
+        entry = libudev.udev_device_get_properties_list_entry(device)
+        while entry:
+            properties.append(
+                (
+                    libudev.udev_list_entry_get_name(entry),
+                    libudev.udev_list_entry_get_value(entry),
+                )
+            )
+            entry = libudev.udev_list_entry_get_next(entry)
+        self.add(
+            libudev.udev_device_get_syspath(device),
+            libudev.udev_device_get_subsystem(device),
+            libudev.udev_device_get_devtype(device),
+            libudev.udev_device_get_driver(device),
+            libudev.udev_device_get_devnum(device),
+            libudev.udev_device_get_devnode(device),
+            properties,
+        )
+
+    def build(self):
+        """
+        Return the :class:`DeviceTable` holding all added devices.
+
+        The builder must not be used anymore afterwards.
+        """
+        store = self._store
+        return DeviceTable(store, array("L", range(len(store.device_numbers))))
+
+
+class DeviceTable(collections.abc.Sequence):
+    """
+    An immutable, columnar snapshot of devices.
+
+    A table is a sequence of :class:`DeviceRow` objects, which hold the
+    ``sys_path``, ``subsystem``, ``device_type``, ``driver``,
+    ``device_number`` and ``device_node`` of a device with the same meaning
+    as the corresponding :class:`Device` attributes.  The udev properties of
+    a row are available through :meth:`properties`.
+
+    All strings are interned and stored once per table, and every column is
+    backed by an :class:`array.array`.  Filtering a table with
+    :meth:`filter` returns a new table, which shares the storage of this
+    table.  No method of this class calls into libudev.
+
+    Tables are created with :meth:`Enumerator.snapshot`:
+
+    >>> from pyudev import Context
+    >>> context = Context()
+    >>> table = context.list_devices(subsystem='block').snapshot()
+    >>> [row.device_node for row in table.filter(device_type='disk')]
+    ['/dev/sda']
+
+    .. versionadded:: 0.25
+    """
+
+    __slots__ = ("_store", "_rows", "_positions")
+
+    def __init__(self, store, rows):
+        """
+        Create a table from ``store``, showing the storage rows in ``rows``.
+
+        Do not create instances of this class directly.
+        """
+        self._store = store
+        self._rows = rows
+        self._positions = None
+
+    def __len__(self):
+        return len(self._rows)
+
+    def __getitem__(self, index):
+        """
+        Return the :class:`DeviceRow` at ``index``.
+
+        If ``index`` is a slice, return a new :class:`DeviceTable` instead.
+        """
+        if isinstance(index, slice):
+            return DeviceTable(self._store, self._rows[index])
+        return self._make_row(self._rows[index])
+
+    def __repr__(self):
+        return f"DeviceTable(<{len(self)} devices>)"
+
+    def _make_row(self, row):
+        """
+        Build the :class:`DeviceRow` for the storage row ``row``.
+        """
+        strings = self._store.strings
+        columns = self._store.columns
+        values = []
+        for name in _STRING_COLUMNS:
+            index = columns[name][row]
+            values.append(None if index < 0 else strings[index])
+        node = columns["device_node"][row]
+        return DeviceRow(
+            values[0],
+            values[1],
+            values[2],
+            values[3],
+            self._store.device_numbers[row],
+            None if node < 0 else strings[node],
+        )
+
+    def column(self, name):
+        """
+        Return all values of the column ``name`` as tuple.
+
+        ``name`` is the name of a field of :class:`DeviceRow`.  Raise
+        :exc:`~exceptions.KeyError` for an unknown column.
+        """
+        if name == "device_number":
+            numbers = self._store.device_numbers
+            return tuple(numbers[row] for row in self._rows)
+        column = self._store.columns[name]
+        strings = self._store.strings
+        return tuple(
+            None if column[row] < 0 else strings[column[row]] for row in self._rows
+        )
+
+    def properties(self, index):
+        """
+        Return the udev properties of the device at ``index`` as dictionary
+        mapping property names to values.
+        """
+        store = self._store
+        row = self._rows[index]
+        strings = store.strings
+        start = store.property_offsets[row]
+        end = store.property_offsets[row + 1]
+        return dict(
+            (strings[store.property_names[i]], strings[store.property_values[i]])
+            for i in range(start, end)
+        )
+
+    def lookup(self, sys_path):
+        """
+        Return the :class:`DeviceRow` of the device at ``sys_path``.
+
+        Raise :exc:`~exceptions.KeyError`, if this table contains no such
+        device.
+        """
+        return self[self.index_of(sys_path)]
+
+    def index_of(self, sys_path):
+        """
+        Return the index of the device at ``sys_path`` in this table.
+
+        Raise :exc:`~exceptions.KeyError`, if this table contains no such
+        device.
+        """
+        row = self._store.row_of(sys_path)
+        if self._positions is None:
+            self._positions = dict(
+                (storage_row, position)
+                for position, storage_row in enumerate(self._rows)
+            )
+        position = self._positions.get(row)
+        if position is None:
+            raise KeyError(sys_path)
+        return position
+
+    def filter(
+        self, subsystem=None, sys_name=None, device_type=None, driver=None, **kwargs
+    ):
+        """
+        Return a new :class:`DeviceTable` holding only the matching devices.
+
+        ``subsystem``, ``sys_name``, ``device_type`` and ``driver`` each
+        restrict the table to devices with exactly this value.  All other
+        keyword arguments are interpreted as property names, whose values must
+        match the given value, which is converted like in
+        :meth:`Enumerator.match_property`.  All conditions are combined using
+        a logical AND.
+        """
+        store = self._store
+        rows = self._rows
+        for name, value in (
+            ("subsystem", subsystem),
+            ("device_type", device_type),
+            ("driver", driver),
+        ):
+            if value is None:
+                continue
+            wanted = store.find_string(ensure_unicode_string(value))
+            if wanted is None:
+                return DeviceTable(store, array("L"))
+            column = store.columns[name]
+            rows = array("L", (row for row in rows if column[row] == wanted))
+        if sys_name is not None:
+            # like libudev, which reports "!" in the name as "/"
+            sys_name = ensure_unicode_string(sys_name).replace("/", "!")
+            column = store.columns["sys_path"]
+            strings = store.strings
+            rows = array(
+                "L",
+                (
+                    row
+                    for row in rows
+                    if os.path.basename(strings[column[row]]) == sys_name
+                ),
+            )
+        for prop, value in kwargs.items():
+            wanted_name = store.find_string(prop)
+            wanted_value = store.find_string(
+                ensure_unicode_string(property_value_to_bytes(value))
+            )
+            if wanted_name is None or wanted_value is None:
+                return DeviceTable(store, array("L"))
+            rows = array(
+                "L",
+                (
+                    row
+                    for row in rows
+                    if self._has_property(row, wanted_name, wanted_value)
+                ),
+            )
+        return DeviceTable(store, rows)
+
+    def _has_property(self, row, name, value):
+        """
+        Whether storage row ``row`` has the property with the interned
+        ``name`` and ``value`` indices.
+        """
+        store = self._store
+        names = store.property_names
+        for i in range(store.property_offsets[row], store.property_offsets[row + 1]):
+            if names[i] == name:
+                return store.property_values[i] == value
+        return False
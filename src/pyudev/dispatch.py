@@ -0,0 +1,598 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2026 pyudev contributors
+
+# This library is free software; you can redistribute it and/or modify it
+# under the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation; either version 2.1 of the License, or (at your
+# option) any later version.
+
+# This library is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE.  See the GNU Lesser General Public License
+# for more details.
+
+# You should have received a copy of the GNU Lesser General Public License
+# along with this library; if not, write to the Free Software Foundation,
+# Inc., 51 Franklin St, Fifth Floor, Boston, MA 02110-1301 USA
+"""
+pyudev.dispatch
+===============
+
+Queueing, debouncing and dispatch of device events to worker threads.
+
+.. versionadded:: 0.25
+"""
+
+import collections
+import sys
+import threading
+import time
+from operator import attrgetter
+
+# the default key, which orders events per device
+_device_path = attrgetter("device_path")
+
+
+class EventQueue:
+    """
+    A bounded, thread-safe queue of device events.
+
+    The queue holds at most ``capacity`` events.  If it is full, the
+    ``policy`` decides about a new event:
+
+    ``'block'`` (the default)
+      :meth:`put` waits until an event was taken from the queue.
+    ``'drop-oldest'``
+      The oldest event in the queue is dropped to make room.
+    ``'drop-newest'``
+      The new event is dropped.
+    ``'coalesce'``
+      Only the latest event of each key is kept, at the position of the
+      first queued event of that key.  A new event replaces the queued event
+      with the same key, even if the queue is not full.  If the queue is full
+      and no event with the same key is queued, :meth:`put` waits like with
+      ``'block'``.
+
+    The key of an event is the device path by default, so coalescing keeps
+    only the latest event of each device.  Note that consumers do not see
+    the replaced events, for instance an ``add`` followed by ``remove``
+    arrives as ``remove`` only.
+
+    Memory use is bounded by ``capacity``, no matter how fast events arrive:
+
+    >>> from pyudev import EventQueue
+    >>> events = EventQueue(capacity=2, policy='drop-oldest')
+    >>> for device in devices:
+    ...     events.put(device)
+    >>> events.dropped
+    3
+
+    This class is thread-safe.
+
+    .. versionadded:: 0.25
+    """
+
+    #: All available policies
+    POLICIES = frozenset(["block", "drop-oldest", "drop-newest", "coalesce"])
+
+    def __init__(self, capacity=1024, policy="block", key=None):
+        """
+        Create a new queue.
+
+        ``capacity`` is the maximum number of queued events, as positive
+        integer.  ``policy`` is one of :attr:`POLICIES`.  ``key`` is a
+        callable returning the key of the :class:`~pyudev.Device` given as
+        single argument, used by the ``'coalesce'`` policy.  If ``None``, the
+        device path is the key.
+
+        Raise :exc:`~exceptions.ValueError`, if ``capacity`` is not positive
+        or ``policy`` is unknown.
+        """
+        if capacity < 1:
+            raise ValueError(f"Invalid capacity: {capacity}")
+        if policy not in self.POLICIES:
+            raise ValueError(f"Invalid policy: {policy!r}")
+        self.capacity = capacity
+        self.policy = policy
+        self._key = _device_path if key is None else key
+        # the queued events, or their keys if coalescing
+        self._events = collections.deque()
+        # the latest event of each queued key, if coalescing
+        self._latest = {} if policy == "coalesce" else None
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+        self._not_full = threading.Condition(self._lock)
+        self._closed = False
+        self._enqueued = 0
+        self._dropped = 0
+        self._high_water = 0
+
+    @property
+    def enqueued(self):
+        """
+        The number of events put into this queue, as integer.
+
+        Dropped and replaced events are included.
+        """
+        return self._enqueued
+
+    @property
+    def dropped(self):
+        """
+        The number of events, which were dropped or replaced by a newer event
+        of the same key, as integer.
+        """
+        return self._dropped
+
+    @property
+    def high_water(self):
+        """
+        The largest number of events ever queued at once, as integer.
+        """
+        return self._high_water
+
+    @property
+    def closed(self):
+        """
+        ``True``, if this queue was closed, ``False`` otherwise.
+        """
+        return self._closed
+
+    def __len__(self):
+        """
+        Return the number of queued events as integer.
+        """
+        return len(self._events)
+
+    def put(self, device, timeout=None):
+        """
+        Put the event of ``device`` into this queue.
+
+        ``timeout`` is the maximum time in seconds to wait for room in a
+        full queue, as floating point number.  If ``None``, wait until room
+        is available.  It is ignored by the ``'drop-oldest'`` and
+        ``'drop-newest'`` policies, which never wait.
+
+        Return ``True``, if the event was queued, or ``False``, if it was
+        dropped, because the queue was full.  Raise
+        :exc:`~exceptions.RuntimeError`, if the queue is closed.
+        """
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("EventQueue is closed")
+            self._enqueued += 1
+            events = self._events
+            latest = self._latest
+            if latest is not None:
+                key = self._key(device)
+                if key in latest:
+                    latest[key] = device
+                    self._dropped += 1
+                    return True
+            if len(events) >= self.capacity:
+                if self.policy == "drop-newest":
+                    self._dropped += 1
+                    return False
+                if self.policy == "drop-oldest":
+                    events.popleft()
+                    self._dropped += 1
+                elif not self._wait_for_room(timeout):
+                    self._dropped += 1
+                    return False
+            if latest is not None:
+                if key in latest:
+                    # another producer queued the key while this one waited
+                    latest[key] = device
+                    self._dropped += 1
+                    return True
+                latest[key] = device
+                events.append(key)
+            else:
+                events.append(device)
+            self._high_water = max(self._high_water, len(events))
+            self._not_empty.notify()
+            return True
+
+    def _wait_for_room(self, timeout):
+        """
+        Wait until the queue is not full anymore.
+
+        Must be called with the lock held.  Return ``True``, if there is
+        room, ``False`` if a timeout occurred.  Raise
+        :exc:`~exceptions.RuntimeError`, if the queue was closed meanwhile.
+        """
+        ready = self._not_full.wait_for(
+            lambda: self._closed or len(self._events) < self.capacity, timeout
+        )
+        if self._closed:
+            raise RuntimeError("EventQueue is closed")
+        return ready
+
+    def get(self, timeout=None):
+        """
+        Take the oldest event from this queue.
+
+        ``timeout`` is the maximum time in seconds to wait for an event, as
+        floating point number.  If ``None``, wait until an event is
+        available.
+
+        Return the :class:`~pyudev.Device` of the event, or ``None`` if a
+        timeout occurred, or if the queue is closed and empty.
+        """
+        with self._lock:
+            events = self._events
+            if not self._not_empty.wait_for(lambda: events or self._closed, timeout):
+                return None
+            if not events:
+                return None
+            device = events.popleft()
+            if self._latest is not None:
+                device = self._latest.pop(device)
+            self._not_full.notify()
+            return device
+
+    def close(self):
+        """
+        Close this queue.
+
+        No events can be put into a closed queue anymore, but queued events
+        can still be taken.  Waiting calls of :meth:`get` return ``None``, once
+        the queue is empty.
+        """
+        with self._lock:
+            self._closed = True
+            self._not_empty.notify_all()
+            self._not_full.notify_all()
+
+
+class Debouncer:
+    """
+    Hold back device events for a short time, to collapse bursts of events.
+
+    Every event is held back for ``window`` seconds after the first held
+    event of the same device.  Meanwhile:
+
+    - repeated ``change`` events replace each other, so that only the latest
+      one is delivered,
+    - a ``remove`` cancels a held ``add`` of the same device, together with
+      the ``change`` events following it, and is dropped itself.
+
+    Other events are held back, too, to keep the events of each device in
+    order.  Events of different devices may be delivered in another order
+    than they occurred.
+
+    The debouncer holds no thread or timer of its own.  Events are passed to
+    :meth:`push`, and due events are taken with :meth:`flush`, which should
+    be called again after :meth:`timeout` seconds:
+
+    >>> from pyudev import Debouncer
+    >>> debouncer = Debouncer(window=0.5)
+    >>> while True:
+    ...     for device in monitor.poll_many(100, timeout=debouncer.timeout()):
+    ...         debouncer.push(device)
+    ...     for device in debouncer.flush():
+    ...         print('{0.action} on {0.device_path}'.format(device))
+
+    A :class:`~pyudev.MonitorObserver` created with ``debounce`` does this
+    in its poll loop.
+
+    This class is not thread-safe.
+
+    .. versionadded:: 0.25
+    """
+
+    def __init__(self, window=0.5, key=None, clock=time.monotonic):
+        """
+        Create a new debouncer.
+
+        ``window`` is the time in seconds to hold back events, as
+        non-negative floating point number.  ``key`` is a callable returning
+        the key of the :class:`~pyudev.Device` given as single argument.
+        Only events with equal keys are collapsed.  If ``None``, the device
+        path is the key.  ``clock`` is a callable returning the current time
+        in seconds.
+
+        Raise :exc:`~exceptions.ValueError`, if ``window`` is negative.
+        """
+        if window < 0:
+            raise ValueError(f"Invalid window: {window}")
+        self.window = window
+        self._key = _device_path if key is None else key
+        self._clock = clock
+        # the list of held events of each key
+        self._held = {}
+        # (deadline, key, events) of each held key, ordered by deadline; the
+        # entry is stale, if events is not the held list of key anymore
+        self._deadlines = collections.deque()
+        self._count = 0
+        self._collapsed = 0
+        self._cancelled = 0
+
+    @property
+    def collapsed(self):
+        """
+        The number of ``change`` events replaced by a later one, as integer.
+        """
+        return self._collapsed
+
+    @property
+    def cancelled(self):
+        """
+        The number of events dropped because of a ``remove`` following an
+        ``add``, including the ``remove`` events, as integer.
+        """
+        return self._cancelled
+
+    def __len__(self):
+        """
+        Return the number of held events as integer.
+        """
+        return self._count
+
+    def push(self, device, now=None):
+        """
+        Hold back the event of ``device``.
+
+        ``now`` is the time of the event in seconds, as returned by the
+        ``clock``.  If ``None``, the current time is used.
+        """
+        key = self._key(device)
+        events = self._held.get(key)
+        if events is None:
+            if now is None:
+                now = self._clock()
+            events = self._held[key] = [device]
+            self._deadlines.append((now + self.window, key, events))
+            self._count += 1
+            return
+        action = device.action
+        if action == "change" and events[-1].action == "change":
+            events[-1] = device
+            self._collapsed += 1
+            return
+        if action == "remove":
+            index = len(events) - 1
+            while index >= 0 and events[index].action == "change":
+                index -= 1
+            if index >= 0 and events[index].action == "add":
+                self._cancelled += len(events) - index + 1
+                self._count -= len(events) - index
+                del events[index:]
+                if not events:
+                    del self._held[key]
+                return
+        events.append(device)
+        self._count += 1
+
+    def timeout(self, now=None):
+        """
+        Return the time in seconds until the next held event is due, as
+        floating point number, or ``None`` if no events are held.
+
+        ``now`` is the current time, see :meth:`push`.
+        """
+        deadlines = self._deadlines
+        held = self._held
+        # drop stale entries of cancelled events
+        while deadlines and held.get(deadlines[0][1]) is not deadlines[0][2]:
+            deadlines.popleft()
+        if not deadlines:
+            return None
+        if now is None:
+            now = self._clock()
+        return max(deadlines[0][0] - now, 0)
+
+    def flush(self, now=None):
+        """
+        Take all due events.
+
+        ``now`` is the current time, see :meth:`push`.
+
+        Return a list of the :class:`~pyudev.Device` objects of all events,
+        which were held back for ``window`` seconds.  The events of each
+        device are in order.
+        """
+        if now is None:
+            now = self._clock()
+        return self._take(lambda deadline: deadline <= now)
+
+    def flush_all(self):
+        """
+        Take all held events, whether they are due or not.
+
+        Return a list of :class:`~pyudev.Device` objects, like :meth:`flush`.
+        """
+        return self._take(lambda deadline: True)
+
+    def _take(self, is_due):
+        due = []
+        deadlines = self._deadlines
+        held = self._held
+        while deadlines and is_due(deadlines[0][0]):
+            _, key, events = deadlines.popleft()
+            if held.get(key) is events:
+                del held[key]
+                due.extend(events)
+        self._count -= len(due)
+        return due
+
+
+class KeyedDispatcher:
+    """
+    Dispatch device events to a pool of worker threads.
+
+    Each event is assigned to a worker by its key, which is the
+    :attr:`~pyudev.Device.device_path` of the device by default.  Events
+    with equal keys are always handled by the same worker, in the order in
+    which they were dispatched, so ``add``, ``change`` and ``remove`` of a
+    device are never reordered.  Events with different keys are handled in
+    parallel, as far as the number of workers allows:
+
+    >>> from pyudev import KeyedDispatcher
+    >>> def handle_event(device):
+    ...     print('{0.action} on {0.device_path}'.format(device))
+    >>> dispatcher = KeyedDispatcher(handle_event, workers=4)
+    >>> dispatcher.start()
+    >>> dispatcher.dispatch(device)
+    >>> dispatcher.stop()
+
+    Usually, a dispatcher is created by a :class:`~pyudev.MonitorObserver`
+    with ``workers``.
+
+    Each worker takes its events from an :class:`EventQueue`, which is
+    unbounded by default.  Give a ``capacity`` and a ``policy`` to bound the
+    memory used while workers fall behind.
+
+    Exceptions raised by ``callback`` are reported to
+    :func:`threading.excepthook`, and do not stop the worker.
+
+    .. versionadded:: 0.25
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        callback,
+        workers=4,
+        key=None,
+        *,
+        name="pyudev-dispatcher",
+        capacity=None,
+        policy="block",
+    ):
+        """
+        Create a new dispatcher.
+
+        ``callback`` is invoked for each dispatched event with the
+        :class:`~pyudev.Device` of the event as single argument.  ``workers``
+        is the number of worker threads, as positive integer.
+
+        ``key`` is a callable, which returns the key of the
+        :class:`~pyudev.Device` given as single argument.  The key must be
+        hashable.  If ``None``, the device path is the key, so events are
+        ordered per device.  Pass a key like ``lambda d: d.subsystem`` to
+        order events of whole subsystems instead.
+
+        ``name`` is the prefix of the names of the worker threads.
+
+        ``capacity`` is the maximum number of events queued for each worker,
+        as positive integer, or ``None`` for no limit.  ``policy`` decides
+        about events for a full queue, see :class:`EventQueue`.  Coalescing
+        uses ``key`` as well.
+
+        Raise :exc:`~exceptions.ValueError`, if ``workers`` or ``capacity``
+        is not positive, or if ``policy`` is unknown.
+        """
+        if workers < 1:
+            raise ValueError(f"Invalid number of workers: {workers}")
+        self.workers = workers
+        self.name = name
+        self._callback = callback
+        self._key = _device_path if key is None else key
+        self._lock = threading.Lock()
+        self._queues = tuple(
+            EventQueue(sys.maxsize if capacity is None else capacity, policy, key)
+            for _ in range(workers)
+        )
+        self._threads = ()
+        self._stopped = False
+
+    @property
+    def started(self):
+        """
+        ``True``, if the workers are running, ``False`` otherwise.
+        """
+        return bool(self._threads) and not self._stopped
+
+    @property
+    def queues(self):
+        """
+        The :class:`EventQueue` of each worker, as tuple.
+
+        Use their counters to see whether the workers keep up with events.
+        """
+        return self._queues
+
+    def start(self):
+        """
+        Start the worker threads.
+
+        The workers are daemon threads.  This method does nothing, if the
+        dispatcher is already started.  Raise :exc:`~exceptions.RuntimeError`,
+        if the dispatcher was stopped.
+        """
+        with self._lock:
+            if self._stopped:
+                raise RuntimeError("Dispatcher is stopped")
+            if self._threads:
+                return
+            threads = []
+            for index, events in enumerate(self._queues):
+                thread = threading.Thread(
+                    target=self._work, args=(events,), name=f"{self.name}-{index}"
+                )
+                thread.daemon = True
+                threads.append(thread)
+            self._threads = tuple(threads)
+        for thread in self._threads:
+            thread.start()
+
+    def dispatch(self, device):
+        """
+        Hand the event of ``device`` to the worker for its key.
+
+        Return without waiting for the callback, but wait for room in the
+        queue of the worker with the ``'block'`` and ``'coalesce'`` policies.
+        Return ``True``, if the event was queued, or ``False``, if it was
+        dropped.  Raise :exc:`~exceptions.RuntimeError`, if the dispatcher is
+        not started.
+        """
+        if not self.started:
+            raise RuntimeError("Dispatcher is not started")
+        queues = self._queues
+        return queues[hash(self._key(device)) % len(queues)].put(device)
+
+    def stop(self):
+        """
+        Stop the worker threads.
+
+        Events which were already dispatched are still handled.  Afterwards
+        wait for all workers to exit, unless this method is called by a
+        worker itself.  After this method returns in a thread which is not a
+        worker, the callback is not invoked anymore.
+
+        This method does nothing, if the dispatcher was already stopped.
+        """
+        with self._lock:
+            if self._stopped:
+                return
+            self._stopped = True
+        for events in self._queues:
+            events.close()
+        current = threading.current_thread()
+        for thread in self._threads:
+            if thread is not current:
+                thread.join()
+
+    def in_worker(self):
+        """
+        Whether the calling thread is a worker of this dispatcher.
+        """
+        return threading.current_thread() in self._threads
+
+    def _work(self, events):
+        """
+        Handle the events from ``events`` until asked to stop.
+        """
+        callback = self._callback
+        while True:
+            device = events.get()
+            if device is None:
+                return
+            try:
+                callback(device)
+            except Exception:
+                threading.excepthook(
+                    threading.ExceptHookArgs(
+                        (*sys.exc_info(), threading.current_thread())
+                    )
+                )
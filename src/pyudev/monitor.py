@@ -23,14 +23,84 @@
 .. moduleauthor::  Sebastian Wiesner  <lunaryorn@gmail.com>
 """
 
+import collections
 import errno
+import math
 import os
-from functools import partial
+import socket
 from threading import Thread
 
+from pyudev._monitor import (
+    REORDER_WINDOW,
+    MonitorStats,
+    SequenceTracker,
+    receive_queue,
+    remaining_timeout,
+    socket_error,
+    timeout_deadline,
+)
 from pyudev._os import pipe, poll
-from pyudev._util import eintr_retry_call, ensure_byte_string
+from pyudev._util import eintr_retry_call, ensure_byte_string, ensure_unicode_string
 from pyudev.device import Device
+from pyudev.dispatch import Debouncer, KeyedDispatcher
+
+
+def _filter_string(value, kind):
+    """
+    Return the filter ``value`` as byte string.
+
+    ``kind`` names the kind of filter for error messages.
+
+    Raise :exc:`~exceptions.ValueError`, if ``value`` is not a string, or
+    is empty or contains a null byte.
+    """
+    if not isinstance(value, (str, bytes)):
+        raise ValueError(f"Invalid {kind}: {value!r}")
+    value = ensure_byte_string(value)
+    if not value or b"\0" in value:
+        raise ValueError(f"Invalid {kind}: {value!r}")
+    return value
+
+
+def _subsystem_filter(subsystem):
+    """
+    Return the subsystem filter ``subsystem`` as pair of byte strings
+    ``(subsystem, device_type)``, where ``device_type`` may be ``None``.
+
+    Raise :exc:`~exceptions.ValueError`, if ``subsystem`` is invalid.
+    """
+    if isinstance(subsystem, (str, bytes)):
+        return _filter_string(subsystem, "subsystem"), None
+    try:
+        subsystem, device_type = subsystem
+    except (TypeError, ValueError):
+        raise ValueError(f"Invalid subsystem: {subsystem!r}") from None
+    if device_type is not None:
+        device_type = _filter_string(device_type, "device type")
+    return _filter_string(subsystem, "subsystem"), device_type
+
+
+def _count(counter):
+    """
+    Return ``counter`` of byte strings as dictionary with unicode strings.
+    """
+    return {
+        None if key is None else ensure_unicode_string(key): count
+        for key, count in counter.items()
+    }
+
+
+def _matches_subsystem(device, subsystem, device_type):
+    """
+    Whether ``device`` has the given ``subsystem`` and ``device_type`` as
+    byte strings.  If ``device_type`` is ``None``, any device type matches.
+    """
+    if ensure_byte_string(device.subsystem or "") != subsystem:
+        return False
+    return (
+        device_type is None
+        or ensure_byte_string(device.device_type or "") == device_type
+    )
 
 
 class Monitor:
@@ -78,6 +148,24 @@ def __init__(self, context, monitor_p):
         self._as_parameter_ = monitor_p
         self._libudev = context._libudev
         self._started = False
+        # created on first use, and reused by all subsequent waits
+        self._poller = None
+        # compiled DevicePredicate, see set_predicate()
+        self._predicate = None
+        # installed filters and settings, to restore them in reopen()
+        self._source = "udev"
+        self._subsystem_filters = {}
+        self._tag_filters = {}
+        self._receive_buffer_size = None
+        # created by _track_sequence()
+        self._sequence = None
+        self._overflows = 0
+        # an error raised while receiving, after poll_many() received devices
+        self._pending_error = None
+        self._received = 0
+        self._rejected = 0
+        # counters of subsystems and actions, created by stats()
+        self._event_counts = None
 
     def __del__(self):
         self._libudev.udev_monitor_unref(self)
@@ -114,7 +202,32 @@ def from_netlink(cls, context, source="udev"):
         )
         if not monitor:
             raise EnvironmentError("Could not create udev monitor")
-        return cls(context, monitor)
+        monitor = cls(context, monitor)
+        monitor._source = source
+        return monitor
+
+    def _track_sequence(self):
+        """
+        Detect events missing from the sequence numbers of received events.
+
+        Sequence numbers are only tracked once requested, by :meth:`stats`
+        or a :class:`~pyudev.MonitorObserver` with ``resync``, to keep
+        receiving cheap otherwise.
+
+        Return the tracker of sequence numbers.
+        """
+        if self._sequence is None:
+            # the kernel sends events in order, udev may reorder them
+            window = 0 if self._source == "kernel" else REORDER_WINDOW
+            self._sequence = SequenceTracker(window)
+        return self._sequence
+
+    @property
+    def _filtered(self):
+        """
+        Whether filters are installed.
+        """
+        return bool(self._subsystem_filters or self._tag_filters)
 
     @property
     def started(self):
@@ -161,6 +274,7 @@ def filter_by(self, subsystem, device_type=None):
         self._libudev.udev_monitor_filter_add_match_subsystem_devtype(
             self, subsystem, device_type
         )
+        self._subsystem_filters[subsystem, device_type] = None
         self._libudev.udev_monitor_filter_update(self)
 
     def filter_by_tag(self, tag):
@@ -182,7 +296,9 @@ def filter_by_tag(self, tag):
         .. versionchanged:: 0.15
            This method can also be after :meth:`start()` now.
         """
-        self._libudev.udev_monitor_filter_add_match_tag(self, ensure_byte_string(tag))
+        tag = ensure_byte_string(tag)
+        self._libudev.udev_monitor_filter_add_match_tag(self, tag)
+        self._tag_filters[tag] = None
         self._libudev.udev_monitor_filter_update(self)
 
     def remove_filter(self):
@@ -203,8 +319,81 @@ def remove_filter(self):
         .. versionadded:: 0.15
         """
         self._libudev.udev_monitor_filter_remove(self)
+        self._subsystem_filters = {}
+        self._tag_filters = {}
         self._libudev.udev_monitor_filter_update(self)
 
+    def set_filters(self, subsystems=(), tags=()):
+        """
+        Replace all filters of this monitor.
+
+        ``subsystems`` is an iterable of subsystems, each given either as
+        byte or unicode string, or as pair ``(subsystem, device_type)``, like
+        the arguments of :meth:`filter_by`.  ``tags`` is an iterable of tags
+        as byte or unicode strings, like the argument of
+        :meth:`filter_by_tag`:
+
+        >>> monitor.set_filters(
+        ...     subsystems=['input', ('usb', 'usb_device')], tags=['seat'])
+
+        Unlike with repeated calls of :meth:`filter_by` and
+        :meth:`filter_by_tag`, the filter of the socket is compiled and
+        installed only once, for all filters together.  Duplicate filters
+        are installed once.  If ``subsystems`` and ``tags`` are both empty,
+        all filters are removed.
+
+        All filters are validated, before any of them is installed.  Raise
+        :exc:`~exceptions.ValueError`, if a filter is not a string or pair,
+        or if a string is empty or contains a null byte; the filters of this
+        monitor are unchanged then.  Raise
+        :exc:`~exceptions.EnvironmentError`, if the filters could not be
+        installed; this monitor has no filters then.
+
+        .. note::
+
+           Filters installed before are removed with
+           ``udev_monitor_filter_remove()``, so a started monitor receives
+           all events for a short time, until the new filters are installed.
+           See :meth:`remove_filter` for issues of this function.
+
+        .. versionadded:: 0.25
+        """
+        subsystem_matches = dict.fromkeys(
+            _subsystem_filter(subsystem) for subsystem in subsystems
+        )
+        tag_matches = dict.fromkeys(_filter_string(tag, "tag") for tag in tags)
+        if self._filtered:
+            self._libudev.udev_monitor_filter_remove(self)
+            self._subsystem_filters = {}
+            self._tag_filters = {}
+        self._install_filters(subsystem_matches, tag_matches)
+
+    def _install_filters(self, subsystem_matches, tag_matches):
+        """
+        Install the given filters with a single update.
+
+        ``subsystem_matches`` and ``tag_matches`` are dictionaries with the
+        validated filters as keys, see :meth:`set_filters`.  This monitor
+        must not have any filters.
+        """
+        if not subsystem_matches and not tag_matches:
+            return
+        libudev = self._libudev
+        try:
+            for subsystem, device_type in subsystem_matches:
+                libudev.udev_monitor_filter_add_match_subsystem_devtype(
+                    self, subsystem, device_type
+                )
+            for tag in tag_matches:
+                libudev.udev_monitor_filter_add_match_tag(self, tag)
+            libudev.udev_monitor_filter_update(self)
+        except Exception:
+            # drop the matches staged so far
+            libudev.udev_monitor_filter_remove(self)
+            raise
+        self._subsystem_filters = subsystem_matches
+        self._tag_filters = tag_matches
+
     def enable_receiving(self):
         """
         Switch the monitor into listing mode.
@@ -278,10 +467,155 @@ def set_receive_buffer_size(self, size):
         .. _python-prctl: http://packages.python.org/python-prctl
         """
         self._libudev.udev_monitor_set_receive_buffer_size(self, size)
+        self._receive_buffer_size = size
+
+    def reopen(self):
+        """
+        Replace the socket of this monitor with a new one.
+
+        Use this method to recover from errors of the socket.  Filters, the
+        receive buffer size and the predicate of this monitor are kept, and
+        the new socket is started, if this monitor was started.  Events sent
+        while the socket is replaced are lost.
+
+        Note that the :meth:`fileno` of this monitor changes.
+
+        Raise :exc:`~exceptions.EnvironmentError`, if the new socket could
+        not be created.
+
+        .. versionadded:: 0.25
+        """
+        monitor_p = self._libudev.udev_monitor_new_from_netlink(
+            self.context, ensure_byte_string(self._source)
+        )
+        if not monitor_p:
+            raise EnvironmentError("Could not create udev monitor")
+        old_monitor_p = self._as_parameter_
+        self._as_parameter_ = monitor_p
+        self._libudev.udev_monitor_unref(old_monitor_p)
+        self._poller = None
+        self._pending_error = None
+        if self._sequence is not None:
+            self._sequence.reset()
+        started = self._started
+        self._started = False
+        subsystem_matches = self._subsystem_filters
+        tag_matches = self._tag_filters
+        self._subsystem_filters = {}
+        self._tag_filters = {}
+        self._install_filters(subsystem_matches, tag_matches)
+        if self._receive_buffer_size is not None:
+            self.set_receive_buffer_size(self._receive_buffer_size)
+        if started:
+            self.start()
+
+    def _socket(self):
+        """
+        Return a :class:`~socket.socket` for a duplicate of the file
+        descriptor of this monitor, to query socket options.
+        """
+        return socket.socket(fileno=os.dup(self.fileno()))
+
+    def stats(self):
+        """
+        Return statistics of this monitor.
+
+        Use this method to check, whether the receive buffer is large enough
+        for the rate of events, see :meth:`set_receive_buffer_size`.  Events
+        are counted since this monitor was created, but subsystems, actions
+        and lost events only since the first call of this method, to not
+        slow down monitors whose statistics are never read.  This method can be called
+        from any thread, for instance while a :class:`MonitorObserver`
+        receives events.
+
+        Return a :class:`MonitorStats` object.  As libudev does not expose
+        the received messages, its ``bytes`` are ``None``.
+
+        .. versionadded:: 0.25
+        """
+        with self._socket() as sock:
+            backlog, receive_buffer_size = receive_queue(sock)
+        if self._event_counts is None:
+            self._event_counts = (collections.Counter(), collections.Counter())
+        subsystems, actions = self._event_counts
+        return MonitorStats(
+            self._received,
+            self._rejected,
+            None,
+            self._overflows,
+            self._track_sequence().lost,
+            backlog,
+            receive_buffer_size,
+            _count(dict(subsystems)),
+            _count(dict(actions)),
+        )
+
+    def _take_error(self):
+        """
+        Return and clear the pending error of the socket of this monitor.
+
+        Return the error number, or ``0`` if there is no pending error.
+        """
+        with self._socket() as sock:
+            errnum = sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR)
+        if errnum == errno.ENOBUFS:
+            self._overflows += 1
+        return errnum
+
+    def list_devices(self):
+        """
+        Enumerate the devices, whose events pass the filters of this monitor.
+
+        Use this method to rebuild the state of an application, after events
+        were lost.  Only the subsystem, device type and tag filters are
+        applied, not the predicate.
+
+        Return a list of :class:`Device` objects.
+
+        .. versionadded:: 0.25
+        """
+        enumerator = self.context.list_devices()
+        for subsystem, _ in self._subsystem_filters:
+            enumerator.match_subsystem(subsystem)
+        devices = []
+        for device in enumerator:
+            if self._subsystem_filters and not any(
+                _matches_subsystem(device, subsystem, device_type)
+                for subsystem, device_type in self._subsystem_filters
+            ):
+                continue
+            if self._tag_filters and not any(
+                ensure_byte_string(tag) in self._tag_filters for tag in device.tags
+            ):
+                continue
+            devices.append(device)
+        return devices
+
+    def set_predicate(self, predicate):
+        """
+        Filter incoming events in user space by ``predicate``.
+
+        ``predicate`` is a :class:`DevicePredicate`.  Events of devices which
+        do not match ``predicate`` are dropped, before a :class:`Device` is
+        created for them.  If ``None``, a previously set predicate is
+        removed.
+
+        Use :meth:`filter_by` and :meth:`filter_by_tag` in addition, to drop
+        events in the kernel already.  Only events passing these filters are
+        evaluated by ``predicate``.
+
+        .. versionadded:: 0.25
+        """
+        self._predicate = (
+            None if predicate is None else predicate.compile(self._libudev)
+        )
 
     def _receive_device(self):
         """Receive a single device from the monitor.
 
+        Events of devices rejected by the predicate set with
+        :meth:`set_predicate` are skipped.
+
         Return the received :class:`Device`, or ``None`` if no device could be
         received.
 
@@ -289,7 +623,6 @@ def _receive_device(self):
         while True:
             try:
                 device_p = self._libudev.udev_monitor_receive_device(self)
-                return Device(self.context, device_p) if device_p else None
             except EnvironmentError as error:
                 if error.errno in (errno.EAGAIN, errno.EWOULDBLOCK):
                     # No data available
@@ -299,7 +632,27 @@ def _receive_device(self):
                     # Try again if our system call was interrupted
                     continue
 
+                if error.errno == errno.ENOBUFS:
+                    self._overflows += 1
+
                 raise
+            if not device_p:
+                return None
+            libudev = self._libudev
+            self._received += 1
+            if self._sequence is not None and not self._filtered:
+                # with filters, missing sequence numbers are expected
+                self._sequence.update(libudev.udev_device_get_seqnum(device_p))
+            predicate = self._predicate
+            if predicate is not None and not predicate(device_p):
+                self._rejected += 1
+                libudev.udev_device_unref(device_p)
+                continue
+            if self._event_counts is not None:
+                subsystems, actions = self._event_counts
+                subsystems[libudev.udev_device_get_subsystem(device_p)] += 1
+                actions[libudev.udev_device_get_action(device_p)] += 1
+            return Device(self.context, device_p)
 
     def poll(self, timeout=None):
         """
@@ -345,13 +698,101 @@ def poll(self, timeout=None):
 
         .. versionadded:: 0.16
         """
+        self.start()
+        self._raise_pending_error()
+        deadline = timeout_deadline(timeout)
+        while self._wait(timeout):
+            device = self._receive_device()
+            if device is not None or self._predicate is None:
+                return device
+            # all pending events were rejected, wait for the next one
+            timeout = remaining_timeout(deadline, timeout)
+        return None
+
+    def poll_many(self, max_events, timeout=None):
+        """
+        Poll for many device events at once.
+
+        Wait like :meth:`poll` until an event is available, and then receive
+        all immediately available events, but at most ``max_events``, without
+        waiting again::
+
+           while True:
+               for device in monitor.poll_many(100):
+                   print('{0.action} on {0.device_path}'.format(device))
+
+        Compared to a loop over :meth:`poll`, this saves a system call per
+        event, if many events arrive in a short time.
+
+        ``max_events`` is the maximum number of events to receive, as
+        positive integer.  ``timeout`` is a floating point number that
+        specifies a time-out in seconds, like for :meth:`poll`.
+
+        .. note::
+
+           This method implicitly calls :meth:`start()`.
+
+        Return a list of the received :class:`Device` objects, in the order
+        of their events.  The list is empty, if a timeout occurred.  Raise
+        :exc:`~exceptions.ValueError`, if ``max_events`` is not positive.
+        Raise :exc:`~exceptions.EnvironmentError` if event retrieval failed.
+
+        .. versionadded:: 0.25
+        """
+        if max_events < 1:
+            raise ValueError(f"Invalid max_events: {max_events}")
+        self.start()
+        self._raise_pending_error()
+        devices = []
+        deadline = timeout_deadline(timeout)
+        while self._wait(timeout):
+            while len(devices) < max_events:
+                try:
+                    device = self._receive_device()
+                except EnvironmentError as error:
+                    if not devices:
+                        raise
+                    # return the received devices first
+                    self._pending_error = error
+                    break
+                if device is None:
+                    break
+                devices.append(device)
+            if devices or self._predicate is None:
+                break
+            # all pending events were rejected, wait for the next one
+            timeout = remaining_timeout(deadline, timeout)
+        return devices
+
+    def _raise_pending_error(self):
+        """
+        Raise the error deferred by :meth:`poll_many`, if any.
+        """
+        error = self._pending_error
+        if error is not None:
+            self._pending_error = None
+            raise error
+
+    def _wait(self, timeout):
+        """
+        Wait until this monitor is readable.
+
+        ``timeout`` is the time-out in seconds, see :meth:`poll`.  The monitor
+        must be started.
+
+        Return ``True``, if the monitor is readable, ``False`` if a timeout
+        occurred.
+        """
         if timeout is not None and timeout > 0:
             # .poll() takes timeout in milliseconds
             timeout = int(timeout * 1000)
-        self.start()
-        if eintr_retry_call(poll.Poll.for_events((self, "r")).poll, timeout):
-            return self._receive_device()
-        return None
+        if self._poller is None:
+            # the file descriptor does not change once the monitor is started
+            self._poller = poll.Poll.for_events((self, "r"))
+        try:
+            return bool(eintr_retry_call(self._poller.poll, timeout))
+        except EnvironmentError as error:
+            raise socket_error(self, error) from None
 
     def receive_device(self):
         """
@@ -470,7 +911,27 @@ class MonitorObserver(Thread):
        :meth:`Monitor.start()` is implicitly called when the thread is started.
     """
 
-    def __init__(self, monitor, event_handler=None, callback=None, *args, **kwargs):
+    # maximum number of events received at once
+    _BATCH_SIZE = 64
+
+    # maximum number of consecutive errors, which are recovered from
+    _MAX_FAILURES = 3
+
+    def __init__(  # noqa: PLR0913
+        self,
+        monitor,
+        event_handler=None,
+        callback=None,
+        *args,
+        workers=None,
+        key=None,
+        capacity=None,
+        policy="block",
+        debounce=None,
+        resync=None,
+        reenumerate=False,
+        **kwargs,
+    ):
         """
         Create a new observer for the given ``monitor``.
 
@@ -483,6 +944,44 @@ def __init__(self, monitor, event_handler=None, callback=None, *args, **kwargs):
            ``callback`` is invoked in the observer thread, hence the observer
            is blocked while callback executes.
 
+        If ``workers`` is given, ``callback`` is instead invoked by a
+        :class:`KeyedDispatcher` with the given number of worker threads, so
+        that a slow callback does not block the observer.  Events with equal
+        ``key`` are handled in order, see :class:`KeyedDispatcher`.  The
+        workers are stopped together with the observer.  ``capacity`` and
+        ``policy`` bound the events queued for each worker, see
+        :class:`EventQueue`.  Without ``workers`` they are ignored.
+
+        If ``debounce`` is given, events are held back for ``debounce``
+        seconds by a :class:`Debouncer`, to collapse bursts of ``change``
+        events and to cancel ``add`` events followed by ``remove``.  Held
+        events are delivered, when the observer is stopped.
+
+        If ``resync`` is given, the observer recovers from lost events
+        instead of exiting with an error.  ``resync`` is invoked in the
+        observer thread with the signature ``resync(reason, devices)``, after
+        the events received so far were passed to ``callback``.  With
+        ``workers``, these events are only queued for the workers, and may
+        still be handled while or after ``resync`` runs.  ``reason`` is one
+        of:
+
+        ``'overflow'``
+           The receive buffer of the monitor overflowed, and events were
+           dropped by the kernel.
+        ``'gap'``
+           Events are missing from the :attr:`Device.sequence_number` of the
+           received events.  Gaps are only detected, if the monitor has no
+           filters.
+        ``'error'``
+           Receiving failed with another error, and the socket of the
+           monitor was reopened with :meth:`Monitor.reopen`.  If this fails,
+           or if errors keep occurring, the observer exits with the error.
+
+        If ``reenumerate`` is ``True``, ``devices`` is the list of current
+        devices passing the filters of the monitor, see
+        :meth:`Monitor.list_devices`, to rebuild the state of an
+        application.  Otherwise ``devices`` is ``None``.
+
         ``args`` and ``kwargs`` are passed unchanged to the constructor of
         :class:`~threading.Thread`.
 
@@ -491,6 +990,9 @@ def __init__(self, monitor, event_handler=None, callback=None, *args, **kwargs):
            the ``callback`` argument instead.
         .. versionchanged:: 0.16
            Add ``callback`` argument.
+        .. versionchanged:: 0.25
+           Add ``workers``, ``key``, ``capacity``, ``policy``,
+           ``debounce``, ``resync`` and ``reenumerate`` arguments.
         """
         if callback is None and event_handler is None:
             raise ValueError("callback missing")
@@ -511,35 +1013,166 @@ def __init__(self, monitor, event_handler=None, callback=None, *args, **kwargs):
                 DeprecationWarning,
             )
             callback = lambda d: event_handler(d.action, d)
+        self._dispatcher = None
+        if workers is not None:
+            self._dispatcher = KeyedDispatcher(
+                callback,
+                workers,
+                key,
+                name=f"{self.name}-worker",
+                capacity=capacity,
+                policy=policy,
+            )
+            callback = self._dispatcher.dispatch
         self._callback = callback
+        self._debouncer = None if debounce is None else Debouncer(debounce)
+        if reenumerate and not hasattr(monitor, "list_devices"):
+            raise ValueError("Monitor cannot enumerate devices")
+        self._resync = resync
+        if resync is not None and hasattr(monitor, "_track_sequence"):
+            monitor._track_sequence()
+        self._reenumerate = reenumerate
+        self._notifier = None
+        self._failures = 0
+
+    @property
+    def dispatcher(self):
+        """
+        The :class:`KeyedDispatcher` invoking the callback, or ``None`` if
+        the callback is invoked by the observer thread.
+
+        .. versionadded:: 0.25
+        """
+        return self._dispatcher
+
+    @property
+    def debouncer(self):
+        """
+        The :class:`Debouncer` holding back events, or ``None`` if events are
+        not debounced.
+
+        .. versionadded:: 0.25
+        """
+        return self._debouncer
 
     def start(self):
         """Start the observer thread."""
         if not self.is_alive():
             self._stop_event = pipe.Pipe.open()
+            if self._dispatcher is not None:
+                self._dispatcher.start()
         Thread.start(self)
 
     def run(self):
-        self.monitor.start()
-        notifier = poll.Poll.for_events(
+        try:
+            self._observe()
+        finally:
+            if self._dispatcher is not None:
+                self._dispatcher.stop()
+
+    def _watch(self):
+        """
+        Create the poll object watching the monitor and the stop event.
+        """
+        self._notifier = poll.Poll.for_events(
             (self.monitor, "r"), (self._stop_event.source, "r")
         )
+
+    def _observe(self):
+        self.monitor.start()
+        self._watch()
+        debouncer = self._debouncer
+        timeout = None
         while True:
-            for file_descriptor, event in eintr_retry_call(notifier.poll):
+            if debouncer is not None:
+                timeout = debouncer.timeout()
+                if timeout is not None:
+                    # .poll() takes timeout in milliseconds
+                    timeout = math.ceil(timeout * 1000)
+            try:
+                events = eintr_retry_call(self._notifier.poll, timeout)
+            except EnvironmentError as error:
+                self._recover(socket_error(self.monitor, error))
+                continue
+            for file_descriptor, event in events:
                 if file_descriptor == self._stop_event.source.fileno():
                     # in case of a stop event, close our pipe side, and
                     # return from the thread
                     self._stop_event.source.close()
+                    if debouncer is not None:
+                        self._deliver(debouncer.flush_all())
                     return
 
                 if file_descriptor == self.monitor.fileno() and event == "r":
-                    read_device = partial(
-                        eintr_retry_call, self.monitor.poll, timeout=0
-                    )
-                    for device in iter(read_device, None):
-                        self._callback(device)
+                    self._receive_pending()
                 else:
                     raise EnvironmentError("Observed monitor hung up")
+            if debouncer is not None:
+                self._deliver(debouncer.flush())
+
+    def _deliver(self, devices):
+        for device in devices:
+            self._callback(device)
+
+    def _receive_pending(self):
+        """
+        Receive all pending events from the monitor, and invoke the callback
+        for each of them.
+        """
+        handle = self._callback if self._debouncer is None else self._debouncer.push
+        sequence = getattr(self.monitor, "_sequence", None)
+        while True:
+            lost = 0 if sequence is None else sequence.lost
+            try:
+                devices = self.monitor.poll_many(self._BATCH_SIZE, timeout=0)
+            except EnvironmentError as error:
+                self._recover(error)
+                return
+            self._failures = 0
+            for device in devices:
+                handle(device)
+            if sequence is not None and sequence.lost > lost and self._resync:
+                self._resynchronize("gap")
+            if len(devices) < self._BATCH_SIZE and not getattr(
+                self.monitor, "_pending_error", None
+            ):
+                # without a deferred error, all pending events were received
+                return
+
+    def _recover(self, error):
+        """
+        Recover from ``error`` raised by the monitor, and invoke the
+        ``resync`` callback.
+
+        Raise ``error``, if there is no ``resync`` callback, or if the
+        monitor cannot recover from it.
+        """
+        if self._resync is None:
+            raise error
+        if error.errno == errno.ENOBUFS:
+            # the socket is still usable, only events were dropped
+            self._resynchronize("overflow")
+            return
+        self._failures += 1
+        if self._failures > self._MAX_FAILURES or not hasattr(self.monitor, "reopen"):
+            raise error
+        self.monitor.reopen()
+        self._watch()
+        self._resynchronize("error")
+
+    def _resynchronize(self, reason):
+        """
+        Invoke the ``resync`` callback for ``reason``.
+        """
+        if self._debouncer is not None:
+            # handle held events first, as they precede the resync
+            self._deliver(self._debouncer.flush_all())
+        sequence = getattr(self.monitor, "_sequence", None)
+        if sequence is not None:
+            # the missing events are covered by this resync
+            sequence.reset()
+        devices = self.monitor.list_devices() if self._reenumerate else None
+        self._resync(reason, devices)
 
     def send_stop(self):
         """
@@ -581,10 +1214,16 @@ def stop(self):
 
            The underlying :attr:`monitor` is *not* stopped.
 
+        With ``workers``, events which were already received are still
+        handled before the observer thread exits.  Calling this method from a
+        worker is equivalent to :meth:`send_stop()`.
+
         .. versionchanged:: 0.16
            This method can be called from the observer thread.
         """
         self.send_stop()
+        if self._dispatcher is not None and self._dispatcher.in_worker():
+            return
         try:
             self.join()
         except RuntimeError:
@@ -0,0 +1,551 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2026 pyudev contributors
+
+# This library is free software; you can redistribute it and/or modify it
+# under the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation; either version 2.1 of the License, or (at your
+# option) any later version.
+
+# This library is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE.  See the GNU Lesser General Public License
+# for more details.
+
+# You should have received a copy of the GNU Lesser General Public License
+# along with this library; if not, write to the Free Software Foundation,
+# Inc., 51 Franklin St, Fifth Floor, Boston, MA 02110-1301 USA
+"""
+pyudev.netlink
+==============
+
+A device monitor in pure Python.
+
+:class:`NetlinkMonitor` receives device events directly from the netlink
+socket, without libudev.
+
+.. versionadded:: 0.25
+"""
+
+import collections
+import errno
+import socket
+import struct
+import sys
+
+from pyudev._monitor import (
+    REORDER_WINDOW,
+    MonitorStats,
+    SequenceTracker,
+    receive_queue,
+    remaining_timeout,
+    socket_error,
+    timeout_deadline,
+)
+from pyudev._os import poll
+from pyudev._util import eintr_retry_call, ensure_unicode_string
+
+#: The netlink protocol of device events
+NETLINK_KOBJECT_UEVENT = 15
+
+# the multicast groups of the event sources
+_GROUPS = {"kernel": 1, "udev": 2}
+
+# from linux/socket.h, not exported by the socket module
+_SO_RCVBUFFORCE = getattr(socket, "SO_RCVBUFFORCE", 33)
+
+# the header of events sent by udev, see struct monitor_netlink_header in
+# libudev; the magic and the hashes are in network byte order
+_UDEV_HEADER = struct.Struct("=8sIIIIIIII")
+_UDEV_PREFIX = b"libudev\0"
+_UDEV_MAGIC = 0xFEEDCAFE
+
+# struct ucred, passed along with each message
+_CREDENTIALS = struct.Struct("=iII")
+_ANCILLARY_SIZE = socket.CMSG_SPACE(_CREDENTIALS.size)
+
+_ENCODING = sys.getfilesystemencoding()
+_ENCODING_ERRORS = sys.getfilesystemencodeerrors()
+
+
+def murmur_hash2(data, seed=0):
+    """
+    Return the 32 bit MurmurHash2 of the byte string ``data``.
+
+    udev hashes the subsystem and device type of each event with this
+    function, to let clients filter events without parsing them.
+    """
+    m = 0x5BD1E995
+    length = len(data)
+    h = (seed ^ length) & 0xFFFFFFFF
+    end = length - length % 4
+    for (word,) in struct.iter_unpack("=I", data[:end]):
+        k = (word * m) & 0xFFFFFFFF
+        k ^= k >> 24
+        k = (k * m) & 0xFFFFFFFF
+        h = ((h * m) & 0xFFFFFFFF) ^ k
+    tail = data[end:]
+    if tail:
+        for index in reversed(range(len(tail))):
+            h ^= tail[index] << (8 * index)
+        h = (h * m) & 0xFFFFFFFF
+    h ^= h >> 13
+    h = (h * m) & 0xFFFFFFFF
+    h ^= h >> 15
+    return h
+
+
+def string_bloom64(data):
+    """
+    Return the 64 bit bloom filter of the byte string ``data``.
+
+    udev combines the bloom filters of all tags of a device in the header of
+    each event.
+    """
+    h = murmur_hash2(data)
+    return (
+        1 << (h & 63)
+        | 1 << ((h >> 6) & 63)
+        | 1 << ((h >> 12) & 63)
+        | 1 << ((h >> 18) & 63)
+    )
+
+
+UeventRecord = collections.namedtuple(
+    "UeventRecord",
+    "source action device_path subsystem device_type sequence_number properties",
+)
+UeventRecord.__doc__ = """
+A device event received by a :class:`NetlinkMonitor`.
+
+``source`` is ``'udev'`` or ``'kernel'``.  ``action``, ``device_path``,
+``subsystem`` and ``device_type`` are unicode strings, or ``None`` if the
+event lacks them.  ``sequence_number`` is an integer, and ``properties`` a
+dictionary of all properties of the event, including those above.
+"""
+
+
+class NetlinkMonitor:
+    """
+    A device event monitor, which reads the netlink socket itself.
+
+    This monitor has the same interface as :class:`~pyudev.Monitor`, so it
+    can be used with :class:`~pyudev.MonitorObserver` or
+    :class:`~pyudev.aio.AsyncMonitor`.  Instead of :class:`~pyudev.Device`
+    objects, it returns an :class:`UeventRecord` for each event:
+
+    >>> from pyudev.netlink import NetlinkMonitor
+    >>> monitor = NetlinkMonitor.from_netlink()
+    >>> monitor.filter_by('block')
+    >>> for record in iter(monitor.poll, None):
+    ...     print('{0.action} on {0.device_path}'.format(record))
+
+    Events are received into a preallocated buffer and parsed in place.  No
+    libudev objects are created, and properties are decoded all at once.
+    Events of udev are first filtered by the hashes in their header, so
+    events of other subsystems or without matching tags are dropped without
+    parsing.  Unlike with :class:`~pyudev.Monitor`, all filters are
+    evaluated in user space, so this process is woken up for all events.
+
+    Like libudev, this monitor drops events not sent by the kernel or by a
+    privileged process.
+
+    .. versionadded:: 0.25
+    """
+
+    def __init__(self, sock, source="udev", buffer_size=8192):
+        """
+        Create a monitor receiving from ``sock``.
+
+        ``sock`` is a :class:`~socket.socket` for netlink events, or any
+        datagram socket delivering events in the same format.  ``source`` is
+        the event source, see :meth:`from_netlink`.  ``buffer_size`` is the
+        size of the receive buffer in bytes.  Larger events are dropped.
+
+        Use :meth:`from_netlink` to create a monitor for the netlink socket.
+        """
+        self.source = source
+        self._socket = sock
+        self._netlink = sock.family == socket.AF_NETLINK
+        self._buffer = bytearray(buffer_size)
+        self._view = memoryview(self._buffer)
+        self._started = False
+        self._poller = None
+        self._subsystems = set()
+        self._subsystem_hashes = frozenset()
+        self._tags = set()
+        self._tag_blooms = ()
+        # created by _track_sequence()
+        self._sequence = None
+        self._overflows = 0
+        # an error raised while receiving, after poll_many() received events
+        self._pending_error = None
+        self._received = 0
+        self._rejected = 0
+        self._bytes = 0
+        # counters of subsystems and actions, created by stats()
+        self._event_counts = None
+
+    @classmethod
+    def from_netlink(cls, source="udev"):
+        """
+        Create a monitor for the netlink socket.
+
+        ``source`` is ``'udev'`` or ``'kernel'``, like for
+        :meth:`Monitor.from_netlink() <pyudev.Monitor.from_netlink>`.
+
+        Return a new :class:`NetlinkMonitor`.  Raise
+        :exc:`~exceptions.ValueError`, if an invalid source has been
+        specified.  Raise :exc:`~exceptions.EnvironmentError`, if the socket
+        could not be created.
+        """
+        if source not in _GROUPS:
+            raise ValueError(
+                f'Invalid source: {source!r}. Must be one of "udev" or "kernel"'
+            )
+        sock = socket.socket(
+            socket.AF_NETLINK,
+            socket.SOCK_RAW | socket.SOCK_CLOEXEC | socket.SOCK_NONBLOCK,
+            NETLINK_KOBJECT_UEVENT,
+        )
+        try:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_PASSCRED, 1)
+        except OSError:
+            sock.close()
+            raise
+        return cls(sock, source)
+
+    @property
+    def started(self):
+        """
+        ``True``, if this monitor was started, ``False`` otherwise.
+        """
+        return self._started
+
+    def fileno(self):
+        """
+        Return the file descriptor of the socket as integer.
+        """
+        return self._socket.fileno()
+
+    def close(self):
+        """
+        Close the socket of this monitor.
+        """
+        self._socket.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def filter_by(self, subsystem, device_type=None):
+        """
+        Filter incoming events by ``subsystem`` and ``device_type``, like
+        :meth:`Monitor.filter_by() <pyudev.Monitor.filter_by>`.
+        """
+        subsystem = ensure_unicode_string(subsystem)
+        if device_type is not None:
+            device_type = ensure_unicode_string(device_type)
+        self._subsystems.add((subsystem, device_type))
+        self._subsystem_hashes = frozenset(
+            murmur_hash2(s.encode(_ENCODING, _ENCODING_ERRORS))
+            for s, _ in self._subsystems
+        )
+
+    def filter_by_tag(self, tag):
+        """
+        Filter incoming events by ``tag``, like :meth:`Monitor.filter_by_tag()
+        <pyudev.Monitor.filter_by_tag>`.
+        """
+        self._tags.add(ensure_unicode_string(tag))
+        self._tag_blooms = tuple(
+            string_bloom64(t.encode(_ENCODING, _ENCODING_ERRORS)) for t in self._tags
+        )
+
+    def remove_filter(self):
+        """
+        Remove all filters of this monitor.
+        """
+        self._subsystems.clear()
+        self._subsystem_hashes = frozenset()
+        self._tags.clear()
+        self._tag_blooms = ()
+
+    def start(self):
+        """
+        Start this monitor.
+
+        The socket of the monitor joins the multicast group of the
+        :attr:`source` of events.  This method does nothing if called on an
+        already started monitor.
+        """
+        if not self._started:
+            if self._netlink:
+                self._socket.bind((0, _GROUPS[self.source]))
+            self._socket.setblocking(False)
+            self._started = True
+
+    def set_receive_buffer_size(self, size):
+        """
+        Set the receive buffer ``size`` of the socket in bytes, like
+        :meth:`Monitor.set_receive_buffer_size()
+        <pyudev.Monitor.set_receive_buffer_size>`.
+
+        Raise :exc:`~exceptions.EnvironmentError`, if the buffer size could
+        not be set.
+        """
+        self._socket.setsockopt(socket.SOL_SOCKET, _SO_RCVBUFFORCE, size)
+
+    def stats(self):
+        """
+        Return statistics of this monitor, like :meth:`Monitor.stats()
+        <pyudev.Monitor.stats>`.
+
+        Invalid, untrusted and filtered events are counted as filtered.
+        ``bytes`` counts all received messages.
+
+        Return a :class:`~pyudev.MonitorStats` object.
+        """
+        backlog, receive_buffer_size = receive_queue(self._socket)
+        if self._event_counts is None:
+            self._event_counts = (collections.Counter(), collections.Counter())
+        subsystems, actions = self._event_counts
+        return MonitorStats(
+            self._received,
+            self._rejected,
+            self._bytes,
+            self._overflows,
+            self._track_sequence().lost,
+            backlog,
+            receive_buffer_size,
+            dict(subsystems),
+            dict(actions),
+        )
+
+    def _is_trusted(self, address, ancillary):
+        """
+        Whether a message from ``address`` with the ``ancillary`` data was
+        sent by the kernel or by a privileged process.
+        """
+        if not self._netlink:
+            return True
+        pid, groups = address
+        if groups == 0:
+            # unicast messages can be sent by any process
+            return False
+        if groups == _GROUPS["kernel"] and pid != 0:
+            return False
+        for level, kind, data in ancillary:
+            if level == socket.SOL_SOCKET and kind == socket.SCM_CREDENTIALS:
+                _, uid, _ = _CREDENTIALS.unpack_from(data)
+                return uid == 0
+        return False
+
+    def _passes_header(self, subsystem_hash, tag_bloom):
+        """
+        Whether the hashes from the header of an udev event may pass the
+        filters of this monitor.
+        """
+        if self._subsystem_hashes and subsystem_hash not in self._subsystem_hashes:
+            return False
+        if self._tag_blooms and not any(
+            tag_bloom & bloom == bloom for bloom in self._tag_blooms
+        ):
+            return False
+        return True
+
+    def _passes(self, properties):
+        """
+        Whether an event with the given ``properties`` passes the filters of
+        this monitor.
+        """
+        if self._subsystems:
+            subsystem = properties.get("SUBSYSTEM")
+            device_type = properties.get("DEVTYPE")
+            if not any(
+                s == subsystem and (t is None or t == device_type)
+                for s, t in self._subsystems
+            ):
+                return False
+        if self._tags:
+            tags = properties.get("TAGS", "").split(":")
+            if self._tags.isdisjoint(tags):
+                return False
+        return True
+
+    def _parse(self, size):
+        """
+        Parse a message of ``size`` bytes in the receive buffer.
+
+        Return an :class:`UeventRecord`, or ``None`` if the message is
+        invalid or filtered.
+        """
+        view = self._view
+        if view[:8] == _UDEV_PREFIX:
+            if size < _UDEV_HEADER.size:
+                return None
+            (_, magic, _, offset, length, subsystem_hash, _, bloom_high, bloom_low) = (
+                _UDEV_HEADER.unpack_from(view)
+            )
+            if (
+                socket.ntohl(magic) != _UDEV_MAGIC
+                or offset < _UDEV_HEADER.size
+                or offset + length > size
+            ):
+                return None
+            tag_bloom = socket.ntohl(bloom_high) << 32 | socket.ntohl(bloom_low)
+            if not self._passes_header(socket.ntohl(subsystem_hash), tag_bloom):
+                return None
+            source = "udev"
+            start = offset
+            end = offset + length
+        else:
+            # ACTION@devpath, followed by the properties
+            start = self._buffer.find(b"\0", 0, size) + 1
+            if start <= 0 or self._buffer.find(b"@/", 0, start) < 0:
+                return None
+            source = "kernel"
+            end = size
+        text = str(view[start:end], _ENCODING, _ENCODING_ERRORS)
+        properties = dict(
+            entry.partition("=")[::2] for entry in text.split("\0") if entry
+        )
+        if not self._passes(properties):
+            return None
+        sequence_number = properties.get("SEQNUM", "0")
+        return UeventRecord(
+            source,
+            properties.get("ACTION"),
+            properties.get("DEVPATH"),
+            properties.get("SUBSYSTEM"),
+            properties.get("DEVTYPE"),
+            int(sequence_number) if sequence_number.isdigit() else 0,
+            properties,
+        )
+
+    def _receive_device(self):
+        """
+        Receive a single event from the socket.
+
+        Invalid, untrusted and filtered events are skipped.
+
+        Return the :class:`UeventRecord` of the event, or ``None`` if no
+        event is available.
+        """
+        while True:
+            try:
+                size, ancillary, flags, address = self._socket.recvmsg_into(
+                    [self._buffer], _ANCILLARY_SIZE
+                )
+            except BlockingIOError:
+                return None
+            except OSError as error:
+                if error.errno == errno.ENOBUFS:
+                    self._overflows += 1
+                raise
+            self._received += 1
+            self._bytes += size
+            if flags & socket.MSG_TRUNC or not self._is_trusted(address, ancillary):
+                self._rejected += 1
+                continue
+            record = self._parse(size)
+            if record is None:
+                self._rejected += 1
+                continue
+            if self._sequence is not None and not self._subsystems and not self._tags:
+                # with filters, missing sequence numbers are expected
+                self._sequence.update(record.sequence_number)
+            if self._event_counts is not None:
+                subsystems, actions = self._event_counts
+                subsystems[record.subsystem] += 1
+                actions[record.action] += 1
+            return record
+
+    def _track_sequence(self):
+        """
+        Detect events missing from the sequence numbers of received events.
+
+        Sequence numbers are only tracked once requested, by :meth:`stats`
+        or a :class:`~pyudev.MonitorObserver` with ``resync``, to keep
+        receiving cheap otherwise.
+
+        Return the tracker of sequence numbers.
+        """
+        if self._sequence is None:
+            # the kernel sends events in order, udev may reorder them
+            window = 0 if self.source == "kernel" else REORDER_WINDOW
+            self._sequence = SequenceTracker(window)
+        return self._sequence
+
+    def _take_error(self):
+        """
+        Return and clear the pending error of the socket.
+
+        Return the error number, or ``0`` if there is no pending error.
+        """
+        errnum = self._socket.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR)
+        if errnum == errno.ENOBUFS:
+            self._overflows += 1
+        return errnum
+
+    def _wait(self, timeout):
+        """
+        Wait until the socket is readable, like :meth:`Monitor.poll()
+        <pyudev.Monitor.poll>` does.
+        """
+        if timeout is not None and timeout > 0:
+            # .poll() takes timeout in milliseconds
+            timeout = int(timeout * 1000)
+        if self._poller is None:
+            self._poller = poll.Poll.for_events((self, "r"))
+        try:
+            return bool(eintr_retry_call(self._poller.poll, timeout))
+        except EnvironmentError as error:
+            raise socket_error(self, error) from None
+
+    def poll(self, timeout=None):
+        """
+        Poll for a device event, like :meth:`Monitor.poll()
+        <pyudev.Monitor.poll>`.
+
+        Return the :class:`UeventRecord` of the event, or ``None`` if a
+        timeout occurred.
+        """
+        return next(iter(self.poll_many(1, timeout)), None)
+
+    def poll_many(self, max_events, timeout=None):
+        """
+        Poll for many device events at once, like
+        :meth:`Monitor.poll_many() <pyudev.Monitor.poll_many>`.
+
+        Return a list of :class:`UeventRecord` objects, which is empty if a
+        timeout occurred.
+        """
+        if max_events < 1:
+            raise ValueError(f"Invalid max_events: {max_events}")
+        self.start()
+        error = self._pending_error
+        if error is not None:
+            self._pending_error = None
+            raise error
+        records = []
+        deadline = timeout_deadline(timeout)
+        while self._wait(timeout):
+            while len(records) < max_events:
+                try:
+                    record = self._receive_device()
+                except OSError as error:
+                    if not records:
+                        raise
+                    # return the received events first
+                    self._pending_error = error
+                    break
+                if record is None:
+                    break
+                records.append(record)
+            if records:
+                break
+            # all pending events were dropped, wait for the next one
+            timeout = remaining_timeout(deadline, timeout)
+        return records
@@ -0,0 +1,187 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2026 pyudev contributors
+
+# This library is free software; you can redistribute it and/or modify it
+# under the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation; either version 2.1 of the License, or (at your
+# option) any later version.
+
+# This library is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE.  See the GNU Lesser General Public License
+# for more details.
+
+# You should have received a copy of the GNU Lesser General Public License
+# along with this library; if not, write to the Free Software Foundation,
+# Inc., 51 Franklin St, Fifth Floor, Boston, MA 02110-1301 USA
+"""
+pyudev.predicate
+================
+
+Declarative device filters, compiled to a single callable.
+
+.. versionadded:: 0.25
+"""
+
+import fnmatch
+import os
+import re
+
+from pyudev._util import ensure_byte_string
+
+
+def _byte_strings(values):
+    """
+    Return ``values`` as frozenset of byte strings.
+
+    ``values`` is a single byte or unicode string, or an iterable of them.
+    """
+    if isinstance(values, (str, bytes)):
+        values = [values]
+    return frozenset(ensure_byte_string(value) for value in values)
+
+
+def _glob_pattern(globs):
+    """
+    Compile the shell-style patterns ``globs`` into a single regular
+    expression for byte strings.
+    """
+    patterns = (
+        os.fsencode(fnmatch.translate(os.fsdecode(glob)))
+        for glob in _byte_strings(globs)
+    )
+    return re.compile(b"|".join(b"(?:" + pattern + b")" for pattern in patterns))
+
+
+def _match_field(getter, values):
+    """
+    Return a check for a field, which must be in ``values``.
+
+    ``getter`` is the libudev function reading the field from a device.
+    """
+    return lambda device_p: getter(device_p) in values
+
+
+class DevicePredicate:
+    """
+    A filter on devices, given as declarative specification.
+
+    A device matches, if it matches all given criteria.  Each criterion is a
+    single byte or unicode string, or an iterable of them, which matches if
+    any of the strings matches:
+
+    >>> from pyudev import DevicePredicate
+    >>> predicate = DevicePredicate(
+    ...     action=['add', 'remove'],
+    ...     device_path='/devices/pci*/usb*',
+    ...     driver='usb-storage',
+    ...     properties={'ID_BUS': 'usb', 'ID_SERIAL': None})
+    >>> predicate(device)
+    True
+
+    Unlike :meth:`Monitor.filter_by`, predicates are evaluated in user
+    space, but on all device properties.  Given to
+    :meth:`Monitor.set_predicate`, a predicate is evaluated on the raw
+    libudev device of each received event, reading only the fields it
+    needs.  Rejected events never create :class:`Device` objects or decode
+    strings.
+
+    .. versionadded:: 0.25
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        *,
+        action=None,
+        subsystem=None,
+        device_type=None,
+        driver=None,
+        device_path=None,
+        properties=None,
+    ):
+        """
+        Create a new predicate.
+
+        ``action``, ``subsystem``, ``device_type`` and ``driver`` match the
+        respective attributes of :class:`Device` exactly.  ``device_path``
+        is matched against the :attr:`Device.device_path` with shell-style
+        wildcards as understood by :mod:`fnmatch`.
+
+        ``properties`` is a mapping of names of udev properties to their
+        values.  A value of ``None`` matches any device, which has the
+        property at all.
+
+        If a criterion is ``None``, it is not checked.
+        """
+        self.action = None if action is None else _byte_strings(action)
+        self.subsystem = None if subsystem is None else _byte_strings(subsystem)
+        self.device_type = None if device_type is None else _byte_strings(device_type)
+        self.driver = None if driver is None else _byte_strings(driver)
+        self.device_path = None if device_path is None else _glob_pattern(device_path)
+        self.properties = tuple(
+            (
+                ensure_byte_string(name),
+                None if values is None else _byte_strings(values),
+            )
+            for name, values in (properties or {}).items()
+        )
+        self._compiled = (None, None)
+
+    def compile(self, libudev):
+        """
+        Compile this predicate for the libudev library ``libudev``.
+
+        Return a callable, which takes a ``udev_device *`` and returns
+        ``True``, if the device matches this predicate, or ``False``
+        otherwise.  The criteria are checked one after another, and checking
+        stops at the first failing criterion.
+        """
+        checks = []
+        if self.action is not None:
+            checks.append(_match_field(libudev.udev_device_get_action, self.action))
+        if self.subsystem is not None:
+            checks.append(
+                _match_field(libudev.udev_device_get_subsystem, self.subsystem)
+            )
+        if self.device_type is not None:
+            checks.append(
+                _match_field(libudev.udev_device_get_devtype, self.device_type)
+            )
+        if self.driver is not None:
+            checks.append(_match_field(libudev.udev_device_get_driver, self.driver))
+        if self.device_path is not None:
+            get_devpath = libudev.udev_device_get_devpath
+            match = self.device_path.match
+            checks.append(lambda device_p: match(get_devpath(device_p)) is not None)
+        get_property = libudev.udev_device_get_property_value
+        for name, values in self.properties:
+            if values is None:
+                checks.append(
+                    lambda device_p, name=name: get_property(device_p, name) is not None
+                )
+            else:
+                checks.append(
+                    lambda device_p, name=name, values=values: (
+                        get_property(device_p, name) in values
+                    )
+                )
+        checks = tuple(checks)
+
+        def predicate(device_p):
+            for check in checks:
+                if not check(device_p):
+                    return False
+            return True
+
+        return predicate
+
+    def __call__(self, device):
+        """
+        Whether the :class:`Device` ``device`` matches this predicate.
+        """
+        libudev, predicate = self._compiled
+        if libudev is not device._libudev:
+            libudev = device._libudev
+            predicate = self.compile(libudev)
+            self._compiled = (libudev, predicate)
+        return predicate(device)
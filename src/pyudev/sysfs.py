@@ -0,0 +1,472 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2026 pyudev contributors
+
+# This library is free software; you can redistribute it and/or modify it
+# under the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation; either version 2.1 of the License, or (at your
+# option) any later version.
+
+# This library is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE.  See the GNU Lesser General Public License
+# for more details.
+
+# You should have received a copy of the GNU Lesser General Public License
+# along with this library; if not, write to the Free Software Foundation,
+# Inc., 51 Franklin St, Fifth Floor, Boston, MA 02110-1301 USA
+"""
+pyudev.sysfs
+============
+
+Device enumeration and attribute access by reading ``sysfs`` directly.
+"""
+
+import os
+import weakref
+from fnmatch import fnmatchcase
+
+from pyudev._errors import DeviceNotFoundAtPathError
+from pyudev._util import ensure_byte_string, property_value_to_bytes
+from pyudev.device import Devices
+from pyudev.device._table import DeviceTableBuilder
+from pyudev.udevdb import device_id
+
+
+def _scandir(path):
+    """
+    Return the entries of the directory ``path`` as list, or an empty list if
+    ``path`` cannot be listed.
+    """
+    try:
+        with os.scandir(path) as entries:
+            return list(entries)
+    except OSError:
+        return []
+
+
+def _read_attribute(path):
+    """
+    Read the ``sysfs`` attribute file at ``path``.
+
+    Return its contents as byte string without trailing whitespace, or
+    ``None`` if the file cannot be read.
+    """
+    try:
+        with open(path, "rb") as attribute:
+            return attribute.read().rstrip()
+    except OSError:
+        return None
+
+
+def read_uevent(sys_path):
+    """
+    Read the ``uevent`` file of the device at ``sys_path``.
+
+    Return a list of ``(name, value)`` pairs of byte strings, which is empty
+    if the file cannot be read.
+    """
+    contents = _read_attribute(os.path.join(sys_path, "uevent"))
+    if not contents:
+        return []
+    return [
+        tuple(line.split(b"=", 1)) for line in contents.split(b"\n") if b"=" in line
+    ]
+
+
+def _record_properties(record):
+    """
+    Return the properties libudev derives from the udev database ``record``
+    as list of ``(name, value)`` pairs.
+    """
+    properties = list(record.properties.items())
+    if record.device_links:
+        properties.append(("DEVLINKS", " ".join(record.device_links)))
+    if record.tags:
+        properties.append(("TAGS", f":{':'.join(record.tags)}:"))
+    if record.usec_initialized:
+        properties.append(("USEC_INITIALIZED", str(record.usec_initialized)))
+    return properties
+
+
+class SysfsEnumerator:
+    """
+    A filtered iterable of devices, which walks ``sysfs`` itself.
+
+    This class is an alternative to :class:`Enumerator`, which does not
+    scan through libudev.  Instead it lists the subsystem directories below
+    ``/sys/class``, ``/sys/bus/*/devices`` and ``/sys/block`` with
+    :func:`os.scandir`, and evaluates all filters in Python.  Subsystem and
+    name filters prune the walk before any device directory is visited, so
+    listings of a few subsystems are much cheaper than with
+    :class:`Enumerator`:
+
+    >>> from pyudev import Context, SysfsEnumerator
+    >>> context = Context()
+    >>> list(SysfsEnumerator(context).match_subsystem('net').iter_sys_paths())
+    ['/sys/devices/virtual/net/lo']
+
+    Like with :class:`Enumerator`, multiple subsystem and name filters are
+    combined using a logical OR, and filters of different types using a
+    logical AND.  All attribute filters must match.  Patterns may contain
+    shell-style wildcards as understood by :func:`fnmatch.fnmatch`.
+
+    Only information available in ``sysfs`` is considered, so there are no
+    filters for properties or tags set by udev, and the properties in
+    :meth:`snapshot` are those of the ``uevent`` file of each device.
+
+    .. versionadded:: 0.25
+    """
+
+    def __init__(self, context, sys_path=None):
+        """
+        Create a new enumerator with the given ``context``.
+
+        ``sys_path`` is the mount point of ``sysfs`` to walk as string.  If
+        ``None``, :attr:`Context.sys_path` of ``context`` is used.
+        """
+        self.context = context
+        self.sys_path = context.sys_path if sys_path is None else sys_path
+        self._subsystems = []
+        self._nomatch_subsystems = []
+        self._sys_names = []
+        self._attributes = []
+        self._nomatch_attributes = []
+
+    def match_subsystem(self, subsystem, nomatch=False):
+        """
+        Include all devices, which are part of the given ``subsystem``.
+
+        If ``nomatch`` is ``True``, only include devices which are *not* part
+        of the given ``subsystem``.
+
+        Return the instance again.
+        """
+        subsystem = ensure_byte_string(subsystem)
+        if nomatch:
+            self._nomatch_subsystems.append(subsystem)
+        else:
+            self._subsystems.append(subsystem)
+        return self
+
+    def match_sys_name(self, sys_name):
+        """
+        Include all devices with the given name.
+
+        Return the instance again.
+        """
+        self._sys_names.append(ensure_byte_string(sys_name))
+        return self
+
+    def match_attribute(self, attribute, value, nomatch=False):
+        """
+        Include all devices, whose ``attribute`` has the given ``value``.
+
+        ``value`` is converted like in :meth:`Enumerator.match_attribute`.  If
+        ``nomatch`` is ``True``, only include devices whose ``attribute`` does
+        *not* match, including devices without this ``attribute``.
+
+        Return the instance again.
+        """
+        match = (ensure_byte_string(attribute), property_value_to_bytes(value))
+        if nomatch:
+            self._nomatch_attributes.append(match)
+        else:
+            self._attributes.append(match)
+        return self
+
+    def _subsystem_matches(self, subsystem):
+        """
+        Whether the byte string ``subsystem`` passes the subsystem filters.
+        """
+        if self._subsystems and not any(
+            fnmatchcase(subsystem, p) for p in self._subsystems
+        ):
+            return False
+        return not any(fnmatchcase(subsystem, p) for p in self._nomatch_subsystems)
+
+    def _sys_name_matches(self, name):
+        """
+        Whether the directory entry ``name`` passes the name filters.
+        """
+        if not self._sys_names:
+            return True
+        sys_name = os.fsencode(name).replace(b"!", b"/")
+        return any(fnmatchcase(sys_name, p) for p in self._sys_names)
+
+    def _attributes_match(self, sys_path):
+        """
+        Whether the device at ``sys_path`` passes the attribute filters.
+        """
+        for attribute, pattern in self._attributes:
+            value = _read_attribute(os.path.join(sys_path, os.fsdecode(attribute)))
+            if value is None or not fnmatchcase(value, pattern):
+                return False
+        for attribute, pattern in self._nomatch_attributes:
+            value = _read_attribute(os.path.join(sys_path, os.fsdecode(attribute)))
+            if value is not None and fnmatchcase(value, pattern):
+                return False
+        return True
+
+    def _subsystem_directories(self):
+        """
+        Yield ``(subsystem, path, nested)`` for each directory listing the
+        devices of a matching subsystem.  If ``nested`` is ``True``, devices
+        may also be listed in subdirectories of the listed devices.
+        """
+        class_path = os.path.join(self.sys_path, "class")
+        has_block_class = False
+        for entry in _scandir(class_path):
+            has_block_class = has_block_class or entry.name == "block"
+            if self._subsystem_matches(os.fsencode(entry.name)):
+                yield entry.name, entry.path, False
+        bus_path = os.path.join(self.sys_path, "bus")
+        for entry in _scandir(bus_path):
+            if self._subsystem_matches(os.fsencode(entry.name)):
+                yield entry.name, os.path.join(entry.path, "devices"), False
+        # sysfs without /sys/class/block lists block devices in /sys/block
+        if not has_block_class and self._subsystem_matches(b"block"):
+            yield "block", os.path.join(self.sys_path, "block"), True
+
+    def _scan(self):
+        """
+        Walk ``sysfs`` for matching devices.
+
+        Return a sorted list of ``(sys_path, subsystem)`` pairs.
+        """
+        found = {}
+        for subsystem, directory, nested in self._subsystem_directories():
+            for entry in _scandir(directory):
+                if entry.is_symlink():
+                    sys_path = os.path.normpath(
+                        os.path.join(directory, os.readlink(entry.path))
+                    )
+                elif entry.is_dir():
+                    sys_path = entry.path
+                else:
+                    continue
+                if nested:
+                    # partitions are only listed below their disk in /sys/block
+                    for child in _scandir(sys_path):
+                        if os.path.exists(os.path.join(child.path, "partition")):
+                            if self._sys_name_matches(child.name):
+                                found.setdefault(child.path, subsystem)
+                if not self._sys_name_matches(entry.name):
+                    continue
+                found.setdefault(sys_path, subsystem)
+        return sorted(
+            (sys_path, subsystem)
+            for sys_path, subsystem in found.items()
+            if self._attributes_match(sys_path)
+        )
+
+    def iter_sys_paths(self):
+        """
+        Iterate over the ``sys_path`` of all matching devices.
+
+        Yield the ``sys_path`` of each device as unicode string.
+        """
+        for sys_path, _ in self._scan():
+            yield sys_path
+
+    def __iter__(self):
+        """
+        Iterate over all matching devices.
+
+        Yield :class:`Device` objects.  Since these objects are created
+        through libudev, ``sysfs`` must be mounted at :attr:`Context.sys_path`
+        for this to work.
+        """
+        for sys_path in self.iter_sys_paths():
+            try:
+                yield Devices.from_sys_path(self.context, sys_path)
+            except DeviceNotFoundAtPathError:
+                continue
+
+    def snapshot(self, database=None):
+        """
+        Take an immutable snapshot of all matching devices.
+
+        Read the ``uevent`` file and the ``driver`` link of each matching
+        device into a :class:`DeviceTable`, without calling into libudev.
+
+        ``database`` is an :class:`UdevDatabase`.  If given, all its records
+        are loaded at once, and the properties, device links and tags udev
+        assigned to each device are added to its properties, like libudev
+        does.
+
+        Return a :class:`DeviceTable`.
+        """
+        records = {} if database is None else database.load()
+        builder = DeviceTableBuilder()
+        sys_mount = os.path.normpath(self.sys_path)
+        for sys_path, subsystem in self._scan():
+            uevent = read_uevent(sys_path)
+            values = dict(uevent)
+            device_node = values.get(b"DEVNAME")
+            if device_node is not None:
+                device_node = os.path.join(
+                    ensure_byte_string(self.context.device_path), device_node
+                )
+            device_number = 0
+            if b"MAJOR" in values and b"MINOR" in values:
+                device_number = os.makedev(int(values[b"MAJOR"]), int(values[b"MINOR"]))
+            try:
+                driver = os.path.basename(os.readlink(os.path.join(sys_path, "driver")))
+            except OSError:
+                driver = None
+            properties = [
+                (b"DEVPATH", ensure_byte_string(sys_path[len(sys_mount) :])),
+                (b"SUBSYSTEM", ensure_byte_string(subsystem)),
+            ]
+            properties.extend(
+                (name, device_node if name == b"DEVNAME" else value)
+                for name, value in uevent
+            )
+            if records:
+                record = records.get(
+                    device_id(
+                        subsystem,
+                        os.path.basename(sys_path),
+                        device_number,
+                        values.get(b"IFINDEX", b"").decode("ascii"),
+                    )
+                )
+                if record is not None:
+                    properties.extend(_record_properties(record))
+            builder.add(
+                sys_path,
+                subsystem,
+                values.get(b"DEVTYPE"),
+                driver,
+                device_number,
+                device_node,
+                properties,
+            )
+        return builder.build()
+
+
+def _close_files(files):
+    """
+    Close all file descriptors in the dictionary ``files``, and empty it.
+    """
+    while files:
+        _, fd = files.popitem()
+        os.close(fd)
+
+
+class SysfsAttributeReader:
+    """
+    A reader for ``sysfs`` attribute files, which keeps these files open.
+
+    Each attribute file is opened on its first read, and read again with
+    :func:`os.pread` from offset ``0`` on every later read.  ``sysfs``
+    regenerates the contents of an attribute for each read from offset ``0``,
+    so every read returns the current value, without the cost of opening
+    and closing the file again.  This makes polling attributes like
+    ``statistics/rx_bytes`` or ``stat`` of many devices cheap:
+
+    >>> from pyudev import SysfsAttributeReader
+    >>> reader = SysfsAttributeReader()
+    >>> reader.read('/sys/class/net/lo/statistics/rx_bytes')
+    b'28163'
+
+    Unlike :class:`Attributes`, values are never cached, and no call goes
+    through libudev.  Values are returned as byte strings without the
+    trailing newline, like libudev does.
+
+    The reader owns the open files.  They are closed by :meth:`close`, or at
+    the end of a ``with`` block, which is the preferred form.  Files of a
+    reader, which is not closed, are closed when it is garbage collected.
+    This class is not thread-safe.
+
+    .. versionadded:: 0.25
+    """
+
+    def __init__(self, size=4096):
+        """
+        Create a new reader.
+
+        ``size`` is the number of bytes read at once, as integer.  The
+        default is the maximum size of a ``sysfs`` attribute on most
+        architectures, larger files need more than one read.
+        """
+        if size < 1:
+            raise ValueError(f"Invalid read size: {size}")
+        self.size = size
+        self._files = {}
+        # close the files of readers, which were dropped without close()
+        self._finalizer = weakref.finalize(self, _close_files, self._files)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __len__(self):
+        """
+        Return the number of attribute files kept open as integer.
+        """
+        return len(self._files)
+
+    def read(self, path):
+        """
+        Read the attribute file at ``path``.
+
+        ``path`` is the path of the attribute file as string.  It is opened
+        and kept open, if not already open.
+
+        Return the contents of the file as byte string without the trailing
+        newline.  Raise :exc:`~exceptions.EnvironmentError`, if the file
+        cannot be opened or read, for instance because the device is gone.
+        In this case the file is closed, and opened again on the next read.
+        """
+        fd = self._files.get(path)
+        if fd is None:
+            fd = os.open(path, os.O_RDONLY | os.O_CLOEXEC)
+            self._files[path] = fd
+        try:
+            contents = os.pread(fd, self.size, 0)
+            if len(contents) == self.size:
+                chunks = [contents]
+                while contents:
+                    contents = os.pread(fd, self.size, self.size * len(chunks))
+                    chunks.append(contents)
+                contents = b"".join(chunks)
+        except OSError:
+            self.discard(path)
+            raise
+        return contents.rstrip(b"\n")
+
+    def read_many(self, paths):
+        """
+        Read each attribute file in the iterable ``paths``.
+
+        Errors are captured per file, so a single missing or unreadable
+        attribute does not abort the other reads.
+
+        Return a dictionary mapping each path to the contents of its file as
+        byte string, or to the :exc:`~exceptions.EnvironmentError` raised
+        while opening or reading the file.
+        """
+        values = {}
+        for path in paths:
+            try:
+                values[path] = self.read(path)
+            except OSError as error:
+                values[path] = error
+        return values
+
+    def discard(self, path):
+        """
+        Close the attribute file at ``path``, if it is open.
+        """
+        fd = self._files.pop(path, None)
+        if fd is not None:
+            os.close(fd)
+
+    def close(self):
+        """
+        Close all open attribute files.
+        """
+        _close_files(self._files)
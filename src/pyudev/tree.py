@@ -0,0 +1,339 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2026 pyudev contributors
+
+# This library is free software; you can redistribute it and/or modify it
+# under the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation; either version 2.1 of the License, or (at your
+# option) any later version.
+
+# This library is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE.  See the GNU Lesser General Public License
+# for more details.
+
+# You should have received a copy of the GNU Lesser General Public License
+# along with this library; if not, write to the Free Software Foundation,
+# Inc., 51 Franklin St, Fifth Floor, Boston, MA 02110-1301 USA
+"""
+pyudev.tree
+===========
+
+An in-memory index of the device hierarchy.
+"""
+
+import threading
+
+from pyudev._util import ensure_unicode_string
+from pyudev.device import Device
+from pyudev.monitor import Monitor, MonitorObserver
+
+
+def _device_path_of(device):
+    """
+    Return the device path of ``device`` as unicode string.
+
+    ``device`` is a :class:`Device` or a device path as byte or unicode
+    string.
+    """
+    if isinstance(device, Device):
+        return device.device_path
+    return ensure_unicode_string(device)
+
+
+class DeviceTree:
+    """
+    An index of the parent-child relationships of devices.
+
+    The tree is built from a single enumeration, and answers all hierarchy
+    queries from memory, unlike :attr:`Device.children`, which scans all
+    devices on every call:
+
+    >>> from pyudev import Context, DeviceTree
+    >>> context = Context()
+    >>> tree = DeviceTree(context)
+    >>> disk = tree['/devices/pci0000:00/0000:00:1f.2/ata1/host0/target0:0:0/0:0:0:0/block/sda']
+    >>> [d.sys_name for d in tree.children(disk)]
+    ['sda1', 'sda2']
+    >>> tree.find_parent(disk, 'pci').sys_name
+    '0000:00:1f.2'
+
+    The parent of a device is the device with the longest
+    :attr:`Device.device_path`, which is a prefix of the path of the device,
+    like in the kernel.  Parents of the indexed devices are added to the
+    tree, even if they were not enumerated.  Queries take a :class:`Device`
+    or a device path, and return :class:`Device` objects from the tree.
+
+    The tree reflects the devices at the time of its creation.  To keep it
+    current, :meth:`observe` a :class:`Monitor`, or pass received devices to
+    :meth:`update`.
+
+    This class is thread-safe.
+
+    .. versionadded:: 0.25
+    """
+
+    def __init__(self, context, devices=None):
+        """
+        Create a new tree of devices in ``context``.
+
+        ``devices`` is an iterable of the :class:`Device` objects to index.
+        If ``None``, all devices of ``context`` are enumerated.
+        """
+        self.context = context
+        self._lock = threading.Lock()
+        self._devices = {}
+        self._parents = {}
+        # children are kept as keys of a dictionary to preserve their order
+        self._children = {}
+        if devices is None:
+            devices = context.list_devices()
+        for device in devices:
+            self._devices[device.device_path] = device
+        self._add_hidden_ancestors()
+        for device_path in self._devices:
+            self._link(device_path)
+
+    def _add_hidden_ancestors(self):
+        """
+        Add the ancestors of all indexed devices, which are missing from the
+        index.
+
+        Enumerations do not include some devices, for instance those without
+        a subsystem, which are still the parent of other devices.  Only
+        devices, whose parent directory is not indexed, can have such a
+        parent, so only these are asked for their parent.
+        """
+        devices = self._devices
+        for device in list(devices.values()):
+            if device.device_path.rpartition("/")[0] in devices:
+                continue
+            parent = device.parent
+            while parent is not None and parent.device_path not in devices:
+                devices[parent.device_path] = parent
+                parent = parent.parent
+
+    def _find_parent_path(self, device_path):
+        """
+        Return the path of the nearest indexed ancestor of ``device_path``, or
+        ``None`` if there is none.
+        """
+        path = device_path.rpartition("/")[0]
+        while path:
+            if path in self._devices:
+                return path
+            path = path.rpartition("/")[0]
+        return None
+
+    def _link(self, device_path):
+        """
+        Add ``device_path`` to the children of its nearest indexed ancestor.
+        """
+        parent_path = self._find_parent_path(device_path)
+        self._parents[device_path] = parent_path
+        if parent_path is not None:
+            self._children.setdefault(parent_path, {})[device_path] = None
+
+    def _unlink(self, device_path):
+        """
+        Remove ``device_path`` from the children of its parent.
+        """
+        parent_path = self._parents.pop(device_path, None)
+        if parent_path is not None:
+            siblings = self._children[parent_path]
+            del siblings[device_path]
+            if not siblings:
+                del self._children[parent_path]
+
+    def __len__(self):
+        """
+        Return the number of devices in this tree as integer.
+        """
+        return len(self._devices)
+
+    def __contains__(self, device):
+        """
+        Whether ``device`` is part of this tree.
+
+        ``device`` is a :class:`Device` or a device path.
+        """
+        return _device_path_of(device) in self._devices
+
+    def __iter__(self):
+        """
+        Iterate over all devices in this tree.
+
+        Yield :class:`Device` objects.
+        """
+        with self._lock:
+            devices = list(self._devices.values())
+        return iter(devices)
+
+    def __getitem__(self, device_path):
+        """
+        Return the :class:`Device` with the given ``device_path``.
+
+        Raise :exc:`~exceptions.KeyError`, if there is no such device in
+        this tree.
+        """
+        return self._devices[_device_path_of(device_path)]
+
+    def parent(self, device):
+        """
+        Return the parent :class:`Device` of ``device``, or ``None`` if
+        ``device`` has no parent.
+
+        Raise :exc:`~exceptions.KeyError`, if ``device`` is not part of this
+        tree.
+        """
+        with self._lock:
+            parent_path = self._parents[_device_path_of(device)]
+            return None if parent_path is None else self._devices[parent_path]
+
+    def children(self, device):
+        """
+        Return the direct children of ``device`` as list of :class:`Device`
+        objects.
+
+        Raise :exc:`~exceptions.KeyError`, if ``device`` is not part of this
+        tree.
+        """
+        device_path = _device_path_of(device)
+        with self._lock:
+            if device_path not in self._devices:
+                raise KeyError(device)
+            children = self._children.get(device_path, ())
+            return [self._devices[path] for path in children]
+
+    def descendants(self, device):
+        """
+        Return all descendants of ``device`` as list of :class:`Device`
+        objects.
+
+        Each device precedes its own descendants in the list.  Raise
+        :exc:`~exceptions.KeyError`, if ``device`` is not part of this tree.
+        """
+        device_path = _device_path_of(device)
+        descendants = []
+        with self._lock:
+            if device_path not in self._devices:
+                raise KeyError(device)
+            pending = list(reversed(self._children.get(device_path, ())))
+            while pending:
+                path = pending.pop()
+                descendants.append(self._devices[path])
+                pending.extend(reversed(self._children.get(path, ())))
+        return descendants
+
+    def ancestors(self, device):
+        """
+        Return all ancestors of ``device`` from bottom to top as list of
+        :class:`Device` objects.
+
+        Raise :exc:`~exceptions.KeyError`, if ``device`` is not part of this
+        tree.
+        """
+        ancestors = []
+        with self._lock:
+            parent_path = self._parents[_device_path_of(device)]
+            while parent_path is not None:
+                ancestors.append(self._devices[parent_path])
+                parent_path = self._parents[parent_path]
+        return ancestors
+
+    def find_parent(self, device, subsystem, device_type=None):
+        """
+        Find the nearest ancestor of ``device`` with the given ``subsystem``
+        and ``device_type``.
+
+        ``subsystem`` and ``device_type`` are unicode strings.  If
+        ``device_type`` is ``None``, any device type matches.
+
+        Return the matching :class:`Device`, or ``None`` if no ancestor
+        matches, like :meth:`Device.find_parent`.  Raise
+        :exc:`~exceptions.KeyError`, if ``device`` is not part of this tree.
+        """
+        for ancestor in self.ancestors(device):
+            if ancestor.subsystem == subsystem and (
+                device_type is None or ancestor.device_type == device_type
+            ):
+                return ancestor
+        return None
+
+    def add(self, device):
+        """
+        Add ``device`` to this tree, or replace the object of an indexed
+        device with ``device``.
+
+        Indexed devices below ``device`` become its children.
+        """
+        device_path = device.device_path
+        with self._lock:
+            if device_path in self._devices:
+                self._devices[device_path] = device
+                return
+            self._devices[device_path] = device
+            self._link(device_path)
+            parent_path = self._parents[device_path]
+            if parent_path is None:
+                candidates = [p for p, q in self._parents.items() if q is None]
+            else:
+                candidates = list(self._children[parent_path])
+            prefix = device_path + "/"
+            for path in candidates:
+                if path.startswith(prefix):
+                    self._unlink(path)
+                    self._link(path)
+
+    def remove(self, device):
+        """
+        Remove ``device`` from this tree.
+
+        ``device`` is a :class:`Device` or a device path.  Children of
+        ``device`` become children of its parent.  Nothing happens, if
+        ``device`` is not part of this tree.
+        """
+        device_path = _device_path_of(device)
+        with self._lock:
+            if self._devices.pop(device_path, None) is None:
+                return
+            self._unlink(device_path)
+            for path in list(self._children.pop(device_path, ())):
+                self._parents.pop(path)
+                self._link(path)
+
+    def update(self, device):
+        """
+        Update this tree for an event of ``device``.
+
+        ``device`` is a :class:`Device` received from a :class:`Monitor`.
+        Depending on its :attr:`~Device.action`, it is added to, removed
+        from, or moved within this tree, or replaces the indexed object.
+        """
+        action = device.action
+        if action == "remove":
+            self.remove(device)
+            return
+        if action == "move":
+            old_path = device.properties.get("DEVPATH_OLD")
+            if old_path is not None:
+                self.remove(old_path)
+        self.add(device)
+
+    def observe(self, monitor=None):
+        """
+        Keep this tree current with events received by ``monitor``.
+
+        ``monitor`` is a :class:`Monitor` for the :attr:`context` of this
+        tree.  If ``None``, a new monitor for ``udev`` events is created.
+        Events of devices filtered by ``monitor`` are missed.
+
+        Return the started :class:`MonitorObserver`.  Call its
+        :meth:`~MonitorObserver.stop` method to stop updating.
+        """
+        if monitor is None:
+            monitor = Monitor.from_netlink(self.context)
+        observer = MonitorObserver(
+            monitor, callback=self.update, name="device-tree-observer"
+        )
+        observer.start()
+        return observer
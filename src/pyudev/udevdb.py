@@ -0,0 +1,194 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2026 pyudev contributors
+
+# This library is free software; you can redistribute it and/or modify it
+# under the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation; either version 2.1 of the License, or (at your
+# option) any later version.
+
+# This library is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE.  See the GNU Lesser General Public License
+# for more details.
+
+# You should have received a copy of the GNU Lesser General Public License
+# along with this library; if not, write to the Free Software Foundation,
+# Inc., 51 Franklin St, Fifth Floor, Boston, MA 02110-1301 USA
+"""
+pyudev.udevdb
+=============
+
+Direct access to the udev database in ``/run/udev/data``.
+"""
+
+import collections
+import os
+
+UdevDatabaseRecord = collections.namedtuple(
+    "UdevDatabaseRecord", "properties device_links tags usec_initialized"
+)
+
+
+def device_id(subsystem, sys_name, device_number=0, interface_index=None):
+    """
+    Return the identifier under which udev stores a device in its database.
+
+    ``subsystem`` and ``sys_name`` are the subsystem and name of the device as
+    unicode strings, ``device_number`` its device number as integer, and
+    ``interface_index`` the interface index of a network device as integer or
+    ``None``.
+
+    The identifier has one of the forms ``b<major>:<minor>``,
+    ``c<major>:<minor>``, ``n<ifindex>`` or ``+<subsystem>:<sys_name>``, see
+    also :meth:`Devices.from_kernel_device`.
+    """
+    if device_number:
+        kind = "b" if subsystem == "block" else "c"
+        return f"{kind}{os.major(device_number)}:{os.minor(device_number)}"
+    if interface_index:
+        return f"n{interface_index}"
+    return f"+{subsystem}:{sys_name}"
+
+
+def parse_record(data, device_path="/dev"):
+    """
+    Parse the contents of a single udev database file.
+
+    ``data`` is the contents as byte string.  ``device_path`` is the device
+    directory, which relative device links in the record are joined with.
+
+    Return a :class:`UdevDatabaseRecord`.  Unknown and malformed lines are
+    ignored.
+    """
+    properties = {}
+    device_links = []
+    tags = []
+    usec_initialized = 0
+    # decode once, instead of once per line
+    for line in os.fsdecode(data).split("\n"):
+        key = line[:2]
+        if key == "E:":
+            name, _, value = line[2:].partition("=")
+            properties[name] = value
+        elif key == "S:":
+            device_links.append(os.path.join(device_path, line[2:]))
+        elif key == "G:":
+            tags.append(line[2:])
+        elif key == "I:" and line[2:].isdigit():
+            usec_initialized = int(line[2:])
+    return UdevDatabaseRecord(
+        properties, tuple(device_links), tuple(tags), usec_initialized
+    )
+
+
+class UdevDatabase:
+    """
+    A reader for the device records of the udev database.
+
+    udev stores the properties, device links and tags it assigned to each
+    device in a small file below ``/run/udev/data``, named after the
+    :func:`device_id` of the device.  This class parses these files directly,
+    without going through libudev:
+
+    >>> from pyudev import Context, UdevDatabase
+    >>> context = Context()
+    >>> database = UdevDatabase(context)
+    >>> records = database.load()
+    >>> records['b8:0'].properties['ID_MODEL']
+    'Samsung_SSD_860'
+
+    Loading all records with :meth:`load` is a single sequential pass over
+    the directory, which is much cheaper than querying the properties of each
+    device through libudev.
+
+    Note that the database only holds what udev added to a device.  Kernel
+    properties from the ``uevent`` file, like ``DEVNAME`` or ``DEVTYPE``, are
+    not part of it.
+
+    .. versionadded:: 0.25
+    """
+
+    # prefixes of the files holding device records
+    _PREFIXES = frozenset("bcn+")
+
+    def __init__(self, context, path=None):
+        """
+        Create a reader for the database of ``context``.
+
+        ``path`` is the directory holding the device records as string.  If
+        ``None``, the ``data`` directory below :attr:`Context.run_path` is
+        used.
+        """
+        self.context = context
+        self.path = os.path.join(context.run_path, "data") if path is None else path
+        self._device_path = context.device_path
+
+    def _read(self, path):
+        """
+        Parse the record file at ``path``.
+
+        Raise :exc:`~exceptions.EnvironmentError`, if it cannot be read.
+        """
+        with open(path, "rb") as record:
+            return parse_record(record.read(), self._device_path)
+
+    def __getitem__(self, identifier):
+        """
+        Return the :class:`UdevDatabaseRecord` of the device with the
+        :func:`device_id` ``identifier``.
+
+        Raise :exc:`~exceptions.KeyError`, if there is no such record.
+        """
+        try:
+            return self._read(os.path.join(self.path, identifier))
+        except EnvironmentError as err:
+            raise KeyError(identifier) from err
+
+    def get(self, identifier, default=None):
+        """
+        Return the record of the device with the :func:`device_id`
+        ``identifier``, or ``default`` if there is no such record.
+        """
+        try:
+            return self[identifier]
+        except KeyError:
+            return default
+
+    def record_for(self, device):
+        """
+        Return the record of the :class:`Device` ``device``, or ``None`` if
+        udev has no record for it.
+        """
+        interface_index = None
+        if device.subsystem == "net":
+            interface_index = device.properties.get("IFINDEX")
+        return self.get(
+            device_id(
+                device.subsystem, device.sys_name, device.device_number, interface_index
+            )
+        )
+
+    def load(self):
+        """
+        Load all device records.
+
+        Records which disappear while loading are skipped.  If the database
+        directory does not exist, no records are returned.
+
+        Return a dictionary mapping the :func:`device_id` of each device to
+        its :class:`UdevDatabaseRecord`.
+        """
+        records = {}
+        try:
+            entries = os.scandir(self.path)
+        except EnvironmentError:
+            return records
+        with entries:
+            for entry in entries:
+                if entry.name[0] not in self._PREFIXES:
+                    continue
+                try:
+                    records[entry.name] = self._read(entry.path)
+                except EnvironmentError:
+                    continue
+        return records
@@ -441,6 +441,53 @@ def test_inequality(self, a_device):
         assert not (a_device.parent != a_device.parent)
         assert a_device != a_device.parent
 
+    @given(strategies.sampled_from(_DEVICES))
+    @settings(max_examples=5)
+    def test_identity_cached(self, a_device):
+        """
+        Verify that identity fields are fetched from libudev only once.
+        """
+        device = Devices.from_sys_path(_CONTEXT, a_device.sys_path)
+        expected = (
+            a_device.device_path,
+            a_device.sys_path,
+            a_device.subsystem,
+            a_device.sys_name,
+            a_device.device_type,
+            hash(a_device),
+            repr(a_device),
+        )
+        libudev = _CONTEXT._libudev
+        names = (
+            "udev_device_get_devpath",
+            "udev_device_get_syspath",
+            "udev_device_get_subsystem",
+            "udev_device_get_sysname",
+            "udev_device_get_devtype",
+        )
+        mocks = dict(
+            (name, mock.patch.object(libudev, name, wraps=getattr(libudev, name)))
+            for name in names
+        )
+        calls = dict((name, patcher.start()) for name, patcher in mocks.items())
+        try:
+            for _ in range(3):
+                assert (
+                    device.device_path,
+                    device.sys_path,
+                    device.subsystem,
+                    device.sys_name,
+                    device.device_type,
+                    hash(device),
+                    repr(device),
+                ) == expected
+                assert device == device
+        finally:
+            for patcher in mocks.values():
+                patcher.stop()
+        for name in names:
+            assert calls[name].call_count == 1
+
     @given(strategies.sampled_from(_DEVICES))
     @settings(max_examples=1)
     def test_device_ordering(self, a_device):
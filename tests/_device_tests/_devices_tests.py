@@ -23,6 +23,11 @@
 import os
 import stat
 
+try:
+    from unittest import mock
+except ImportError:
+    import mock
+
 import pytest
 from hypothesis import assume, given, settings
 
@@ -34,6 +39,11 @@
     DeviceNotFoundInEnvironmentError,
     Devices,
 )
+from pyudev._errors import (
+    DeviceNotFoundByInterfaceIndexError,
+    DeviceNotFoundByKernelDeviceError,
+)
+from pyudev._util import get_device_type
 
 from .._constants import (
     _CONTEXT,
@@ -45,6 +55,20 @@
 from ..utils import failed_health_check_wrapper
 
 
+class _LibudevWithoutDeviceId:
+    """
+    A libudev, which lacks ``udev_device_new_from_device_id()``.
+    """
+
+    def __init__(self, libudev):
+        self._libudev = libudev
+
+    def __getattr__(self, name):
+        if name == "udev_device_new_from_device_id":
+            raise AttributeError(name)
+        return getattr(self._libudev, name)
+
+
 class TestDevices:
     """
     Test ``Devices`` methods.
@@ -203,6 +227,96 @@ def test_from_device_file_non_existing(self, tmpdir):
         with pytest.raises(DeviceNotFoundByFileError):
             Devices.from_device_file(_CONTEXT, str(filename))
 
+    _node_devices = [d for d in _CONTEXT.list_devices() if d.device_node][:50]
+
+    @pytest.mark.skipif(len(_node_devices) == 0, reason="no device with a node")
+    def test_from_device_numbers(self):
+        """
+        from_device_numbers() resolves each distinct number once, and maps
+        missing devices to errors.
+        """
+        pairs = [
+            ("block" if d.subsystem == "block" else "char", d.device_number)
+            for d in self._node_devices
+        ]
+        missing = ("char", os.makedev(4095, 1048575))
+        with mock.patch.object(
+            Devices, "from_device_number", wraps=Devices.from_device_number
+        ) as lookup:
+            devices = Devices.from_device_numbers(_CONTEXT, pairs + pairs + [missing])
+            assert lookup.call_count == len(set(pairs)) + 1
+        assert [devices[pair] for pair in pairs] == self._node_devices
+        assert isinstance(devices[missing], DeviceNotFoundByNumberError)
+
+    @pytest.mark.skipif(len(_node_devices) == 0, reason="no device with a node")
+    def test_from_device_files(self, tmpdir):
+        """
+        from_device_files() checks each file once, shares devices between
+        links to the same device, and maps bad files to errors.
+        """
+        link = tmpdir.join("link")
+        link.mksymlinkto(self._node_devices[0].device_node)
+        regular = tmpdir.join("regular")
+        regular.write("")
+        missing = tmpdir.join("missing")
+        filenames = [d.device_node for d in self._node_devices]
+        filenames += [str(link), str(regular), str(missing)]
+        with mock.patch(
+            "pyudev.device._device.get_device_type", wraps=get_device_type
+        ) as type_call:
+            devices = Devices.from_device_files(_CONTEXT, filenames + filenames)
+            assert type_call.call_count == len(filenames)
+        for device in self._node_devices:
+            assert devices[device.device_node] == device
+        assert devices[str(link)] is devices[self._node_devices[0].device_node]
+        assert isinstance(devices[str(regular)], DeviceNotFoundByFileError)
+        assert isinstance(devices[str(missing)], DeviceNotFoundByFileError)
+
+    _net_devices = list(_CONTEXT.list_devices(subsystem="net"))
+
+    @pytest.mark.skipif(len(_net_devices) == 0, reason="no network device")
+    @pytest.mark.parametrize("device_id", [True, False])
+    def test_from_interface_index(self, device_id):
+        """
+        from_interface_index() finds network devices by their index given as
+        integer or string, with and without device id support in libudev.
+        """
+        libudev = _CONTEXT._libudev
+        if not device_id:
+            libudev = _LibudevWithoutDeviceId(libudev)
+        with mock.patch.object(_CONTEXT, "_libudev", libudev):
+            for device in self._net_devices:
+                ifindex = device.attributes.asint("ifindex")
+                assert Devices.from_interface_index(_CONTEXT, ifindex) == device
+                assert Devices.from_interface_index(_CONTEXT, str(ifindex)) == device
+                assert Devices.from_kernel_device(_CONTEXT, f"n{ifindex}") == device
+            for ifindex in (2**31 - 1, "eth0"):
+                with pytest.raises(DeviceNotFoundByInterfaceIndexError):
+                    Devices.from_interface_index(_CONTEXT, ifindex)
+
+    @given(_CONTEXT_STRATEGY, device_strategy())
+    @settings(max_examples=5)
+    def test_from_kernel_device(self, a_context, a_device):
+        """
+        from_kernel_device() finds devices by their kernel device id.
+        """
+        if a_device.device_number:
+            kind = "b" if a_device.subsystem == "block" else "c"
+            number = a_device.device_number
+            kernel_device = f"{kind}{os.major(number)}:{os.minor(number)}"
+        else:
+            assume(a_device.subsystem is not None and a_device.subsystem != "net")
+            kernel_device = f"+{a_device.subsystem}:{a_device.sys_name}"
+        assert Devices.from_kernel_device(a_context, kernel_device) == a_device
+
+    @pytest.mark.parametrize("kernel_device", ["", "x1", "b8", "+block", "+:sda"])
+    def test_from_kernel_device_invalid(self, kernel_device):
+        """
+        from_kernel_device() raises for malformed kernel device ids.
+        """
+        with pytest.raises(DeviceNotFoundByKernelDeviceError):
+            Devices.from_kernel_device(_CONTEXT, kernel_device)
+
     @_UDEV_TEST(152, "test_from_environment")
     def test_from_environment(self):
         """
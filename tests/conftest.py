@@ -36,3 +36,14 @@ def context(request):
         return pyudev.Context()
     except ImportError:
         pytest.skip("udev not available")
+
+
+@pytest.fixture
+def loopback_device(context):
+    """
+    Return the :class:`pyudev.Device` of the loopback network interface.
+    """
+    try:
+        return pyudev.Devices.from_path(context, "/devices/virtual/net/lo")
+    except pyudev.DeviceNotFoundError:
+        pytest.skip("no loopback network device")
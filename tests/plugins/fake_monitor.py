@@ -69,6 +69,19 @@ def poll(self, timeout=None):
             os.read(self._event_source, 1)
             return self.device_to_emit
 
+    def poll_many(self, max_events, timeout=None):
+        devices = []
+        device = self.poll(timeout)
+        while device is not None:
+            devices.append(device)
+            if len(devices) >= max_events:
+                break
+            device = self.poll(timeout=0)
+        return devices
+
+    def _receive_device(self):
+        return self.poll(timeout=0)
+
     def close(self):
         """
         Close sockets acquired by this monitor.
@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2026 pyudev contributors
+
+# This library is free software; you can redistribute it and/or modify it
+# under the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation; either version 2.1 of the License, or (at your
+# option) any later version.
+
+# This library is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE.  See the GNU Lesser General Public License
+# for more details.
+
+# You should have received a copy of the GNU Lesser General Public License
+# along with this library; if not, write to the Free Software Foundation,
+# Inc., 51 Franklin St, Fifth Floor, Boston, MA 02110-1301 USA
+
+
+import asyncio
+import errno
+
+import pytest
+
+from pyudev.aio import AsyncMonitor
+
+try:
+    from unittest import mock
+except ImportError:
+    import mock
+
+
+@pytest.fixture
+def fake_monitor_device():
+    return mock.sentinel.device
+
+
+def _run(coroutine):
+    return asyncio.run(asyncio.wait_for(coroutine, 5))
+
+
+def test_receive(fake_monitor):
+    async def receive():
+        events = AsyncMonitor(fake_monitor)
+        assert await events.receive(timeout=0.01) is None
+        assert fake_monitor.started
+        fake_monitor.trigger_event()
+        fake_monitor.trigger_event()
+        devices = [await events.receive(), await events.receive(timeout=1)]
+        assert await events.receive(timeout=0) is None
+        events.close()
+        return devices
+
+    assert _run(receive()) == [mock.sentinel.device] * 2
+
+
+def test_iteration(fake_monitor):
+    async def iterate():
+        devices = []
+        async with AsyncMonitor(fake_monitor) as events:
+            for _ in range(3):
+                fake_monitor.trigger_event()
+            async for device in events:
+                devices.append(device)
+                if len(devices) == 3:
+                    asyncio.get_running_loop().call_soon(events.close)
+        return devices
+
+    assert _run(iterate()) == [mock.sentinel.device] * 3
+
+
+def test_drains_all_pending_events(fake_monitor):
+    async def drain():
+        events = AsyncMonitor(fake_monitor, max_pending=2)
+        events.start()
+        for _ in range(5):
+            fake_monitor.trigger_event()
+        with mock.patch.object(
+            fake_monitor, "_receive_device", wraps=fake_monitor._receive_device
+        ) as receive:
+            await asyncio.sleep(0.01)
+            # the queue is full, so the monitor is not watched anymore
+            assert receive.call_count == 2
+            assert len([await events.receive() for _ in range(5)]) == 5
+        events.close()
+
+    _run(drain())
+
+
+def test_error(fake_monitor):
+    async def fail():
+        events = AsyncMonitor(fake_monitor)
+        error = EnvironmentError(errno.ENOBUFS, "No buffer space available")
+        with mock.patch.object(fake_monitor, "_receive_device", side_effect=error):
+            fake_monitor.trigger_event()
+            with pytest.raises(EnvironmentError):
+                await events.receive()
+        assert await events.receive() is mock.sentinel.device
+        events.close()
+        assert await events.receive() is None
+
+    _run(fail())
+
+
+def test_closed(fake_monitor):
+    events = AsyncMonitor(fake_monitor)
+    events.close()
+    assert _run(events.receive()) is None
+    with pytest.raises(RuntimeError):
+        events.start()
@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2026 pyudev contributors
+
+# This library is free software; you can redistribute it and/or modify it
+# under the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation; either version 2.1 of the License, or (at your
+# option) any later version.
+
+# This library is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE.  See the GNU Lesser General Public License
+# for more details.
+
+# You should have received a copy of the GNU Lesser General Public License
+# along with this library; if not, write to the Free Software Foundation,
+# Inc., 51 Franklin St, Fifth Floor, Boston, MA 02110-1301 USA
+
+
+import pytest
+
+from pyudev import EnumerationCache, Enumerator
+
+try:
+    from unittest import mock
+except ImportError:
+    import mock
+
+
+def _event(subsystem, tags=()):
+    return mock.Mock(subsystem=subsystem, tags=list(tags))
+
+
+@pytest.fixture
+def cache(request):
+    return EnumerationCache(request.getfixturevalue("context"))
+
+
+def test_match_spec_normalized(context):
+    first = context.list_devices(subsystem="block").match_property("DEVTYPE", "disk")
+    second = context.list_devices(DEVTYPE=b"disk", subsystem=b"block")
+    second.match_subsystem("block")
+    assert first.match_spec == second.match_spec
+    assert first.match_spec != context.list_devices(subsystem="net").match_spec
+
+
+def test_get_cached(cache):
+    devices = cache.list_devices(subsystem="net")
+    assert cache.list_devices(subsystem="net") is devices
+    assert cache.list_devices() is not devices
+
+
+def test_invalidate_by_subsystem(cache):
+    net = cache.list_devices(subsystem="net")
+    block = cache.list_devices(subsystem="block")
+    everything = cache.list_devices()
+    cache.invalidate(_event("net"))
+    assert cache.list_devices(subsystem="net") is not net
+    assert cache.list_devices(subsystem="block") is block
+    assert cache.list_devices() is not everything
+
+
+def test_invalidate_by_subsystem_glob(cache):
+    with mock.patch.object(Enumerator, "__iter__", return_value=iter(())) as scan:
+        cache.list_devices(subsystem="usb*")
+        cache.invalidate(_event("block"))
+        cache.list_devices(subsystem="usb*")
+        assert scan.call_count == 1
+        cache.invalidate(_event("usbmisc"))
+        cache.list_devices(subsystem="usb*")
+        assert scan.call_count == 2
+
+
+def test_invalidate_nomatch_subsystem(cache):
+    not_net = cache.get(cache.context.list_devices().match_subsystem("net", True))
+    cache.invalidate(_event("net"))
+    assert (
+        cache.get(cache.context.list_devices().match_subsystem("net", True)) is not_net
+    )
+
+
+def test_invalidate_by_tag(cache):
+    with mock.patch.object(Enumerator, "__iter__", return_value=iter(())) as scan:
+        cache.list_devices(tag="seat")
+        cache.invalidate(_event("input", ["uaccess"]))
+        cache.list_devices(tag="seat")
+        assert scan.call_count == 1
+        cache.invalidate(_event("input", ["seat", "uaccess"]))
+        cache.list_devices(tag="seat")
+        assert scan.call_count == 2
+
+
+def test_invalidate_during_scan(cache):
+    """
+    A result scanned before a concurrent invalidation is not cached.
+    """
+    enumerator = cache.context.list_devices(subsystem="net")
+    real_iter = type(enumerator).__iter__
+
+    def invalidating_iter(self):
+        cache.invalidate(_event("net"))
+        return real_iter(self)
+
+    with mock.patch.object(type(enumerator), "__iter__", invalidating_iter):
+        devices = cache.get(enumerator)
+    assert cache.list_devices(subsystem="net") is not devices
+
+
+def test_clear(cache):
+    devices = cache.list_devices(subsystem="block")
+    cache.clear()
+    assert cache.list_devices(subsystem="block") is not devices
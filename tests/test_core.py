@@ -16,10 +16,12 @@
 # Inc., 51 Franklin St, Fifth Floor, Boston, MA 02110-1301 USA
 
 
+import gc
 import random
 import syslog
 
-from pyudev import udev_version
+from pyudev import Context, Devices, udev_version
+from pyudev._ctypeslib import utils
 from tests._constants import _UDEV_TEST
 from tests.utils import is_unicode_string
 
@@ -37,7 +39,49 @@ def test_udev_version():
     assert udev_version() > 150
 
 
+def test_get_ctypes_library_shared():
+    with mock.patch.dict(utils._LIBRARIES, clear=True):
+        with mock.patch.object(
+            utils, "load_ctypes_library", autospec=True
+        ) as load_ctypes_library:
+            load_ctypes_library.return_value = mock.sentinel.library
+            for _ in range(3):
+                library = utils.get_ctypes_library("spam", {}, {})
+                assert library is mock.sentinel.library
+            load_ctypes_library.assert_called_once_with("spam", {}, {})
+
+
 class TestContext:
+    def test_library_shared(self, context):
+        assert Context()._libudev is context._libudev
+
+    def test_interns_devices(self, context):
+        assert not context.interns_devices
+        assert Context(intern_devices=True).interns_devices
+
+    def test_device_pool(self):
+        context = Context(intern_devices=True)
+        devices = list(context.list_devices(subsystem="block"))
+        if not devices:
+            devices = list(context.list_devices())
+        device = devices[0]
+        assert Devices.from_sys_path(context, device.sys_path) is device
+        for ancestor in device.ancestors:
+            assert Devices.from_sys_path(context, ancestor.sys_path) is ancestor
+            assert ancestor.parent is ancestor.parent
+        # another context has its own pool
+        assert Devices.from_sys_path(Context(), device.sys_path) is not device
+
+    def test_device_pool_is_weak(self):
+        context = Context(intern_devices=True)
+        device = next(iter(context.list_devices()))
+        sys_path = device.sys_path
+        del device
+        # interpreters without reference counting free the device later
+        gc.collect()
+        assert not context._device_pool
+        assert Devices.from_sys_path(context, sys_path).sys_path == sys_path
+
     def test_sys_path(self, context):
         assert is_unicode_string(context.sys_path)
         assert context.sys_path == "/sys"
@@ -0,0 +1,335 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2026 pyudev contributors
+
+# This library is free software; you can redistribute it and/or modify it
+# under the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation; either version 2.1 of the License, or (at your
+# option) any later version.
+
+# This library is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE.  See the GNU Lesser General Public License
+# for more details.
+
+# You should have received a copy of the GNU Lesser General Public License
+# along with this library; if not, write to the Free Software Foundation,
+# Inc., 51 Franklin St, Fifth Floor, Boston, MA 02110-1301 USA
+
+
+import collections
+import threading
+import time
+
+import pytest
+
+from pyudev import Debouncer, EventQueue, KeyedDispatcher, MonitorObserver
+
+try:
+    from unittest import mock
+except ImportError:
+    import mock
+
+FakeDevice = collections.namedtuple("FakeDevice", "device_path action")
+
+
+@pytest.fixture
+def fake_monitor_device():
+    return FakeDevice("/devices/fake", "add")
+
+
+def test_invalid_workers():
+    with pytest.raises(ValueError):
+        KeyedDispatcher(print, workers=0)
+
+
+def test_not_started():
+    dispatcher = KeyedDispatcher(print)
+    with pytest.raises(RuntimeError):
+        dispatcher.dispatch(FakeDevice("/devices/a", "add"))
+
+
+def test_order_per_key():
+    events = collections.defaultdict(list)
+    dispatcher = KeyedDispatcher(
+        lambda d: events[d.device_path].append(d.action), workers=3
+    )
+    dispatcher.start()
+    assert dispatcher.started
+    actions = ["add", "change", "remove"] * 20
+    for action in actions:
+        for path in ("/devices/a", "/devices/b", "/devices/c"):
+            dispatcher.dispatch(FakeDevice(path, action))
+    dispatcher.stop()
+    assert not dispatcher.started
+    assert dict(events) == {
+        "/devices/a": actions,
+        "/devices/b": actions,
+        "/devices/c": actions,
+    }
+
+
+def test_parallel_keys():
+    blocked = threading.Event()
+    handled = threading.Event()
+
+    def callback(device):
+        if device.device_path == "/devices/slow":
+            assert blocked.wait(5)
+        else:
+            handled.set()
+
+    # a constant key for each device, to not depend on string hashing
+    key = {"/devices/slow": 0, "/devices/fast": 1}.get
+    dispatcher = KeyedDispatcher(callback, workers=2, key=lambda d: key(d.device_path))
+    dispatcher.start()
+    dispatcher.dispatch(FakeDevice("/devices/slow", "change"))
+    dispatcher.dispatch(FakeDevice("/devices/fast", "change"))
+    try:
+        assert handled.wait(5)
+    finally:
+        blocked.set()
+        dispatcher.stop()
+
+
+def test_callback_error():
+    handled = []
+
+    def callback(device):
+        if device.action == "change":
+            raise ValueError(device)
+        handled.append(device.action)
+
+    dispatcher = KeyedDispatcher(callback, workers=1)
+    dispatcher.start()
+    with mock.patch("threading.excepthook") as excepthook:
+        for action in ("add", "change", "remove"):
+            dispatcher.dispatch(FakeDevice("/devices/a", action))
+        dispatcher.stop()
+    assert handled == ["add", "remove"]
+    assert excepthook.call_count == 1
+    assert excepthook.call_args[0][0].exc_type is ValueError
+
+
+def test_observer_workers(fake_monitor, fake_monitor_device):
+    events = []
+    done = threading.Event()
+
+    def callback(device):
+        assert threading.current_thread() is not observer
+        events.append(device)
+        if len(events) == 2:
+            # equivalent to send_stop() in a worker
+            observer.stop()
+            done.set()
+
+    observer = MonitorObserver(fake_monitor, callback=callback, workers=2)
+    observer.start()
+    fake_monitor.trigger_event()
+    fake_monitor.trigger_event()
+    assert done.wait(5)
+    observer.join(5)
+    assert not observer.is_alive()
+    assert events == [fake_monitor_device] * 2
+
+
+def _devices(*paths):
+    return [FakeDevice(path, "change") for path in paths]
+
+
+def _drain(events):
+    devices = []
+    while len(events):
+        devices.append(events.get(timeout=0))
+    return devices
+
+
+@pytest.mark.parametrize(
+    "capacity,policy", [(0, "block"), (1, "spam"), (-1, "drop-oldest")]
+)
+def test_queue_invalid(capacity, policy):
+    with pytest.raises(ValueError):
+        EventQueue(capacity, policy)
+
+
+def test_queue_drop_oldest():
+    events = EventQueue(2, "drop-oldest")
+    devices = _devices("/a", "/b", "/c", "/d")
+    assert all(events.put(device) for device in devices)
+    assert (events.enqueued, events.dropped, events.high_water) == (4, 2, 2)
+    assert _drain(events) == devices[2:]
+
+
+def test_queue_drop_newest():
+    events = EventQueue(2, "drop-newest")
+    devices = _devices("/a", "/b", "/c", "/d")
+    assert [events.put(device) for device in devices] == [True, True, False, False]
+    assert (events.enqueued, events.dropped, events.high_water) == (4, 2, 2)
+    assert _drain(events) == devices[:2]
+
+
+def test_queue_coalesce():
+    events = EventQueue(2, "coalesce")
+    first, second, third = devices = [
+        FakeDevice("/a", "add"),
+        FakeDevice("/b", "add"),
+        FakeDevice("/a", "remove"),
+    ]
+    assert all(events.put(device) for device in devices)
+    assert (events.enqueued, events.dropped, events.high_water) == (3, 1, 2)
+    assert _drain(events) == [third, second]
+    # a full queue without an event of the same device behaves like "block"
+    events.put(first)
+    events.put(second)
+    assert not events.put(third._replace(device_path="/c"), timeout=0.01)
+    assert events.dropped == 2
+
+
+def test_queue_coalesce_blocked_producers():
+    events = EventQueue(2, "coalesce")
+    events.put(FakeDevice("/x", "add"))
+    events.put(FakeDevice("/y", "add"))
+    producers = [
+        threading.Thread(target=events.put, args=(FakeDevice("/k", action),))
+        for action in ("add", "change")
+    ]
+    for producer in producers:
+        producer.start()
+    for _ in range(500):
+        if events.enqueued == 4:
+            break
+        time.sleep(0.01)
+    assert [events.get(timeout=5).device_path for _ in range(2)] == ["/x", "/y"]
+    for producer in producers:
+        producer.join(5)
+    assert [device.device_path for device in _drain(events)] == ["/k"]
+    assert events.dropped == 1
+
+
+def test_queue_block():
+    events = EventQueue(1)
+    first, second = _devices("/a", "/b")
+    events.put(first)
+    assert not events.put(second, timeout=0.01)
+    thread = threading.Thread(target=events.put, args=(second,))
+    thread.start()
+    assert events.get(timeout=5) == first
+    assert events.get(timeout=5) == second
+    thread.join(5)
+    assert (events.enqueued, events.dropped, events.high_water) == (3, 1, 1)
+
+
+def test_queue_close():
+    events = EventQueue()
+    events.put(FakeDevice("/a", "add"))
+    assert events.get(timeout=0.01) is not None
+    assert events.get(timeout=0.01) is None
+    thread = threading.Thread(target=events.get)
+    thread.start()
+    events.close()
+    thread.join(5)
+    assert not thread.is_alive()
+    assert events.closed
+    with pytest.raises(RuntimeError):
+        events.put(FakeDevice("/a", "add"))
+
+
+def test_dispatcher_capacity():
+    handling = threading.Event()
+    blocked = threading.Event()
+
+    def callback(device):
+        handling.set()
+        assert blocked.wait(5)
+
+    dispatcher = KeyedDispatcher(callback, workers=1, capacity=1, policy="drop-newest")
+    dispatcher.start()
+    first, *devices = _devices(*"abcd")
+    try:
+        assert dispatcher.dispatch(first)
+        assert handling.wait(5)
+        results = [dispatcher.dispatch(device) for device in devices]
+    finally:
+        blocked.set()
+        dispatcher.stop()
+    assert results == [True, False, False]
+    (events,) = dispatcher.queues
+    assert (events.enqueued, events.dropped, events.high_water) == (4, 2, 1)
+
+
+def test_observer_queue(fake_monitor):
+    observer = MonitorObserver(
+        fake_monitor, callback=print, workers=2, capacity=8, policy="coalesce"
+    )
+    assert [(q.capacity, q.policy) for q in observer.dispatcher.queues] == [
+        (8, "coalesce")
+    ] * 2
+    assert MonitorObserver(fake_monitor, callback=print).dispatcher is None
+
+
+def _actions(devices):
+    return [(d.device_path, d.action) for d in devices]
+
+
+def test_debouncer_invalid():
+    with pytest.raises(ValueError):
+        Debouncer(-1)
+
+
+def test_debouncer_collapse_changes():
+    debouncer = Debouncer(1)
+    debouncer.push(FakeDevice("/a", "change"), now=0)
+    debouncer.push(FakeDevice("/b", "add"), now=0.5)
+    for now in (0.1, 0.2, 0.3):
+        debouncer.push(FakeDevice("/a", "change"), now=now)
+    latest = FakeDevice("/a", "change")
+    debouncer.push(latest, now=0.9)
+    assert len(debouncer) == 2
+    assert debouncer.collapsed == 4
+    assert debouncer.timeout(now=0.25) == 0.75
+    assert debouncer.flush(now=0.99) == []
+    assert debouncer.flush(now=1) == [latest]
+    assert debouncer.timeout(now=1) == 0.5
+    assert _actions(debouncer.flush(now=1.5)) == [("/b", "add")]
+    assert debouncer.timeout() is None
+    assert len(debouncer) == 0
+
+
+def test_debouncer_cancel_add_remove():
+    debouncer = Debouncer(1)
+    for action in ("add", "change", "change", "remove"):
+        debouncer.push(FakeDevice("/a", action), now=0)
+    assert len(debouncer) == 0
+    assert (debouncer.collapsed, debouncer.cancelled) == (1, 3)
+    assert debouncer.timeout(now=0) is None
+    assert debouncer.flush(now=2) == []
+    # a later add is held on its own
+    debouncer.push(FakeDevice("/a", "add"), now=3)
+    assert debouncer.timeout(now=3) == 1
+    assert _actions(debouncer.flush(now=4)) == [("/a", "add")]
+
+
+def test_debouncer_keeps_order():
+    debouncer = Debouncer(1)
+    for action in ("remove", "add", "change", "remove", "add", "bind"):
+        debouncer.push(FakeDevice("/a", action), now=0)
+    assert _actions(debouncer.flush_all()) == [
+        ("/a", "remove"),
+        ("/a", "add"),
+        ("/a", "bind"),
+    ]
+
+
+def test_observer_debounce(fake_monitor, fake_monitor_device):
+    events = []
+    observer = MonitorObserver(fake_monitor, callback=events.append, debounce=0.05)
+    observer.start()
+    for _ in range(5):
+        fake_monitor.trigger_event()
+    for _ in range(100):
+        if events:
+            break
+        time.sleep(0.05)
+    observer.stop()
+    # the fake device is an "add", which is not collapsed
+    assert events == [fake_monitor_device] * 5
+    assert len(observer.debouncer) == 0
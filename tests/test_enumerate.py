@@ -16,6 +16,7 @@
 # Inc., 51 Franklin St, Fifth Floor, Boston, MA 02110-1301 USA
 
 
+import pytest
 from hypothesis import given, settings, strategies
 
 from ._constants import (
@@ -267,3 +268,82 @@ def test_match_passthrough_property(self, enumerator):
             posargs = [args for args, _ in match_property.call_args_list]
             assert ("spam", mock.sentinel.spam) in posargs
             assert ("eggs", mock.sentinel.eggs) in posargs
+
+
+class TestEnumeratorSnapshot:
+    """
+    Test Enumerator.snapshot().
+    """
+
+    @failed_health_check_wrapper
+    @given(_CONTEXT_STRATEGY, _SUBSYSTEM_STRATEGY)
+    @settings(max_examples=5)
+    def test_snapshot(self, context, subsystem):
+        """
+        A snapshot holds the same devices and data as iteration does.
+        """
+        devices = list(context.list_devices(subsystem=subsystem))
+        table = context.list_devices(subsystem=subsystem).snapshot()
+        assert frozenset(table.column("sys_path")) == frozenset(
+            d.sys_path for d in devices
+        )
+        for device in devices:
+            index = table.index_of(device.sys_path)
+            row = table[index]
+            assert row.subsystem == device.subsystem
+            assert row.device_type == device.device_type
+            assert row.driver == device.driver
+            assert row.device_number == device.device_number
+            assert row.device_node == device.device_node
+            assert table.properties(index) == dict(device.properties)
+
+    @failed_health_check_wrapper
+    @given(_CONTEXT_STRATEGY, _SUBSYSTEM_STRATEGY)
+    @settings(max_examples=5)
+    def test_snapshot_filter(self, context, subsystem):
+        """
+        Filtering a snapshot agrees with matching in libudev.
+        """
+        table = context.list_devices().snapshot().filter(subsystem=subsystem)
+        assert frozenset(table.column("sys_path")) == frozenset(
+            d.sys_path for d in context.list_devices(subsystem=subsystem)
+        )
+
+
+class TestEnumeratorIteration:
+    """
+    Test the alternative iteration modes of Enumerator.
+    """
+
+    @failed_health_check_wrapper
+    @given(_CONTEXT_STRATEGY, _SUBSYSTEM_STRATEGY)
+    @settings(max_examples=5)
+    def test_iter_sys_paths(self, context, subsystem):
+        """
+        Paths agree with those of the devices yielded by iteration.
+        """
+        paths = list(context.list_devices(subsystem=subsystem).iter_sys_paths())
+        assert all(isinstance(path, str) for path in paths)
+        assert frozenset(paths) == frozenset(
+            d.sys_path for d in context.list_devices(subsystem=subsystem)
+        )
+
+    @given(_CONTEXT_STRATEGY, strategies.integers(min_value=1, max_value=50))
+    @settings(max_examples=5)
+    def test_iter_batches(self, context, size):
+        """
+        Batches have the requested size and together hold all devices.
+        """
+        batches = list(context.list_devices().iter_batches(size))
+        assert all(len(batch) == size for batch in batches[:-1])
+        assert 0 < len(batches[-1]) <= size
+        assert [d for batch in batches for d in batch] == list(context.list_devices())
+
+    @given(_CONTEXT_STRATEGY, strategies.integers(max_value=0))
+    @settings(max_examples=1)
+    def test_iter_batches_invalid_size(self, context, size):
+        """
+        A batch size that is not positive is rejected.
+        """
+        with pytest.raises(ValueError):
+            next(context.list_devices().iter_batches(size))
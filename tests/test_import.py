@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2026 pyudev contributors
+
+# This library is free software; you can redistribute it and/or modify it
+# under the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation; either version 2.1 of the License, or (at your
+# option) any later version.
+
+# This library is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE.  See the GNU Lesser General Public License
+# for more details.
+
+# You should have received a copy of the GNU Lesser General Public License
+# along with this library; if not, write to the Free Software Foundation,
+# Inc., 51 Franklin St, Fifth Floor, Boston, MA 02110-1301 USA
+"""
+Guard the cost of ``import pyudev``, which is paid by every program run from
+a udev rule.
+"""
+
+import os
+import platform
+import subprocess
+import sys
+
+import pytest
+
+import pyudev
+
+# modules, which are expensive to import and must not be imported by
+# "import pyudev" itself
+_EXPENSIVE_MODULES = ("ctypes", "subprocess", "pyudev._ctypeslib", "pyudev.core")
+
+
+def _run_python(*args):
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        [os.path.dirname(os.path.dirname(pyudev.__file__))]
+        + [p for p in [env.get("PYTHONPATH")] if p]
+    )
+    return subprocess.run(
+        [sys.executable] + list(args),
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def test_import_is_lazy():
+    """
+    Importing pyudev imports no submodule but the version.
+    """
+    result = _run_python(
+        "-c",
+        "import sys, pyudev; "
+        "print(' '.join(m for m in sys.modules if m.startswith('pyudev')))",
+    )
+    assert sorted(result.stdout.split()) == ["pyudev", "pyudev.version"]
+
+
+def test_lazy_attributes():
+    assert pyudev.Context is pyudev.core.Context
+    assert pyudev.MonitorObserver is pyudev.monitor.MonitorObserver
+    assert set(pyudev.__all__) <= set(dir(pyudev))
+    with pytest.raises(AttributeError):
+        _ = pyudev.spam
+
+
+def test_import_avoids_expensive_modules():
+    """
+    Importing pyudev imports none of the expensive modules.
+    """
+    result = _run_python(
+        "-c",
+        "import sys; before = set(sys.modules); import pyudev; "
+        "print(' '.join(set(sys.modules) - before))",
+    )
+    imported = set(result.stdout.split())
+    assert "pyudev" in imported
+    assert not imported.intersection(_EXPENSIVE_MODULES)
+
+
+@pytest.mark.skipif(
+    platform.python_implementation() != "CPython",
+    reason="-X importtime is specific to CPython",
+)
+def test_import_time():
+    """
+    The import time report of pyudev lists none of the expensive modules.
+    """
+    result = _run_python("-X", "importtime", "-c", "import pyudev")
+    imported = set()
+    for line in result.stderr.splitlines():
+        if line.startswith("import time:"):
+            imported.add(line.rpartition("|")[2].strip())
+    assert "pyudev" in imported
+    assert not imported.intersection(_EXPENSIVE_MODULES)
+
+
+def test_netlink_avoids_libudev():
+    """
+    The pure Python backend imports neither ctypes nor libudev.
+    """
+    result = _run_python(
+        "-c", "import sys, pyudev.netlink; print(' '.join(sys.modules))"
+    )
+    imported = set(result.stdout.split())
+    assert "pyudev.netlink" in imported
+    assert not imported.intersection(("ctypes", "pyudev._ctypeslib", "pyudev.monitor"))
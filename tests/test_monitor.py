@@ -16,14 +16,15 @@
 # Inc., 51 Franklin St, Fifth Floor, Boston, MA 02110-1301 USA
 
 
+import errno
 import random
-from contextlib import contextmanager
+from contextlib import ExitStack, contextmanager
 from datetime import datetime, timedelta
 from select import select
 
 import pytest
 
-from pyudev import Devices, Monitor, MonitorObserver
+from pyudev import DevicePredicate, Devices, Monitor, MonitorObserver
 from tests._constants import _UDEV_TEST
 from tests.utils.udev import DeviceDatabase
 
@@ -232,6 +233,227 @@ def test_poll_timeout(self, monitor):
         assert monitor.poll(timeout=1) is None
         assert datetime.now() - now >= timedelta(seconds=1)
 
+    def test_poll_many_timeout(self, monitor):
+        assert monitor.poll_many(10, timeout=0) == []
+        assert monitor.poll_many(10, timeout=0) == []
+
+    def test_poll_many_invalid(self, monitor):
+        with pytest.raises(ValueError):
+            monitor.poll_many(0)
+
+    def test_poll_many_mock(self, monitor):
+        devices = [mock.Mock(name="device{0}".format(i)) for i in range(3)]
+        with mock.patch.object(monitor, "_wait", return_value=True) as wait:
+            with mock.patch.object(
+                monitor, "_receive_device", side_effect=devices + [None]
+            ):
+                assert monitor.poll_many(2, timeout=1) == devices[:2]
+                assert monitor.poll_many(2, timeout=1) == devices[2:]
+            assert wait.call_count == 2
+
+    def test_poll_reuses_poller(self, monitor):
+        monitor.poll(timeout=0)
+        poller = monitor._poller
+        monitor.poll_many(1, timeout=0)
+        assert monitor._poller is poller
+
+    def test_set_filters(self, monitor):
+        monitor.set_filters(subsystems=["input", ("usb", "usb_device")], tags=["seat"])
+        monitor.set_filters()
+
+    def test_set_filters_mock(self, monitor):
+        libudev = monitor._libudev
+        with ExitStack() as stack:
+            add_subsystem, add_tag, update, remove = [
+                stack.enter_context(mock.patch.object(libudev, name, return_value=0))
+                for name in (
+                    "udev_monitor_filter_add_match_subsystem_devtype",
+                    "udev_monitor_filter_add_match_tag",
+                    "udev_monitor_filter_update",
+                    "udev_monitor_filter_remove",
+                )
+            ]
+            monitor.set_filters(
+                subsystems=["input", (b"usb", "usb_device"), b"input"],
+                tags=["seat", "uaccess"],
+            )
+            assert add_subsystem.call_args_list == [
+                mock.call(monitor, b"input", None),
+                mock.call(monitor, b"usb", b"usb_device"),
+            ]
+            assert add_tag.call_args_list == [
+                mock.call(monitor, b"seat"),
+                mock.call(monitor, b"uaccess"),
+            ]
+            update.assert_called_once_with(monitor)
+            assert not remove.called
+            # installed filters are replaced
+            monitor.set_filters(tags=["seat"])
+            remove.assert_called_once_with(monitor)
+            assert update.call_count == 2
+
+    @pytest.mark.parametrize(
+        "subsystems,tags",
+        [
+            ([""], []),
+            ([None], []),
+            ([("input", "a", "b")], []),
+            ([("input", "")], []),
+            ([], ["sp\0am"]),
+            ([], [42]),
+        ],
+    )
+    def test_set_filters_invalid(self, monitor, subsystems, tags):
+        with mock.patch.object(monitor, "_libudev") as libudev:
+            with pytest.raises(ValueError):
+                monitor.set_filters(subsystems=subsystems, tags=tags)
+            assert not libudev.mock_calls
+
+    def test_set_filters_error(self, monitor):
+        libudev = monitor._libudev
+        error = EnvironmentError(errno.EINVAL, "spam")
+        update = "udev_monitor_filter_update"
+        with mock.patch.object(libudev, update, side_effect=error):
+            with mock.patch.object(libudev, "udev_monitor_filter_remove") as remove:
+                with pytest.raises(EnvironmentError):
+                    monitor.set_filters(subsystems=["input"])
+                remove.assert_called_once_with(monitor)
+        assert not monitor._filtered
+
+    def test_reopen(self, monitor):
+        monitor.set_filters(subsystems=["input"], tags=["seat"])
+        monitor.set_receive_buffer_size(65536)
+        monitor.start()
+        old_fileno = monitor.fileno()
+        monitor.reopen()
+        assert monitor.fileno() != old_fileno
+        assert monitor.started
+        assert list(monitor._subsystem_filters) == [(b"input", None)]
+        assert list(monitor._tag_filters) == [b"seat"]
+        assert not monitor.poll(timeout=0)
+
+    def test_reopen_mock(self, monitor):
+        monitor.filter_by("input", "keyboard")
+        monitor.set_receive_buffer_size(65536)
+        libudev = monitor._libudev
+        add_match = "udev_monitor_filter_add_match_subsystem_devtype"
+        set_size = "udev_monitor_set_receive_buffer_size"
+        with mock.patch.object(libudev, add_match) as add_match:
+            with mock.patch.object(libudev, set_size) as set_size:
+                monitor.reopen()
+        add_match.assert_called_once_with(monitor, b"input", b"keyboard")
+        set_size.assert_called_once_with(monitor, 65536)
+        assert not monitor.started
+
+    def test_list_devices(self, monitor):
+        monitor.filter_by("net")
+        devices = monitor.list_devices()
+        assert devices
+        assert all(device.subsystem == "net" for device in devices)
+        monitor.set_filters(subsystems=[("net", "nonexistent")])
+        assert monitor.list_devices() == []
+
+    def test_poll_many_deferred_error(self, monitor):
+        device = object()
+        error = EnvironmentError(errno.ENOBUFS, "No buffer space available")
+        receive = mock.patch.object(
+            monitor, "_receive_device", side_effect=[device, error, None]
+        )
+        with mock.patch.object(monitor, "_wait", return_value=True), receive:
+            assert monitor.poll_many(10, timeout=0) == [device]
+            with pytest.raises(EnvironmentError) as exc_info:
+                monitor.poll_many(10, timeout=0)
+            assert exc_info.value is error
+
+    def test_poll_pending_socket_error(self, monitor):
+        monitor.start()
+        error = IOError("Error while polling fd")
+        take_error = mock.patch.object(
+            monitor, "_take_error", return_value=errno.ENOBUFS
+        )
+        with take_error, mock.patch.object(monitor, "_poller") as poller:
+            poller.poll.side_effect = error
+            with pytest.raises(EnvironmentError) as exc_info:
+                monitor.poll(timeout=0)
+        assert exc_info.value.errno == errno.ENOBUFS
+
+    def test_take_error(self, monitor):
+        monitor.start()
+        assert monitor._take_error() == 0
+
+    def test_stats(self, monitor):
+        monitor.start()
+        stats = monitor.stats()
+        assert stats.received == stats.filtered == stats.overflows == 0
+        assert stats.bytes is None
+        assert stats.backlog == 0
+        assert stats.receive_buffer_size > 0
+        assert stats.subsystems == stats.actions == {}
+
+    def test_stats_counts(self, monitor):
+        libudev = monitor._libudev
+        monitor._predicate = mock.Mock(side_effect=[False, True, True])
+        # subsystems and actions are counted once statistics were requested
+        monitor.stats()
+        with ExitStack() as stack:
+            for name, value in [
+                ("udev_monitor_receive_device", None),
+                ("udev_device_get_seqnum", 0),
+                ("udev_device_get_subsystem", b"input"),
+                ("udev_device_get_action", b"add"),
+                ("udev_device_unref", None),
+            ]:
+                stack.enter_context(
+                    mock.patch.object(libudev, name, return_value=value)
+                )
+            stack.enter_context(mock.patch("pyudev.monitor.Device"))
+            libudev.udev_monitor_receive_device.side_effect = [1, 2, 3, None]
+            while monitor._receive_device() is not None:
+                pass
+        stats = monitor.stats()
+        assert (stats.received, stats.filtered) == (3, 1)
+        assert stats.subsystems == {"input": 2}
+        assert stats.actions == {"add": 2}
+
+    def test_sequence_tracked_on_demand(self, monitor):
+        libudev = monitor._libudev
+        with ExitStack() as stack:
+            for name in ("udev_device_get_subsystem", "udev_device_get_action"):
+                stack.enter_context(mock.patch.object(libudev, name))
+            seqnum = stack.enter_context(
+                mock.patch.object(libudev, "udev_device_get_seqnum", return_value=1)
+            )
+            receive = stack.enter_context(
+                mock.patch.object(libudev, "udev_monitor_receive_device")
+            )
+            stack.enter_context(mock.patch("pyudev.monitor.Device"))
+            receive.side_effect = [mock.sentinel.device_p, None]
+            monitor._receive_device()
+            assert not seqnum.called
+            monitor.stats()
+            receive.side_effect = [mock.sentinel.device_p, None]
+            monitor._receive_device()
+            seqnum.assert_called_once_with(mock.sentinel.device_p)
+
+    def test_set_predicate(self, monitor):
+        predicate = DevicePredicate(action="add")
+        monitor.set_predicate(predicate)
+        assert callable(monitor._predicate)
+        monitor.set_predicate(None)
+        assert monitor._predicate is None
+
+    def test_predicate_rejects(self, monitor):
+        monitor._predicate = mock.Mock(return_value=False)
+        receive = "udev_monitor_receive_device"
+        with mock.patch.object(monitor._libudev, receive) as receive:
+            with mock.patch.object(monitor._libudev, "udev_device_get_seqnum"):
+                unref = "udev_device_unref"
+                with mock.patch.object(monitor._libudev, unref) as unref:
+                    receive.side_effect = [mock.sentinel.device_p, None]
+                    assert monitor._receive_device() is None
+                    unref.assert_called_once_with(mock.sentinel.device_p)
+        monitor._predicate.assert_called_once_with(mock.sentinel.device_p)
+
     def test_receive_device(self, monitor):
         """
         Test that Monitor.receive_device is deprecated and calls out to
@@ -0,0 +1,353 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2026 pyudev contributors
+
+# This library is free software; you can redistribute it and/or modify it
+# under the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation; either version 2.1 of the License, or (at your
+# option) any later version.
+
+# This library is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE.  See the GNU Lesser General Public License
+# for more details.
+
+# You should have received a copy of the GNU Lesser General Public License
+# along with this library; if not, write to the Free Software Foundation,
+# Inc., 51 Franklin St, Fifth Floor, Boston, MA 02110-1301 USA
+
+
+import errno
+import socket
+import struct
+import time
+
+import pytest
+
+from pyudev import MonitorObserver
+from pyudev.netlink import NetlinkMonitor, UeventRecord, murmur_hash2, string_bloom64
+
+DISK = {
+    "ACTION": "add",
+    "DEVPATH": "/devices/pci0000:00/0000:00:14.0/usb2/2-1/block/sdb",
+    "SUBSYSTEM": "block",
+    "DEVTYPE": "disk",
+    "SEQNUM": "4711",
+    "TAGS": ":systemd:seat:",
+}
+
+
+def udev_message(properties, magic=0xFEEDCAFE):
+    """
+    Return ``properties`` as message in the format sent by udev.
+    """
+    payload = b"".join(
+        "{0}={1}\0".format(name, value).encode() for name, value in properties.items()
+    )
+    bloom = 0
+    for tag in properties.get("TAGS", "").split(":"):
+        if tag:
+            bloom |= string_bloom64(tag.encode())
+    header = struct.pack(
+        "=8sIIIIIIII",
+        b"libudev\0",
+        socket.htonl(magic),
+        40,
+        40,
+        len(payload),
+        socket.htonl(murmur_hash2(properties["SUBSYSTEM"].encode())),
+        0,
+        socket.htonl(bloom >> 32),
+        socket.htonl(bloom & 0xFFFFFFFF),
+    )
+    return header + payload
+
+
+def kernel_message(properties):
+    """
+    Return ``properties`` as message in the format sent by the kernel.
+    """
+    head = "{ACTION}@{DEVPATH}\0".format(**properties).encode()
+    return head + b"".join(
+        "{0}={1}\0".format(name, value).encode() for name, value in properties.items()
+    )
+
+
+@pytest.fixture
+def sockets():
+    sink, source = socket.socketpair(socket.AF_UNIX, socket.SOCK_DGRAM)
+    yield sink, source
+    sink.close()
+    source.close()
+
+
+@pytest.fixture
+def monitor(sockets):
+    return NetlinkMonitor(sockets[0], buffer_size=1024)
+
+
+@pytest.fixture
+def send(sockets):
+    return sockets[1].send
+
+
+@pytest.mark.parametrize(
+    "data,expected",
+    [
+        (b"", 0),
+        (b"a", 2456313694),
+        (b"ab", 446775395),
+        (b"abc", 324500635),
+        (b"usb", 91735525),
+        (b"seat", 1130053184),
+        (b"block", 4026736055),
+        (b"uaccess", 3901673676),
+    ],
+)
+def test_murmur_hash2(data, expected):
+    assert murmur_hash2(data) == expected
+
+
+def test_string_bloom64():
+    bloom = string_bloom64(b"seat")
+    assert 1 <= bin(bloom).count("1") <= 4
+    assert bloom < 1 << 64
+
+
+@pytest.mark.parametrize("message", [udev_message, kernel_message])
+def test_receive(monitor, send, message):
+    send(message(DISK))
+    record = monitor.poll(timeout=1)
+    assert record == UeventRecord(
+        "udev" if message is udev_message else "kernel",
+        "add",
+        DISK["DEVPATH"],
+        "block",
+        "disk",
+        4711,
+        DISK,
+    )
+    assert monitor.poll(timeout=0) is None
+
+
+def test_poll_many(monitor, send):
+    for seqnum in range(5):
+        send(udev_message(dict(DISK, SEQNUM=str(seqnum))))
+    records = monitor.poll_many(3, timeout=1)
+    assert [r.sequence_number for r in records] == [0, 1, 2]
+    records = monitor.poll_many(3, timeout=1)
+    assert [r.sequence_number for r in records] == [3, 4]
+    assert monitor.poll_many(3, timeout=0) == []
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        b"",
+        b"libudev\0",
+        udev_message(DISK, magic=0xDEADBEEF),
+        udev_message(DISK)[:60],
+        b"add /devices/spam\0ACTION=add\0",
+        b"x" * 2048,
+    ],
+)
+def test_invalid(monitor, send, data):
+    send(data)
+    send(udev_message(DISK))
+    assert monitor.poll(timeout=1).action == "add"
+    assert monitor.poll(timeout=0) is None
+
+
+def test_filter_by(monitor, send):
+    monitor.filter_by("block", "partition")
+    monitor.filter_by("usb")
+    send(udev_message(DISK))
+    send(kernel_message(DISK))
+    send(udev_message(dict(DISK, SUBSYSTEM="input")))
+    send(udev_message(dict(DISK, SUBSYSTEM="usb", SEQNUM="1")))
+    send(kernel_message(dict(DISK, DEVTYPE="partition", SEQNUM="2")))
+    records = monitor.poll_many(10, timeout=1)
+    assert [r.sequence_number for r in records] == [1, 2]
+    monitor.remove_filter()
+    send(udev_message(DISK))
+    assert monitor.poll(timeout=1).subsystem == "block"
+
+
+def test_filter_by_tag(monitor, send):
+    monitor.filter_by_tag("seat")
+    send(udev_message(dict(DISK, TAGS=":systemd:")))
+    send(udev_message(dict(DISK, TAGS=":uaccess:seat:", SEQNUM="1")))
+    # kernel events never have tags
+    send(kernel_message({k: v for k, v in DISK.items() if k != "TAGS"}))
+    records = monitor.poll_many(10, timeout=1)
+    assert [r.sequence_number for r in records] == [1]
+
+
+def test_is_trusted(monitor):
+    monitor._netlink = True
+    credentials = [
+        (socket.SOL_SOCKET, socket.SCM_CREDENTIALS, struct.pack("=iII", 1, 0, 0))
+    ]
+    user = [
+        (socket.SOL_SOCKET, socket.SCM_CREDENTIALS, struct.pack("=iII", 1, 1000, 0))
+    ]
+    assert monitor._is_trusted((1, 2), credentials)
+    assert monitor._is_trusted((0, 1), credentials)
+    assert not monitor._is_trusted((1, 0), credentials)
+    assert not monitor._is_trusted((1, 1), credentials)
+    assert not monitor._is_trusted((1, 2), user)
+    assert not monitor._is_trusted((1, 2), [])
+
+
+def test_invalid_source():
+    with pytest.raises(ValueError):
+        NetlinkMonitor.from_netlink("spam")
+
+
+def test_from_netlink():
+    try:
+        monitor = NetlinkMonitor.from_netlink()
+    except OSError as error:
+        pytest.skip("netlink not available: {0}".format(error))
+    with monitor:
+        assert not monitor.started
+        assert monitor.poll(timeout=0) is None
+        assert monitor.started
+
+
+def test_observer(monitor, send):
+    records = []
+    observer = MonitorObserver(monitor, callback=records.append)
+    observer.start()
+    send(udev_message(DISK))
+    send(kernel_message(DISK))
+    for _ in range(100):
+        if len(records) == 2:
+            break
+        time.sleep(0.01)
+    observer.stop()
+    assert [r.source for r in records] == ["udev", "kernel"]
+
+
+def send_sequence(send, sequence_numbers):
+    for sequence_number in sequence_numbers:
+        send(udev_message(dict(DISK, SEQNUM=str(sequence_number))))
+
+
+@pytest.mark.parametrize(
+    "source,sequence_numbers,lost",
+    [
+        ("udev", [1, 2, 4, 3, 5], 0),
+        ("udev", [1, 2, 100], 34),
+        ("kernel", [1, 2, 4, 5], 1),
+        ("kernel", [1, 2, 100], 97),
+    ],
+)
+def test_sequence_gaps(sockets, send, source, sequence_numbers, lost):
+    monitor = NetlinkMonitor(sockets[0], source=source)
+    monitor._track_sequence()
+    send_sequence(send, sequence_numbers)
+    assert len(monitor.poll_many(10, timeout=1)) == len(sequence_numbers)
+    assert monitor._sequence.lost == lost
+
+
+def test_sequence_gaps_filtered(monitor, send):
+    monitor.filter_by("block")
+    monitor._track_sequence()
+    send_sequence(send, [1, 5])
+    assert len(monitor.poll_many(10, timeout=1)) == 2
+    assert monitor._sequence.lost == 0
+
+
+def test_take_error(monitor):
+    assert monitor._take_error() == 0
+
+
+def wait_for(condition):
+    for _ in range(100):
+        if condition():
+            return
+        time.sleep(0.01)
+
+
+def test_observer_resync_gap(sockets, send):
+    monitor = NetlinkMonitor(sockets[0], source="kernel")
+    events = []
+    observer = MonitorObserver(
+        monitor,
+        callback=lambda r: events.append(r.sequence_number),
+        resync=lambda reason, devices: events.append((reason, devices)),
+    )
+    observer.start()
+    send_sequence(send, [1, 2, 5])
+    wait_for(lambda: len(events) == 4)
+    observer.stop()
+    assert events == [1, 2, 5, ("gap", None)]
+
+
+def test_observer_resync_overflow(monitor, send, monkeypatch):
+    receive_device = monitor._receive_device
+    errors = [OSError(errno.ENOBUFS, "No buffer space available")]
+
+    def overflow():
+        if errors:
+            raise errors.pop()
+        return receive_device()
+
+    monkeypatch.setattr(monitor, "_receive_device", overflow)
+    events = []
+    observer = MonitorObserver(
+        monitor,
+        callback=lambda r: events.append(r.sequence_number),
+        resync=lambda reason, devices: events.append((reason, devices)),
+    )
+    observer.start()
+    send(udev_message(DISK))
+    wait_for(lambda: len(events) == 2)
+    observer.stop()
+    assert events == [("overflow", None), 4711]
+
+
+def test_observer_resync_deferred_overflow(monitor, send, monkeypatch):
+    receive_device = monitor._receive_device
+    results = [OSError(errno.ENOBUFS, "No buffer space available"), None]
+
+    def overflow_after_event():
+        if results:
+            error = results.pop()
+            if error is not None:
+                raise error
+        return receive_device()
+
+    monkeypatch.setattr(monitor, "_receive_device", overflow_after_event)
+    events = []
+    observer = MonitorObserver(
+        monitor,
+        callback=lambda r: events.append(r.sequence_number),
+        resync=lambda reason, devices: events.append((reason, devices)),
+    )
+    observer.start()
+    send(udev_message(DISK))
+    wait_for(lambda: len(events) == 2)
+    observer.stop()
+    assert events == [4711, ("overflow", None)]
+
+
+def test_observer_reenumerate_unsupported(monitor):
+    with pytest.raises(ValueError):
+        MonitorObserver(monitor, callback=print, resync=print, reenumerate=True)
+
+
+def test_stats(monitor, send):
+    monitor.filter_by("block")
+    assert monitor.stats().subsystems == {}
+    send(udev_message(DISK))
+    send(udev_message(dict(DISK, SUBSYSTEM="input")))
+    send(b"invalid")
+    assert len(monitor.poll_many(10, timeout=1)) == 1
+    stats = monitor.stats()
+    assert (stats.received, stats.filtered) == (3, 2)
+    assert stats.bytes == 2 * len(udev_message(DISK)) + len(b"invalid")
+    assert stats.backlog is not None
+    assert stats.receive_buffer_size > 0
+    assert stats.subsystems == {"block": 1}
+    assert stats.actions == {"add": 1}
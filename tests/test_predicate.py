@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2026 pyudev contributors
+
+# This library is free software; you can redistribute it and/or modify it
+# under the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation; either version 2.1 of the License, or (at your
+# option) any later version.
+
+# This library is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE.  See the GNU Lesser General Public License
+# for more details.
+
+# You should have received a copy of the GNU Lesser General Public License
+# along with this library; if not, write to the Free Software Foundation,
+# Inc., 51 Franklin St, Fifth Floor, Boston, MA 02110-1301 USA
+
+
+import pytest
+
+from pyudev import DevicePredicate
+
+
+class FakeLibudev:
+    """
+    Read device fields from dictionaries standing in for ``udev_device *``.
+    """
+
+    def __init__(self):
+        self.calls = []
+
+    def _get(self, device_p, field):
+        self.calls.append(field)
+        return device_p.get(field)
+
+    def udev_device_get_action(self, device_p):
+        return self._get(device_p, b"ACTION")
+
+    def udev_device_get_subsystem(self, device_p):
+        return self._get(device_p, b"SUBSYSTEM")
+
+    def udev_device_get_devtype(self, device_p):
+        return self._get(device_p, b"DEVTYPE")
+
+    def udev_device_get_driver(self, device_p):
+        return self._get(device_p, b"DRIVER")
+
+    def udev_device_get_devpath(self, device_p):
+        return self._get(device_p, b"DEVPATH")
+
+    def udev_device_get_property_value(self, device_p, name):
+        return self._get(device_p, name)
+
+
+DISK = {
+    b"ACTION": b"add",
+    b"SUBSYSTEM": b"block",
+    b"DEVTYPE": b"disk",
+    b"DEVPATH": b"/devices/pci0000:00/0000:00:14.0/usb2/2-1/block/sdb",
+    b"ID_BUS": b"usb",
+    b"ID_SERIAL": b"Kingston_DataTraveler",
+}
+
+
+@pytest.fixture
+def libudev():
+    return FakeLibudev()
+
+
+@pytest.mark.parametrize(
+    "spec",
+    [
+        {},
+        {"action": "add"},
+        {"action": ["add", "remove"]},
+        {"subsystem": b"block", "device_type": "disk"},
+        {"device_path": "/devices/pci*/usb?/*"},
+        {"device_path": ["/devices/virtual/*", "*/block/sd[a-z]"]},
+        {"properties": {"ID_BUS": "usb", "ID_SERIAL": None}},
+        {"properties": {"ID_BUS": ["ata", "usb"]}},
+    ],
+)
+def test_match(libudev, spec):
+    assert DevicePredicate(**spec).compile(libudev)(DISK)
+
+
+@pytest.mark.parametrize(
+    "spec",
+    [
+        {"action": "remove"},
+        {"subsystem": "block", "device_type": "partition"},
+        {"driver": "sd"},
+        {"device_path": "/devices/virtual/*"},
+        {"properties": {"ID_BUS": "ata"}},
+        {"properties": {"ID_FS_TYPE": None}},
+    ],
+)
+def test_no_match(libudev, spec):
+    assert not DevicePredicate(**spec).compile(libudev)(DISK)
+
+
+def test_stops_at_first_failure(libudev):
+    predicate = DevicePredicate(
+        action="remove", driver="sd", properties={"ID_BUS": "usb"}
+    ).compile(libudev)
+    assert not predicate(DISK)
+    assert libudev.calls == [b"ACTION"]
+
+
+def test_reads_only_needed_fields(libudev):
+    predicate = DevicePredicate(properties={"ID_BUS": "usb"}).compile(libudev)
+    assert predicate(DISK)
+    assert libudev.calls == [b"ID_BUS"]
+
+
+def test_call_device(libudev):
+    class FakeDevice(dict):
+        _libudev = libudev
+
+    predicate = DevicePredicate(action="add")
+    assert predicate(FakeDevice(DISK))
+    removed = FakeDevice(DISK)
+    removed[b"ACTION"] = b"remove"
+    assert not predicate(removed)
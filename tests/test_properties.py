@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2026 pyudev contributors
+
+# This library is free software; you can redistribute it and/or modify it
+# under the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation; either version 2.1 of the License, or (at your
+# option) any later version.
+
+# This library is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE.  See the GNU Lesser General Public License
+# for more details.
+
+# You should have received a copy of the GNU Lesser General Public License
+# along with this library; if not, write to the Free Software Foundation,
+# Inc., 51 Franklin St, Fifth Floor, Boston, MA 02110-1301 USA
+
+
+import pytest
+
+try:
+    from unittest import mock
+except ImportError:
+    import mock
+
+
+def test_materialize(loopback_device):
+    expected = dict(loopback_device.properties)
+    properties = loopback_device.properties
+    assert not properties.is_materialized
+    assert properties.materialize() is properties
+    # the dictionary is shared by all Properties objects of the device
+    assert loopback_device.properties.is_materialized
+    assert dict(loopback_device.properties) == expected
+    assert len(loopback_device.properties) == len(expected)
+    assert list(loopback_device.properties) == list(expected)
+
+
+def test_materialized_lookup(loopback_device):
+    properties = loopback_device.properties.materialize()
+    assert properties["SUBSYSTEM"] == "net"
+    assert properties[b"SUBSYSTEM"] == "net"
+    assert properties.asint("IFINDEX") == int(
+        loopback_device.attributes.asint("ifindex")
+    )
+    with pytest.raises(KeyError):
+        properties["NO_SUCH_PROPERTY"]  # noqa: B018
+    assert "NO_SUCH_PROPERTY" not in properties
+    with pytest.raises(ValueError):
+        properties.asbool("INTERFACE")
+
+
+def test_materialized_no_libudev_calls(loopback_device):
+    properties = loopback_device.properties.materialize()
+    libudev = loopback_device._libudev
+    failing = mock.Mock(side_effect=AssertionError("libudev called"))
+    with mock.patch.object(libudev, "udev_device_get_property_value", failing):
+        with mock.patch.object(
+            libudev, "udev_device_get_properties_list_entry", failing
+        ):
+            assert properties["INTERFACE"] == "lo"
+            assert len(properties) == len(list(properties))
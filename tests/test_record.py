@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2026 pyudev contributors
+
+# This library is free software; you can redistribute it and/or modify it
+# under the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation; either version 2.1 of the License, or (at your
+# option) any later version.
+
+# This library is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE.  See the GNU Lesser General Public License
+# for more details.
+
+# You should have received a copy of the GNU Lesser General Public License
+# along with this library; if not, write to the Free Software Foundation,
+# Inc., 51 Franklin St, Fifth Floor, Boston, MA 02110-1301 USA
+
+
+import pickle
+
+import pytest
+
+from pyudev import DeviceRecord
+
+
+def test_fields(loopback_device):
+    record = loopback_device.freeze()
+    assert isinstance(record, DeviceRecord)
+    assert record.sys_path == loopback_device.sys_path
+    assert record.device_path == loopback_device.device_path
+    assert record.subsystem == loopback_device.subsystem
+    assert record.sys_name == loopback_device.sys_name
+    assert record.device_number == loopback_device.device_number
+    assert record.tags == tuple(loopback_device.tags)
+    assert dict(record.properties) == dict(loopback_device.properties)
+    assert not record.attributes
+
+
+def test_attributes(loopback_device):
+    record = loopback_device.freeze(["ifindex", "no-such-attribute"])
+    assert dict(record.attributes) == {
+        "ifindex": loopback_device.attributes.get("ifindex")
+    }
+
+
+def test_attributes_as_bytes(loopback_device):
+    record = loopback_device.freeze([b"ifindex"])
+    assert dict(record.attributes) == {
+        "ifindex": loopback_device.attributes.get("ifindex")
+    }
+
+
+def test_immutable(loopback_device):
+    record = loopback_device.freeze()
+    with pytest.raises(AttributeError):
+        record.subsystem = "block"
+    with pytest.raises(AttributeError):
+        del record.sys_path
+    with pytest.raises(TypeError):
+        record.properties["SUBSYSTEM"] = "block"
+    with pytest.raises(AttributeError):
+        record.__dict__  # noqa: B018
+
+
+def test_pickle(loopback_device):
+    record = loopback_device.freeze(["ifindex"])
+    restored = pickle.loads(pickle.dumps(record))
+    assert restored == record
+    assert hash(restored) == hash(record)
+    assert dict(restored.attributes) == dict(record.attributes)
+
+
+def test_strings_are_interned(loopback_device):
+    assert loopback_device.freeze().subsystem is loopback_device.freeze().subsystem
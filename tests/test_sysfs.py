@@ -0,0 +1,209 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2026 pyudev contributors
+
+# This library is free software; you can redistribute it and/or modify it
+# under the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation; either version 2.1 of the License, or (at your
+# option) any later version.
+
+# This library is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE.  See the GNU Lesser General Public License
+# for more details.
+
+# You should have received a copy of the GNU Lesser General Public License
+# along with this library; if not, write to the Free Software Foundation,
+# Inc., 51 Franklin St, Fifth Floor, Boston, MA 02110-1301 USA
+
+
+import gc
+import os
+
+import pytest
+
+from pyudev import SysfsAttributeReader, SysfsEnumerator
+
+
+def _add_device(root, devpath, subsystem, link_dir, uevent="", attributes=None):
+    """
+    Create the device directory ``devpath`` below ``root``, and link it into
+    ``link_dir``.
+    """
+    sys_path = root / devpath.lstrip("/")
+    sys_path.mkdir(parents=True, exist_ok=True)
+    (sys_path / "uevent").write_text(uevent)
+    for name, value in (attributes or {}).items():
+        (sys_path / name).write_text(value + "\n")
+    directory = root / link_dir
+    directory.mkdir(parents=True, exist_ok=True)
+    os.symlink(os.path.relpath(sys_path, directory), directory / sys_path.name)
+    return str(sys_path)
+
+
+@pytest.fixture
+def sysfs(tmp_path):
+    root = tmp_path / "sys"
+    _add_device(
+        root,
+        "devices/virtual/net/lo",
+        "net",
+        "class/net",
+        "INTERFACE=lo\nIFINDEX=1\n",
+        {"ifindex": "1"},
+    )
+    _add_device(
+        root,
+        "devices/pci0000:00/0000:00:04.0/net/eth0",
+        "net",
+        "class/net",
+        "INTERFACE=eth0\nIFINDEX=2\n",
+        {"ifindex": "2"},
+    )
+    _add_device(
+        root,
+        "devices/virtual/block/loop0",
+        "block",
+        "class/block",
+        "MAJOR=7\nMINOR=0\nDEVNAME=loop0\nDEVTYPE=disk\n",
+        {"removable": "0"},
+    )
+    _add_device(
+        root,
+        "devices/pci0000:00/0000:00:04.0",
+        "pci",
+        "bus/pci/devices",
+        "DRIVER=virtio-pci\n",
+    )
+    driver = root / "bus/pci/drivers/virtio-pci"
+    driver.mkdir(parents=True)
+    os.symlink(driver, root / "devices/pci0000:00/0000:00:04.0/driver")
+    return root
+
+
+def test_all_devices(context, sysfs):
+    paths = list(SysfsEnumerator(context, str(sysfs)).iter_sys_paths())
+    assert paths == sorted(
+        str(sysfs / p)
+        for p in [
+            "devices/virtual/net/lo",
+            "devices/pci0000:00/0000:00:04.0/net/eth0",
+            "devices/virtual/block/loop0",
+            "devices/pci0000:00/0000:00:04.0",
+        ]
+    )
+
+
+def test_match_subsystem(context, sysfs):
+    enumerator = SysfsEnumerator(context, str(sysfs)).match_subsystem("net")
+    assert [os.path.basename(p) for p in enumerator.iter_sys_paths()] == ["eth0", "lo"]
+    enumerator = SysfsEnumerator(context, str(sysfs)).match_subsystem("net", True)
+    assert [os.path.basename(p) for p in enumerator.iter_sys_paths()] == [
+        "0000:00:04.0",
+        "loop0",
+    ]
+
+
+def test_match_sys_name(context, sysfs):
+    enumerator = SysfsEnumerator(context, str(sysfs)).match_sys_name("e*")
+    assert [os.path.basename(p) for p in enumerator.iter_sys_paths()] == ["eth0"]
+
+
+def test_match_attribute(context, sysfs):
+    enumerator = SysfsEnumerator(context, str(sysfs)).match_attribute("ifindex", 1)
+    assert [os.path.basename(p) for p in enumerator.iter_sys_paths()] == ["lo"]
+    enumerator = SysfsEnumerator(context, str(sysfs)).match_attribute(
+        "ifindex", 1, nomatch=True
+    )
+    assert [os.path.basename(p) for p in enumerator.iter_sys_paths()] == [
+        "0000:00:04.0",
+        "eth0",
+        "loop0",
+    ]
+
+
+def test_block_fallback(context, tmp_path):
+    root = tmp_path / "sys"
+    disk = root / "block" / "sda"
+    (disk / "sda1").mkdir(parents=True)
+    (disk / "sda1" / "partition").write_text("1\n")
+    (disk / "queue").mkdir()
+    paths = list(SysfsEnumerator(context, str(root)).iter_sys_paths())
+    assert paths == [str(disk), str(disk / "sda1")]
+
+
+def test_snapshot(context, sysfs):
+    table = SysfsEnumerator(context, str(sysfs)).snapshot()
+    loop = table.lookup(str(sysfs / "devices/virtual/block/loop0"))
+    assert loop.subsystem == "block"
+    assert loop.device_type == "disk"
+    assert loop.device_number == os.makedev(7, 0)
+    assert loop.device_node == os.path.join(context.device_path, "loop0")
+    pci = table.lookup(str(sysfs / "devices/pci0000:00/0000:00:04.0"))
+    assert pci.driver == "virtio-pci"
+    assert table.properties(table.index_of(pci.sys_path)) == {
+        "DEVPATH": "/devices/pci0000:00/0000:00:04.0",
+        "SUBSYSTEM": "pci",
+        "DRIVER": "virtio-pci",
+    }
+
+
+@pytest.mark.parametrize("subsystem", ["block", "net", "tty"])
+def test_agrees_with_libudev(context, subsystem):
+    assert list(
+        SysfsEnumerator(context).match_subsystem(subsystem).iter_sys_paths()
+    ) == (list(context.list_devices(subsystem=subsystem).iter_sys_paths()))
+
+
+def test_attribute_reader(sysfs):
+    path = sysfs / "devices/virtual/net/lo/ifindex"
+    with SysfsAttributeReader() as reader:
+        assert reader.read(str(path)) == b"1"
+        assert len(reader) == 1
+        # the open file is read again, and sees the new contents
+        path.write_text("42\n")
+        assert reader.read(str(path)) == b"42"
+        assert len(reader) == 1
+    assert len(reader) == 0
+
+
+def test_attribute_reader_large_file(tmp_path):
+    path = tmp_path / "descriptors"
+    path.write_bytes(bytes(range(256)) * 5)
+    with SysfsAttributeReader(size=100) as reader:
+        assert reader.read(str(path)) == bytes(range(256)) * 5
+
+
+def test_attribute_reader_closed_when_dropped(sysfs):
+    reader = SysfsAttributeReader()
+    reader.read(str(sysfs / "devices/virtual/net/lo/ifindex"))
+    fd = next(iter(reader._files.values()))
+    del reader
+    # interpreters without reference counting free the reader later
+    gc.collect()
+    with pytest.raises(OSError):
+        os.fstat(fd)
+
+
+def test_attribute_reader_errors(sysfs):
+    present = str(sysfs / "devices/virtual/net/lo/ifindex")
+    missing = str(sysfs / "devices/virtual/net/lo/mtu")
+    with SysfsAttributeReader() as reader:
+        values = reader.read_many([present, missing])
+        assert values[present] == b"1"
+        assert isinstance(values[missing], FileNotFoundError)
+        assert len(reader) == 1
+
+
+def test_read_many(context):
+    device = next(iter(context.list_devices(subsystem="net")), None)
+    if device is None:
+        pytest.skip("no network device")
+    values = device.attributes.read_many(["ifindex", b"ifindex", "no-such-attribute"])
+    assert values["ifindex"] == device.attributes.get("ifindex")
+    assert values[b"ifindex"] == values["ifindex"]
+    assert isinstance(values["no-such-attribute"], FileNotFoundError)
+    with SysfsAttributeReader() as reader:
+        assert device.attributes.read_many(["ifindex"], reader) == {
+            "ifindex": values["ifindex"]
+        }
+        assert len(reader) == 1
@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2026 pyudev contributors
+
+# This library is free software; you can redistribute it and/or modify it
+# under the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation; either version 2.1 of the License, or (at your
+# option) any later version.
+
+# This library is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE.  See the GNU Lesser General Public License
+# for more details.
+
+# You should have received a copy of the GNU Lesser General Public License
+# along with this library; if not, write to the Free Software Foundation,
+# Inc., 51 Franklin St, Fifth Floor, Boston, MA 02110-1301 USA
+
+
+import pytest
+
+from pyudev import DeviceRow
+from pyudev.device._table import DeviceTableBuilder
+
+
+@pytest.fixture
+def table():
+    builder = DeviceTableBuilder()
+    builder.add(
+        b"/sys/devices/virtual/block/loop0",
+        b"block",
+        b"disk",
+        None,
+        1792,
+        b"/dev/loop0",
+        [(b"DEVTYPE", b"disk"), (b"ID_FS_TYPE", b"ext4")],
+    )
+    builder.add(
+        "/sys/devices/virtual/block/loop0/loop0p1",
+        "block",
+        "partition",
+        None,
+        1793,
+        "/dev/loop0p1",
+        [("DEVTYPE", "partition"), ("PARTN", "1")],
+    )
+    builder.add("/sys/devices/virtual/net/lo", "net")
+    return builder.build()
+
+
+def test_rows(table):
+    assert len(table) == 3
+    assert table[0] == DeviceRow(
+        "/sys/devices/virtual/block/loop0", "block", "disk", None, 1792, "/dev/loop0"
+    )
+    assert table[-1].subsystem == "net"
+    assert table[-1].device_node is None
+
+
+def test_strings_are_shared(table):
+    assert table[0].subsystem is table[1].subsystem
+
+
+def test_column(table):
+    assert table.column("subsystem") == ("block", "block", "net")
+    assert table.column("device_number") == (1792, 1793, 0)
+    with pytest.raises(KeyError):
+        table.column("spam")
+
+
+def test_properties(table):
+    assert table.properties(0) == {"DEVTYPE": "disk", "ID_FS_TYPE": "ext4"}
+    assert table.properties(2) == {}
+
+
+def test_lookup(table):
+    assert table.lookup("/sys/devices/virtual/net/lo") == table[2]
+    with pytest.raises(KeyError):
+        table.lookup("/sys/devices/virtual/net/eth0")
+
+
+def test_filter(table):
+    assert len(table.filter(subsystem="block")) == 2
+    assert len(table.filter(subsystem="block", device_type="partition")) == 1
+    assert len(table.filter(subsystem="tty")) == 0
+    assert len(table.filter(sys_name="lo")) == 1
+    assert table.filter(PARTN=1).column("sys_path") == (
+        "/sys/devices/virtual/block/loop0/loop0p1",
+    )
+
+
+def test_filter_sys_name_with_slash():
+    builder = DeviceTableBuilder()
+    builder.add("/sys/devices/pci0000:00/0000:00:03.0/cciss0/block/cciss!c0d0", "block")
+    table = builder.build()
+    assert len(table.filter(sys_name="cciss/c0d0")) == 1
+    assert len(table.filter(sys_name=b"cciss/c0d0")) == 1
+
+
+def test_filtered_lookup(table):
+    disks = table.filter(device_type="disk")
+    assert disks.index_of("/sys/devices/virtual/block/loop0") == 0
+    assert disks.properties(0) == table.properties(0)
+    with pytest.raises(KeyError):
+        disks.lookup("/sys/devices/virtual/net/lo")
+
+
+def test_slice(table):
+    assert [row.subsystem for row in table[1:]] == ["block", "net"]
@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2026 pyudev contributors
+
+# This library is free software; you can redistribute it and/or modify it
+# under the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation; either version 2.1 of the License, or (at your
+# option) any later version.
+
+# This library is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE.  See the GNU Lesser General Public License
+# for more details.
+
+# You should have received a copy of the GNU Lesser General Public License
+# along with this library; if not, write to the Free Software Foundation,
+# Inc., 51 Franklin St, Fifth Floor, Boston, MA 02110-1301 USA
+
+
+import pytest
+
+from pyudev import Device, DeviceTree
+
+try:
+    from unittest import mock
+except ImportError:
+    import mock
+
+
+def _device(device_path, subsystem=None, device_type=None, action=None, **properties):
+    device = mock.Mock(
+        spec=Device,
+        device_path=device_path,
+        subsystem=subsystem,
+        device_type=device_type,
+        action=action,
+        properties=properties,
+    )
+    # name and parent are arguments of Mock itself
+    device.configure_mock(name=device_path, parent=None)
+    return device
+
+
+_PCI = "/devices/pci0000:00/0000:00:1f.2"
+_HOST = _PCI + "/ata1/host0"
+_DISK = _HOST + "/target0:0:0/0:0:0:0/block/sda"
+
+
+@pytest.fixture
+def tree():
+    devices = [
+        _device("/devices/pci0000:00", "pci"),
+        _device(_PCI, "pci"),
+        _device(_HOST, "scsi", "scsi_host"),
+        _device(_DISK + "1", "block", "partition"),
+        _device(_DISK, "block", "disk"),
+        _device(_DISK + "/sda1", "block", "partition"),
+        _device(_DISK + "/sda2", "block", "partition"),
+        _device("/devices/virtual/net/lo", "net"),
+    ]
+    return DeviceTree(mock.Mock(), devices)
+
+
+def _paths(devices):
+    return [d.device_path for d in devices]
+
+
+def test_hierarchy(tree):
+    assert len(tree) == 8
+    assert _paths(tree.children(_DISK)) == [_DISK + "/sda1", _DISK + "/sda2"]
+    assert tree.parent(_DISK).device_path == _HOST
+    # the parent is the nearest indexed ancestor, not the parent directory
+    assert tree.parent(_DISK + "1").device_path == _HOST
+    assert tree.parent("/devices/virtual/net/lo") is None
+    assert _paths(tree.ancestors(_DISK + "/sda1")) == [
+        _DISK,
+        _HOST,
+        _PCI,
+        "/devices/pci0000:00",
+    ]
+    assert _paths(tree.descendants(_PCI)) == [
+        _HOST,
+        _DISK + "1",
+        _DISK,
+        _DISK + "/sda1",
+        _DISK + "/sda2",
+    ]
+
+
+def test_find_parent(tree):
+    assert tree.find_parent(_DISK + "/sda1", "pci").device_path == _PCI
+    assert tree.find_parent(_DISK + "/sda1", "block", "disk") is tree[_DISK]
+    assert tree.find_parent(_DISK, "block") is None
+
+
+def test_unknown_device(tree):
+    assert "/devices/nothing" not in tree
+    for query in (tree.children, tree.descendants, tree.ancestors, tree.parent):
+        with pytest.raises(KeyError):
+            query("/devices/nothing")
+
+
+def test_update(tree):
+    tree.update(_device(_DISK + "/sda3", "block", "partition", "add"))
+    assert _paths(tree.children(_DISK))[-1] == _DISK + "/sda3"
+    tree.update(_device(_DISK, "block", "disk", "remove"))
+    assert _DISK not in tree
+    assert tree.parent(_DISK + "/sda1").device_path == _HOST
+    # adding a device in between re-parents the devices below it
+    disk = _device(_DISK, "block", "disk", "add")
+    tree.update(disk)
+    assert tree.parent(_DISK + "/sda3") is disk
+    assert _paths(tree.children(_HOST)) == [_DISK + "1", _DISK]
+    changed = _device(_DISK, "block", "disk", "change")
+    tree.update(changed)
+    assert tree[_DISK] is changed
+    assert len(tree.children(_DISK)) == 3
+
+
+def test_move(tree):
+    new_path = "/devices/virtual/net/lo0"
+    tree.update(
+        _device(new_path, "net", action="move", DEVPATH_OLD="/devices/virtual/net/lo")
+    )
+    assert "/devices/virtual/net/lo" not in tree
+    assert new_path in tree
+
+
+def test_agrees_with_libudev(context):
+    tree = DeviceTree(context)
+    for device in context.list_devices():
+        parent = device.parent
+        assert tree.parent(device) == parent
+        if parent is not None:
+            assert device in tree.children(parent)
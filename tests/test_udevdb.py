@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2026 pyudev contributors
+
+# This library is free software; you can redistribute it and/or modify it
+# under the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation; either version 2.1 of the License, or (at your
+# option) any later version.
+
+# This library is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE.  See the GNU Lesser General Public License
+# for more details.
+
+# You should have received a copy of the GNU Lesser General Public License
+# along with this library; if not, write to the Free Software Foundation,
+# Inc., 51 Franklin St, Fifth Floor, Boston, MA 02110-1301 USA
+
+
+import os
+
+import pytest
+
+from pyudev import SysfsEnumerator, UdevDatabase
+from pyudev.udevdb import device_id, parse_record
+
+_DISK_RECORD = b"""S:disk/by-id/ata-Samsung_SSD_860
+S:disk/by-path/pci-0000:00:1f.2-ata-1
+L:0
+I:1838466
+E:ID_MODEL=Samsung_SSD_860
+E:ID_BUS=ata
+E:ID_FS_LABEL=a=b
+G:systemd
+Q:systemd
+V:1
+"""
+
+
+@pytest.fixture
+def database(request, tmp_path):
+    data = tmp_path / "data"
+    data.mkdir()
+    (data / "b8:0").write_bytes(_DISK_RECORD)
+    (data / "n2").write_bytes(b"E:ID_NET_NAME_PATH=enp0s4\nG:systemd\n")
+    (data / "+pci:0000:00:04.0").write_bytes(b"E:ID_VENDOR_FROM_DATABASE=Red Hat\n")
+    (data / "other").write_bytes(b"E:SPAM=eggs\n")
+    return UdevDatabase(request.getfixturevalue("context"), str(data))
+
+
+def test_device_id():
+    assert device_id("block", "sda", os.makedev(8, 0)) == "b8:0"
+    assert device_id("input", "event0", os.makedev(13, 64)) == "c13:64"
+    assert device_id("net", "eth0", 0, 2) == "n2"
+    assert device_id("pci", "0000:00:04.0") == "+pci:0000:00:04.0"
+
+
+def test_parse_record():
+    record = parse_record(_DISK_RECORD)
+    assert record.properties == {
+        "ID_MODEL": "Samsung_SSD_860",
+        "ID_BUS": "ata",
+        "ID_FS_LABEL": "a=b",
+    }
+    assert record.device_links == (
+        "/dev/disk/by-id/ata-Samsung_SSD_860",
+        "/dev/disk/by-path/pci-0000:00:1f.2-ata-1",
+    )
+    assert record.tags == ("systemd",)
+    assert record.usec_initialized == 1838466
+
+
+def test_parse_record_malformed():
+    record = parse_record(b"E:ID_BUS=ata\nI:spam\n")
+    assert record.properties == {"ID_BUS": "ata"}
+    assert record.usec_initialized == 0
+
+
+def test_getitem(database):
+    assert database["n2"].properties == {"ID_NET_NAME_PATH": "enp0s4"}
+    with pytest.raises(KeyError):
+        database["n3"]
+    assert database.get("n3") is None
+
+
+def test_load(database):
+    records = database.load()
+    assert sorted(records) == ["+pci:0000:00:04.0", "b8:0", "n2"]
+    assert records["b8:0"] == database["b8:0"]
+
+
+def test_load_missing_directory(context, tmp_path):
+    assert UdevDatabase(context, str(tmp_path / "missing")).load() == {}
+
+
+def test_snapshot_with_database(context, database, tmp_path):
+    sys_path = tmp_path / "sys" / "devices" / "pci0000:00" / "0000:00:04.0"
+    sys_path.mkdir(parents=True)
+    (sys_path / "uevent").write_text("PCI_ID=1AF4:1000\n")
+    (tmp_path / "sys" / "bus" / "pci" / "devices").mkdir(parents=True)
+    os.symlink(sys_path, tmp_path / "sys" / "bus" / "pci" / "devices" / sys_path.name)
+    table = SysfsEnumerator(context, str(tmp_path / "sys")).snapshot(database)
+    assert table.properties(0) == {
+        "DEVPATH": "/devices/pci0000:00/0000:00:04.0",
+        "SUBSYSTEM": "pci",
+        "PCI_ID": "1AF4:1000",
+        "ID_VENDOR_FROM_DATABASE": "Red Hat",
+    }